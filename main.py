@@ -6,13 +6,13 @@ Simple entry point that imports and runs the game.
 Separated from game logic for better organization.
 """
 
-import argparse
 import sys
-from src.engine.game import run_game
 
 
-def main():
-    """Main entry point with command line argument parsing."""
+def parse_args():
+    """Parse command line arguments (only called when arguments are given)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='2D Minecraft-like World Application',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -29,12 +29,22 @@ Examples:
         help='Enable performance profiling (prints stats every 10 seconds)'
     )
 
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point with command line argument parsing."""
+    # Plain `python main.py` is the common case, so skip argparse entirely
+    if len(sys.argv) > 1:
+        args = parse_args()
+
+        # Enable profiling if requested
+        if args.profiling:
+            import src.profiler
+            src.profiler.ENABLE_PROFILING = True
 
-    # Enable profiling if requested
-    if args.profiling:
-        import src.profiler
-        src.profiler.ENABLE_PROFILING = True
+    # Imported after argument handling so the game sees the profiling setting
+    from src.engine.game import run_game
 
     try:
         run_game()
@@ -2,10 +2,14 @@
 """
 Script to export an entire codebase to a markdown file.
 Recursively walks through directories and includes all code files.
+File bodies are streamed as UTF-8 with LF newlines; files that are not valid
+UTF-8 are transcoded from latin1.
 """
 
 import os
 import argparse
+import codecs
+import functools
 from pathlib import Path
 
 # Common code file extensions
@@ -29,19 +33,13 @@ IGNORE_PATTERNS = {
     '.mypy_cache', '.tox', '.nox', '.eggs', '*.egg-info', '.cache'
 }
 
-def should_ignore(path):
-    """Check if a file or directory should be ignored."""
-    name = os.path.basename(path)
-    
-    # Check against ignore patterns
-    for pattern in IGNORE_PATTERNS:
-        if pattern.startswith('*'):
-            if name.endswith(pattern[1:]):
-                return True
-        elif pattern in name or name == pattern:
-            return True
-    
-    return False
+# Split once so should_ignore is a set lookup plus a single endswith call
+IGNORE_EXACT = frozenset(p for p in IGNORE_PATTERNS if not p.startswith('*'))
+IGNORE_SUFFIXES = tuple(p[1:] for p in IGNORE_PATTERNS if p.startswith('*'))
+
+def should_ignore(name):
+    """Check if a file or directory (given by its basename) should be ignored."""
+    return name in IGNORE_EXACT or name.endswith(IGNORE_SUFFIXES)
 
 def is_code_file(file_path):
     """Check if a file is a code file based on its extension."""
@@ -54,78 +52,147 @@ def is_code_file(file_path):
     
     return ext in CODE_EXTENSIONS
 
+# Extension mappings for markdown code block languages
+_LANG_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'jsx',
+    '.tsx': 'tsx',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.cs': 'csharp',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.clj': 'clojure',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.zsh': 'zsh',
+    '.ps1': 'powershell',
+    '.sql': 'sql',
+    '.r': 'r',
+    '.html': 'html',
+    '.htm': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.sass': 'sass',
+    '.less': 'less',
+    '.xml': 'xml',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.toml': 'toml',
+    '.ini': 'ini',
+    '.cfg': 'ini',
+    '.conf': 'ini',
+    '.md': 'markdown',
+    '.txt': 'text'
+}
+
 def get_language_from_extension(file_path):
     """Get the language identifier for markdown code blocks."""
-    ext = Path(file_path).suffix.lower()
     name = os.path.basename(file_path).lower()
     
     # Special cases
-    if name in ['dockerfile']:
+    if name == 'dockerfile':
         return 'dockerfile'
-    if name in ['makefile']:
+    if name == 'makefile':
         return 'makefile'
     
-    # Extension mappings
-    lang_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'jsx',
-        '.tsx': 'tsx',
-        '.java': 'java',
-        '.cpp': 'cpp',
-        '.c': 'c',
-        '.h': 'c',
-        '.hpp': 'cpp',
-        '.cs': 'csharp',
-        '.php': 'php',
-        '.rb': 'ruby',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.clj': 'clojure',
-        '.sh': 'bash',
-        '.bash': 'bash',
-        '.zsh': 'zsh',
-        '.ps1': 'powershell',
-        '.sql': 'sql',
-        '.r': 'r',
-        '.html': 'html',
-        '.htm': 'html',
-        '.css': 'css',
-        '.scss': 'scss',
-        '.sass': 'sass',
-        '.less': 'less',
-        '.xml': 'xml',
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.toml': 'toml',
-        '.ini': 'ini',
-        '.cfg': 'ini',
-        '.conf': 'ini',
-        '.md': 'markdown',
-        '.txt': 'text'
-    }
-    
-    return lang_map.get(ext, 'text')
+    return _language_for_suffix(Path(file_path).suffix.lower())
 
-def read_file_safely(file_path):
-    """Safely read a file, handling various encodings."""
-    encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-    
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
-        except UnicodeDecodeError:
+@functools.lru_cache(maxsize=256)
+def _language_for_suffix(ext):
+    """Resolve a language from a lowercased file suffix (memoized per suffix)."""
+    return _LANG_MAP.get(ext, 'text')
+
+STREAM_CHUNK_SIZE = 64 * 1024
+# Tried in order; latin1 decodes any byte sequence, so it is the last resort
+STREAM_ENCODINGS = ('utf-8-sig', 'latin1')
+
+def _stream_decoded(src, md_file, encoding):
+    """
+    Decode src chunk by chunk, normalize newlines to LF, and write UTF-8.
+
+    A trailing CR is held back until the next chunk so a CRLF split across a
+    chunk boundary still collapses to a single LF.
+
+    Returns:
+        The last byte written, or b'' if nothing was written
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    last_byte = b''
+    pending_cr = ''
+    while True:
+        buf = src.read(STREAM_CHUNK_SIZE)
+        text = pending_cr + decoder.decode(buf, final=not buf)
+        pending_cr = ''
+        if buf and text.endswith('\r'):
+            text, pending_cr = text[:-1], '\r'
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if text:
+            data = text.encode('utf-8')
+            md_file.write(data)
+            last_byte = data[-1:]
+        if not buf:
+            return last_byte
+
+def stream_file_body(file_path, md_file):
+    """
+    Copy a file's text into the binary markdown output in fixed-size chunks.
+
+    The file is decoded as UTF-8 (dropping a BOM); if that fails partway, the
+    output written for it is truncated and the file is re-streamed as latin1.
+    Either way the body is written as UTF-8 with LF newlines, and memory use
+    is capped at STREAM_CHUNK_SIZE regardless of the file size.
+
+    Returns:
+        The last byte written, or b'' if nothing was written
+    """
+    body_start = md_file.tell()
+    try:
+        with open(file_path, 'rb') as src:
+            for encoding in STREAM_ENCODINGS:
+                try:
+                    return _stream_decoded(src, md_file, encoding)
+                except UnicodeDecodeError:
+                    src.seek(0)
+                    md_file.seek(body_start)
+                    md_file.truncate()
+    except OSError as e:
+        message = f"Error reading file: {str(e)}".encode('utf-8')
+        md_file.write(message)
+        return message[-1:]
+
+def iter_code_files(root):
+    """
+    Yield DirEntry objects for code files under root, in sorted order.
+
+    Uses os.scandir so the is_dir()/stat() results come from the directory
+    read itself instead of separate stat calls per file.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    subdirs = []
+    for entry in entries:
+        if should_ignore(entry.name):
             continue
-        except Exception as e:
-            return f"Error reading file: {str(e)}"
-    
-    return "Unable to decode file with common encodings"
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry)
+        elif is_code_file(entry.name):
+            yield entry
+
+    for entry in subdirs:
+        yield from iter_code_files(entry.path)
 
 def export_codebase(root_dir, output_file, max_file_size=50000):
     """Export codebase to markdown file."""
@@ -133,60 +200,46 @@ def export_codebase(root_dir, output_file, max_file_size=50000):
     files_processed = 0
     files_skipped = 0
     
-    with open(output_file, 'w', encoding='utf-8') as md_file:
+    with open(output_file, 'wb') as md_file:
         # Write header
-        md_file.write(f"# Codebase Export: {root_path.name}\n\n")
-        md_file.write(f"Generated from: `{root_path}`\n\n")
-        md_file.write("---\n\n")
+        md_file.write(
+            f"# Codebase Export: {root_path.name}\n\n"
+            f"Generated from: `{root_path}`\n\n"
+            "---\n\n".encode('utf-8')
+        )
         
-        # Walk through directory tree
-        for root, dirs, files in os.walk(root_path):
-            # Remove ignored directories from dirs list to prevent traversal
-            dirs[:] = [d for d in dirs if not should_ignore(os.path.join(root, d))]
+        for entry in iter_code_files(root_path):
+            file_path = entry.path
             
-            for file in sorted(files):
-                file_path = os.path.join(root, file)
-                
-                # Skip ignored files
-                if should_ignore(file_path):
-                    continue
-                
-                # Only process code files
-                if not is_code_file(file_path):
-                    continue
-                
-                # Get relative path from root directory
-                rel_path = os.path.relpath(file_path, root_path)
-                
-                # Check file size
-                try:
-                    file_size = os.path.getsize(file_path)
-                    if file_size > max_file_size:
-                        md_file.write(f"## {rel_path}\n\n")
-                        md_file.write(f"*File too large ({file_size} bytes) - skipped*\n\n")
-                        files_skipped += 1
-                        continue
-                except OSError:
+            # Get relative path from root directory
+            rel_path = os.path.relpath(file_path, root_path)
+            
+            # Check file size
+            try:
+                file_size = entry.stat().st_size  # Follows symlinks: the target is what gets read
+                if file_size > max_file_size:
+                    md_file.write(f"## {rel_path}\n\n*File too large ({file_size} bytes) - skipped*\n\n".encode('utf-8'))
+                    files_skipped += 1
                     continue
-                
-                # Read and write file content
-                content = read_file_safely(file_path)
-                language = get_language_from_extension(file_path)
-                
-                md_file.write(f"## {rel_path}\n\n")
-                md_file.write(f"```{language}\n")
-                md_file.write(content)
-                if not content.endswith('\n'):
-                    md_file.write('\n')
-                md_file.write("```\n\n")
-                
-                files_processed += 1
+            except OSError:
+                continue
+            
+            # Stream file content between the code fences
+            language = get_language_from_extension(file_path)
+            
+            md_file.write(f"## {rel_path}\n\n```{language}\n".encode('utf-8'))
+            last_byte = stream_file_body(file_path, md_file)
+            md_file.write(b"```\n\n" if last_byte == b'\n' else b"\n```\n\n")
+            
+            files_processed += 1
         
         # Write summary
-        md_file.write("---\n\n")
-        md_file.write(f"**Export Summary:**\n")
-        md_file.write(f"- Files processed: {files_processed}\n")
-        md_file.write(f"- Files skipped: {files_skipped}\n")
+        md_file.write(
+            "---\n\n"
+            "**Export Summary:**\n"
+            f"- Files processed: {files_processed}\n"
+            f"- Files skipped: {files_skipped}\n".encode('utf-8')
+        )
     
     return files_processed, files_skipped
 
@@ -1,12 +1,78 @@
 #!/usr/bin/env python3
 """
-Runner script for the TCOD application with hot reloading using watchmedo.
+Runner script for the TCOD application with hot reloading using watchdog.
 
-This script uses watchdog's watchmedo to restart the application when files change.
-Watches both main.py and game.py for changes.
+Watches the project for .py file changes with an in-process watchdog observer
+and restarts the game process directly with the current interpreter, without
+going through `uv run` and `watchmedo`.
 """
 
+import os
 import subprocess
+import sys
+import threading
+
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_COMMAND = [sys.executable, os.path.join(PROJECT_ROOT, "main.py")]
+RESTART_DEBOUNCE_SECONDS = 0.2  # Editors often emit several events per save
+
+
+class ReloadHandler(PatternMatchingEventHandler):
+    """Flags a restart whenever a watched Python file changes."""
+
+    def __init__(self, changed: threading.Event):
+        super().__init__(patterns=["*.py"], ignore_directories=True)
+        self.changed = changed
+
+    def on_any_event(self, event):
+        if event.event_type in ("modified", "created", "moved", "deleted"):
+            self.changed.set()
+
+
+def start_game() -> subprocess.Popen:
+    """Launch the game as a child process of this interpreter."""
+    return subprocess.Popen(GAME_COMMAND, cwd=PROJECT_ROOT)
+
+
+def stop_game(process: subprocess.Popen):
+    """Stop the game process, killing it if it does not exit promptly."""
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def run():
+    """Run the game and restart it whenever a source file changes."""
+    changed = threading.Event()
+    observer = Observer()
+    observer.schedule(ReloadHandler(changed), PROJECT_ROOT, recursive=True)
+    observer.start()
+
+    process = start_game()
+    try:
+        while True:
+            if not changed.wait(timeout=0.5):
+                continue
+
+            # Let a burst of save events settle before restarting
+            while changed.wait(timeout=RESTART_DEBOUNCE_SECONDS):
+                changed.clear()
+
+            print("Change detected - restarting game...")
+            stop_game(process)
+            process = start_game()
+    finally:
+        stop_game(process)
+        observer.stop()
+        observer.join()
+
 
 if __name__ == "__main__":
     print("Starting 2D Minecraft world with file watching hot reload...")
@@ -15,17 +81,7 @@ if __name__ == "__main__":
     print("-" * 70)
 
     try:
-        # Use watchmedo to watch for changes and restart the application
-        # Watch the current directory for .py file changes
-        cmd = [
-            "uv", "run", "watchmedo", "auto-restart",
-            "--directory=.",
-            "--pattern=*.py",
-            "--recursive",
-            "--", "python", "main.py"
-        ]
-
-        subprocess.run(cmd)
+        run()
     except KeyboardInterrupt:
         print("\nFile watcher stopped by user.")
     except Exception as e:
@@ -6,9 +6,29 @@ A tile-based world generation and rendering system using python-tcod.
 
 __version__ = "0.1.0"
 
-from .render.render import GameRenderer, WorldRenderer, EffectRenderer
-from .world import WorldManager, Tile, TierManager
-from .ui import StatusDisplay
+from importlib import import_module
+
+# Public names resolved lazily (PEP 562) so importing the package does not pull
+# in tcod and the world system until one of them is actually used.
+_LAZY_IMPORTS = {
+    "GameRenderer": ".render.render",
+    "WorldRenderer": ".render.render",
+    "EffectRenderer": ".render.render",
+    "WorldManager": ".world",
+    "Tile": ".world",
+    "TierManager": ".world",
+    "StatusDisplay": ".ui",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "GameRenderer", "WorldRenderer", "EffectRenderer",
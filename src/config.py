@@ -3,26 +3,85 @@
 Configuration system for the 2D Minecraft-like world
 
 Handles loading application settings from TOML configuration files.
+Parsing uses the standard library's tomllib; the file is parsed once and
+cached, so no alternative TOML parser is needed.
 """
 
+import functools
 import os
+import tomllib
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, Any, Tuple
-from dataclasses import dataclass
-
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Fallback for older Python versions
-
-
-@dataclass
+from dataclasses import dataclass, fields
+from operator import itemgetter
+
+
+# Required keys of each configuration section, validated in one pass before parsing
+REQUIRED_CONFIG_KEYS: Dict[str, Tuple[str, ...]] = {
+    'application': ('title', 'version'),
+    'window': ('initial_width', 'initial_height', 'vsync'),
+    'world': ('pipeline_layers', 'center_x', 'center_y', 'radius', 'generator_type', 'seed', 'chunk_size',
+              'render_distance', 'chunk_cache_limit', 'chunk_unload_distance', 'chunk_request_batch_size'),
+    'camera': ('initial_x', 'initial_y', 'move_speed', 'fast_move_speed'),
+    'debug': ('show_debug_on_startup', 'show_coordinates_on_startup', 'show_fps_on_startup'),
+    'rendering': ('seamless_blocks_enabled', 'clear_color'),
+    'ui': ('panel_background', 'border_color', 'info_color', 'warning_color', 'debug_color',
+           'top_panel_max_lines', 'bottom_panel_max_lines', 'panel_margin'),
+}
+_REQUIRED_CONFIG_KEY_SETS = {section: frozenset(keys) for section, keys in REQUIRED_CONFIG_KEYS.items()}
+
+# Check required sections and keys before parsing. Set COVENANT_CONFIG_STRICT=0 for
+# release builds whose config was already checked; a missing key then still fails
+# while parsing, only with a less descriptive error
+CONFIG_STRICT = os.environ.get("COVENANT_CONFIG_STRICT", "1") == "1"
+
+# Number of parsed configuration files kept, keyed by path, modification time and size
+PARSED_CONFIG_CACHE_SIZE = 4
+
+# Color tuples seen in any parsed config, so reloads reuse the same objects
+_TUPLE_INTERN: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+
+def _intern_tuple(values) -> Tuple[Any, ...]:
+    """Return a shared tuple equal to values."""
+    values = tuple(values)
+    return _TUPLE_INTERN.setdefault(values, values)
+
+
+def validate_config_data(config_data: Dict[str, Any]):
+    """
+    Check that every required section and key is present in raw configuration data.
+
+    Args:
+        config_data: Parsed TOML data
+
+    Raises:
+        KeyError: Naming every missing section, or every missing key of the first
+            incomplete section
+    """
+    missing_sections = [section for section in REQUIRED_CONFIG_KEYS if section not in config_data]
+    if missing_sections:
+        names = ", ".join(f"'{section}'" for section in missing_sections)
+        raise KeyError(f"❌ Missing required {names} section in configuration")
+
+    for section, required_keys in _REQUIRED_CONFIG_KEY_SETS.items():
+        section_data = config_data[section]
+        if required_keys <= section_data.keys():
+            continue
+        missing_keys = [key for key in REQUIRED_CONFIG_KEYS[section] if key not in section_data]
+        names = ", ".join(f"'{section}.{key}'" for key in missing_keys)
+        raise KeyError(f"❌ Missing required {names} in configuration")
+
+
+@dataclass(frozen=True, slots=True)
 class ApplicationConfig:
     """Application-level configuration."""
     title: str
     version: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowConfig:
     """Window and display configuration."""
     initial_width: int
@@ -30,7 +89,7 @@ class WindowConfig:
     vsync: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorldConfig:
     """World generation configuration."""
     center_x: int
@@ -45,9 +104,10 @@ class WorldConfig:
     render_distance: int
     chunk_cache_limit: int
     chunk_unload_distance: int
+    chunk_request_batch_size: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CameraConfig:
     """Camera and viewport configuration."""
     initial_x: int
@@ -56,7 +116,7 @@ class CameraConfig:
     fast_move_speed: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DebugConfig:
     """Debug display configuration."""
     show_debug_on_startup: bool
@@ -64,14 +124,14 @@ class DebugConfig:
     show_fps_on_startup: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RenderingConfig:
     """Rendering system configuration."""
     seamless_blocks_enabled: bool
     clear_color: Tuple[int, int, int]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UIConfig:
     """User interface configuration."""
     panel_background: Tuple[int, int, int]
@@ -84,7 +144,7 @@ class UIConfig:
     panel_margin: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameConfig:
     """Complete game configuration."""
     application: ApplicationConfig
@@ -96,67 +156,78 @@ class GameConfig:
     ui: UIConfig
 
 
+def _field_getter(config_class) -> itemgetter:
+    """Build an itemgetter returning a section's values in the dataclass field order."""
+    return itemgetter(*(field.name for field in fields(config_class)))
+
+
+# Fetch all values of a section in one C call, ready for positional construction
+_APPLICATION_VALUES = _field_getter(ApplicationConfig)
+_WINDOW_VALUES = _field_getter(WindowConfig)
+_CAMERA_VALUES = _field_getter(CameraConfig)
+_DEBUG_VALUES = _field_getter(DebugConfig)
+_RENDERING_VALUES = _field_getter(RenderingConfig)
+_UI_VALUES = _field_getter(UIConfig)
+
+
 class ConfigLoader:
     """Loads and manages game configuration."""
     
+    # Shared by all loaders so reloading an unchanged file returns the parsed config
+    _parsed_configs: OrderedDict = OrderedDict()
+    
     def __init__(self, config_file: str = "config/config.toml"):
         self.config_file = config_file
         self.config = self.load_config()
     
     def load_config(self) -> GameConfig:
-        """Load configuration from TOML file - fails if missing or invalid."""
-        if not os.path.exists(self.config_file):
-            raise FileNotFoundError(f"❌ Configuration file not found: {self.config_file}")
+        """
+        Load configuration from TOML file - fails if missing or invalid.
+
+        A file whose modification time and size are unchanged since it was last
+        parsed is not read again; the previously parsed config is returned.
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"❌ Configuration file not found: {self.config_file}") from None
+
+        cache_key = (os.path.abspath(self.config_file), stat.st_mtime_ns, stat.st_size)
+        parsed_configs = ConfigLoader._parsed_configs
+        config = parsed_configs.get(cache_key)
+        if config is not None:
+            parsed_configs.move_to_end(cache_key)
+            return config
 
         try:
-            with open(self.config_file, 'rb') as f:
-                config_data = tomllib.load(f)
+            # The file is small: read it with one call and parse from memory
+            config_data = tomllib.loads(Path(self.config_file).read_bytes().decode('utf-8'))
 
-            return self._parse_config(config_data)
+            config = self._parse_config(config_data)
 
         except Exception as e:
             raise RuntimeError(f"❌ Failed to load configuration from {self.config_file}: {e}")
+
+        parsed_configs[cache_key] = config
+        if len(parsed_configs) > PARSED_CONFIG_CACHE_SIZE:
+            parsed_configs.popitem(last=False)
+        return config
     
     def _parse_config(self, config_data: Dict[str, Any]) -> GameConfig:
         """Parse configuration data into structured config objects."""
+        if CONFIG_STRICT:
+            validate_config_data(config_data)
 
         # Application config - required
-        if 'application' not in config_data:
-            raise KeyError("❌ Missing required 'application' section in configuration")
-        app_data = config_data['application']
-        if 'title' not in app_data:
-            raise KeyError("❌ Missing required 'application.title' in configuration")
-        if 'version' not in app_data:
-            raise KeyError("❌ Missing required 'application.version' in configuration")
-        application = ApplicationConfig(
-            title=app_data['title'],
-            version=app_data['version']
-        )
+        application = ApplicationConfig(*_APPLICATION_VALUES(config_data['application']))
 
         # Window config - required
-        if 'window' not in config_data:
-            raise KeyError("❌ Missing required 'window' section in configuration")
-        window_data = config_data['window']
-        if 'initial_width' not in window_data:
-            raise KeyError("❌ Missing required 'window.initial_width' in configuration")
-        if 'initial_height' not in window_data:
-            raise KeyError("❌ Missing required 'window.initial_height' in configuration")
-        if 'vsync' not in window_data:
-            raise KeyError("❌ Missing required 'window.vsync' in configuration")
-        window = WindowConfig(
-            initial_width=window_data['initial_width'],
-            initial_height=window_data['initial_height'],
-            vsync=window_data['vsync']
-        )
+        window = WindowConfig(*_WINDOW_VALUES(config_data['window']))
 
         # World config - required
-        if 'world' not in config_data:
-            raise KeyError("❌ Missing required 'world' section in configuration")
         world_data = config_data['world']
 
         # Extract pipeline layers and layer configs - required
-        if 'pipeline_layers' not in world_data:
-            raise KeyError("❌ Missing required 'world.pipeline_layers' in configuration")
         pipeline_layers = world_data['pipeline_layers']
         if not pipeline_layers:
             raise ValueError("❌ 'world.pipeline_layers' cannot be empty")
@@ -168,12 +239,6 @@ class ConfigLoader:
                 raise KeyError(f"❌ Missing required configuration for layer '{layer_name}' in world config")
             layer_configs[layer_name] = world_data[layer_name]
 
-        # World config validation
-        required_world_keys = ['center_x', 'center_y', 'radius', 'generator_type', 'seed', 'chunk_size', 'render_distance', 'chunk_cache_limit', 'chunk_unload_distance']
-        for key in required_world_keys:
-            if key not in world_data:
-                raise KeyError(f"❌ Missing required 'world.{key}' in configuration")
-
         world = WorldConfig(
             center_x=world_data['center_x'],
             center_y=world_data['center_y'],
@@ -185,68 +250,32 @@ class ConfigLoader:
             layer_configs=layer_configs,
             render_distance=world_data['render_distance'],
             chunk_cache_limit=world_data['chunk_cache_limit'],
-            chunk_unload_distance=world_data['chunk_unload_distance']
+            chunk_unload_distance=world_data['chunk_unload_distance'],
+            chunk_request_batch_size=world_data['chunk_request_batch_size']
         )
 
         # Camera config - required
-        if 'camera' not in config_data:
-            raise KeyError("❌ Missing required 'camera' section in configuration")
-        camera_data = config_data['camera']
-        required_camera_keys = ['initial_x', 'initial_y', 'move_speed', 'fast_move_speed']
-        for key in required_camera_keys:
-            if key not in camera_data:
-                raise KeyError(f"❌ Missing required 'camera.{key}' in configuration")
-        camera = CameraConfig(
-            initial_x=camera_data['initial_x'],
-            initial_y=camera_data['initial_y'],
-            move_speed=camera_data['move_speed'],
-            fast_move_speed=camera_data['fast_move_speed']
-        )
+        camera = CameraConfig(*_CAMERA_VALUES(config_data['camera']))
         
         # Debug config - required
-        if 'debug' not in config_data:
-            raise KeyError("❌ Missing required 'debug' section in configuration")
-        debug_data = config_data['debug']
-        required_debug_keys = ['show_debug_on_startup', 'show_coordinates_on_startup', 'show_fps_on_startup']
-        for key in required_debug_keys:
-            if key not in debug_data:
-                raise KeyError(f"❌ Missing required 'debug.{key}' in configuration")
-        debug = DebugConfig(
-            show_debug_on_startup=debug_data['show_debug_on_startup'],
-            show_coordinates_on_startup=debug_data['show_coordinates_on_startup'],
-            show_fps_on_startup=debug_data['show_fps_on_startup']
-        )
+        debug = DebugConfig(*_DEBUG_VALUES(config_data['debug']))
         
         # Rendering config - required
-        if 'rendering' not in config_data:
-            raise KeyError("❌ Missing required 'rendering' section in configuration")
-        rendering_data = config_data['rendering']
-        required_rendering_keys = ['seamless_blocks_enabled', 'clear_color']
-        for key in required_rendering_keys:
-            if key not in rendering_data:
-                raise KeyError(f"❌ Missing required 'rendering.{key}' in configuration")
-        rendering = RenderingConfig(
-            seamless_blocks_enabled=rendering_data['seamless_blocks_enabled'],
-            clear_color=tuple(rendering_data['clear_color'])
-        )
+        seamless_blocks_enabled, clear_color = _RENDERING_VALUES(config_data['rendering'])
+        rendering = RenderingConfig(seamless_blocks_enabled, _intern_tuple(clear_color))
         
         # UI config - required
-        if 'ui' not in config_data:
-            raise KeyError("❌ Missing required 'ui' section in configuration")
-        ui_data = config_data['ui']
-        required_ui_keys = ['panel_background', 'border_color', 'info_color', 'warning_color', 'debug_color', 'top_panel_max_lines', 'bottom_panel_max_lines', 'panel_margin']
-        for key in required_ui_keys:
-            if key not in ui_data:
-                raise KeyError(f"❌ Missing required 'ui.{key}' in configuration")
+        (panel_background, border_color, info_color, warning_color, debug_color,
+         top_panel_max_lines, bottom_panel_max_lines, panel_margin) = _UI_VALUES(config_data['ui'])
         ui = UIConfig(
-            panel_background=tuple(ui_data['panel_background']),
-            border_color=tuple(ui_data['border_color']),
-            info_color=tuple(ui_data['info_color']),
-            warning_color=tuple(ui_data['warning_color']),
-            debug_color=tuple(ui_data['debug_color']),
-            top_panel_max_lines=ui_data['top_panel_max_lines'],
-            bottom_panel_max_lines=ui_data['bottom_panel_max_lines'],
-            panel_margin=ui_data['panel_margin']
+            panel_background=_intern_tuple(panel_background),
+            border_color=_intern_tuple(border_color),
+            info_color=_intern_tuple(info_color),
+            warning_color=_intern_tuple(warning_color),
+            debug_color=_intern_tuple(debug_color),
+            top_panel_max_lines=top_panel_max_lines,
+            bottom_panel_max_lines=bottom_panel_max_lines,
+            panel_margin=panel_margin
         )
         
         return GameConfig(
@@ -270,23 +299,15 @@ class ConfigLoader:
         return self.config
 
 
-# Global configuration instance
-_config_loader = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> GameConfig:
-    """Get the global configuration instance."""
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ConfigLoader()
-    return _config_loader.get_config()
+    """Get the global configuration instance (loaded once and cached)."""
+    return ConfigLoader().get_config()
 
 
 def reload_config():
-    """Reload the global configuration."""
-    global _config_loader
-    if _config_loader is not None:
-        _config_loader.reload_config()
+    """Reload the global configuration on the next get_config() call."""
+    get_config.cache_clear()
 
 
 # Example usage and testing
@@ -6,10 +6,45 @@ Handles camera position tracking, movement, and viewport calculations.
 The camera represents the player's view into the infinite world.
 """
 
-from typing import Tuple
+from typing import NamedTuple, Tuple
+
 from ..config import CameraConfig
 
 
+# Unit cursor offsets for each movement direction
+MOVE_DIRECTIONS = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+
+class ViewTransform(NamedTuple):
+    """
+    Camera view for one screen size, computed once per frame.
+
+    The half screen dimensions and visible world bounds are precomputed, so
+    per-tile conversions are a single subtraction or addition.
+    """
+    cursor_x: int
+    cursor_y: int
+    half_width: int
+    half_height: int
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+
+    def world_to_screen(self, world_x: int, world_y: int) -> Tuple[int, int]:
+        """Convert world coordinates to screen coordinates."""
+        return world_x - self.min_x, world_y - self.min_y
+
+    def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
+        """Convert screen coordinates to world coordinates."""
+        return self.min_x + screen_x, self.min_y + screen_y
+
+
 class Camera:
     """
     Camera system for navigating the infinite world.
@@ -19,6 +54,9 @@ class Camera:
     appear to move underneath the cursor.
     """
     
+    __slots__ = ('config', 'cursor_x', 'cursor_y', '_cursor_position', 'move_speed', 'fast_move_speed',
+                 '_move_deltas')
+    
     def __init__(self, config: CameraConfig):
         """
         Initialize the camera with configuration.
@@ -28,22 +66,32 @@ class Camera:
         """
         self.config = config
         
-        # Current camera position (world coordinates)
+        # Current camera position (world coordinates). Move the cursor through
+        # set_cursor_position or move_by so the cached position tuple stays current
         self.cursor_x = config.initial_x
         self.cursor_y = config.initial_y
+        self._cursor_position = (self.cursor_x, self.cursor_y)
         
         # Movement state
         self.move_speed = config.move_speed
         self.fast_move_speed = config.fast_move_speed
+        
+        # Speed-scaled offsets per (direction, fast_mode), so a move is one lookup
+        self._move_deltas = {
+            (direction, fast_mode): (dx * speed, dy * speed)
+            for direction, (dx, dy) in MOVE_DIRECTIONS.items()
+            for fast_mode, speed in ((False, self.move_speed), (True, self.fast_move_speed))
+        }
     
     def get_cursor_position(self) -> Tuple[int, int]:
         """
         Get the current cursor position in world coordinates.
         
         Returns:
-            Tuple of (world_x, world_y) for the cursor position
+            Tuple of (world_x, world_y) for the cursor position, shared until
+            the cursor moves
         """
-        return self.cursor_x, self.cursor_y
+        return self._cursor_position
     
     def set_cursor_position(self, world_x: int, world_y: int):
         """
@@ -55,35 +103,32 @@ class Camera:
         """
         self.cursor_x = world_x
         self.cursor_y = world_y
+        self._cursor_position = (world_x, world_y)
     
-    def move_cursor(self, dx: int, dy: int, fast_mode: bool = False):
+    def move_by(self, dx: int, dy: int):
         """
-        Move the cursor by the specified offset.
+        Move the cursor by an offset in world tiles.
         
         Args:
             dx: Change in X position
             dy: Change in Y position
-            fast_mode: Whether to use fast movement speed
         """
-        speed = self.fast_move_speed if fast_mode else self.move_speed
-        self.cursor_x += dx * speed
-        self.cursor_y += dy * speed
-    
-    def move_up(self, fast_mode: bool = False):
-        """Move cursor up (negative Y direction)."""
-        self.move_cursor(0, -1, fast_mode)
-    
-    def move_down(self, fast_mode: bool = False):
-        """Move cursor down (positive Y direction)."""
-        self.move_cursor(0, 1, fast_mode)
-    
-    def move_left(self, fast_mode: bool = False):
-        """Move cursor left (negative X direction)."""
-        self.move_cursor(-1, 0, fast_mode)
+        self.cursor_x += dx
+        self.cursor_y += dy
+        self._cursor_position = (self.cursor_x, self.cursor_y)
     
-    def move_right(self, fast_mode: bool = False):
-        """Move cursor right (positive X direction)."""
-        self.move_cursor(1, 0, fast_mode)
+    def get_move_delta(self, direction: str, fast_mode: bool = False) -> Tuple[int, int]:
+        """
+        Get the cursor offset of one step in a direction.
+        
+        Args:
+            direction: One of the MOVE_DIRECTIONS keys ("up", "down", "left", "right")
+            fast_mode: Whether to use fast movement speed
+            
+        Returns:
+            Tuple of (dx, dy) scaled by the movement speed
+        """
+        return self._move_deltas[direction, fast_mode]
     
     def get_view_bounds(self, screen_width: int, screen_height: int) -> Tuple[int, int, int, int]:
         """
@@ -96,8 +141,8 @@ class Camera:
         Returns:
             Tuple of (min_x, min_y, max_x, max_y) in world coordinates
         """
-        half_width = screen_width // 2
-        half_height = screen_height // 2
+        half_width = screen_width >> 1
+        half_height = screen_height >> 1
         
         min_x = self.cursor_x - half_width
         min_y = self.cursor_y - half_height
@@ -106,6 +151,25 @@ class Camera:
         
         return min_x, min_y, max_x, max_y
     
+    def make_view(self, screen_width: int, screen_height: int) -> ViewTransform:
+        """
+        Precompute the view transform for a screen size at the current position.
+        
+        Args:
+            screen_width: Width of the screen in tiles
+            screen_height: Height of the screen in tiles
+            
+        Returns:
+            ViewTransform valid until the cursor moves or the screen is resized
+        """
+        half_width = screen_width >> 1
+        half_height = screen_height >> 1
+        return ViewTransform(
+            self.cursor_x, self.cursor_y, half_width, half_height,
+            self.cursor_x - half_width, self.cursor_y - half_height,
+            self.cursor_x + half_width, self.cursor_y + half_height
+        )
+    
     def world_to_screen(self, world_x: int, world_y: int, screen_width: int, screen_height: int) -> Tuple[int, int]:
         """
         Convert world coordinates to screen coordinates.
@@ -119,8 +183,8 @@ class Camera:
         Returns:
             Tuple of (screen_x, screen_y)
         """
-        half_width = screen_width // 2
-        half_height = screen_height // 2
+        half_width = screen_width >> 1
+        half_height = screen_height >> 1
         
         screen_x = (world_x - self.cursor_x) + half_width
         screen_y = (world_y - self.cursor_y) + half_height
@@ -140,8 +204,8 @@ class Camera:
         Returns:
             Tuple of (world_x, world_y)
         """
-        half_width = screen_width // 2
-        half_height = screen_height // 2
+        half_width = screen_width >> 1
+        half_height = screen_height >> 1
         
         world_x = self.cursor_x + (screen_x - half_width)
         world_y = self.cursor_y + (screen_y - half_height)
@@ -161,8 +225,11 @@ class Camera:
         Returns:
             True if the position is visible on screen
         """
-        screen_x, screen_y = self.world_to_screen(world_x, world_y, screen_width, screen_height)
-        return 0 <= screen_x < screen_width and 0 <= screen_y < screen_height
+        # Inline world_to_screen to avoid building a tuple; OR-ing the two offsets
+        # is negative exactly when either one is, folding both lower bound checks
+        screen_x = world_x - self.cursor_x + (screen_width >> 1)
+        screen_y = world_y - self.cursor_y + (screen_height >> 1)
+        return (screen_x | screen_y) >= 0 and screen_x < screen_width and screen_y < screen_height
     
     def get_cursor_info(self) -> dict:
         """
@@ -191,10 +258,10 @@ if __name__ == "__main__":
     print(f"Initial position: {camera.get_cursor_position()}")
     
     # Test movement
-    camera.move_right()
+    camera.move_by(*camera.get_move_delta("right"))
     print(f"After moving right: {camera.get_cursor_position()}")
     
-    camera.move_up(fast_mode=True)
+    camera.move_by(*camera.get_move_delta("up", fast_mode=True))
     print(f"After fast move up: {camera.get_cursor_position()}")
     
     # Test coordinate conversion
@@ -3,18 +3,20 @@
 Game logic for 2D Minecraft-like World
 
 Contains the core game state, rendering, and input handling logic.
-Renders a tile-based world with pipeline generation.
+Renders a tile-based world with pipeline generation. All state lives on a
+Game instance created by run_game, so importing this module starts nothing.
 """
 
 import time
 import tcod
 from ..render.render import GameRenderer
-from ..config import get_config, WorldConfig
+from ..config import get_config
 from .camera import Camera
 from .input import InputHandler
 from ..world import WorldManager
 try:
-    from ..profiler import profile_function, start_profiling, end_profiling, print_profiling_stats
+    from ..profiler import (profile_function, start_profiling, end_profiling, print_profiling_stats,
+                            is_profiling_enabled)
 except ImportError:
     # Fallback for when profiler is not available
     def profile_function(name=None):
@@ -24,195 +26,226 @@ except ImportError:
     def start_profiling(name): pass
     def end_profiling(name): pass
     def print_profiling_stats(n): pass
+    def is_profiling_enabled(): return False
 
-# Game state
-_config = get_config()
-_renderer = GameRenderer()
-
-# Initialize camera and world manager
-_camera = Camera(_config.camera)
-_world_manager = WorldManager(_config.world)
-_input_handler = InputHandler(_camera)
-
-# Set up input handler callbacks
-def _regenerate_world():
-    """Callback for world regeneration."""
-    # TODO: Implement world regeneration
-    _renderer.add_effect('sparkle', *_camera.get_cursor_position(), 30, color=(255, 255, 0))
-
-def _toggle_debug():
-    """Callback for debug toggle."""
-    status_display = _renderer.get_status_display()
-    status_display.toggle_debug()
-
-
-def _toggle_coordinates():
-    """Callback for coordinates toggle."""
-    status_display = _renderer.get_status_display()
-    status_display.toggle_coordinates()
-    print(f"Coordinate display: {'ON' if status_display.show_coordinates else 'OFF'}")
-
-def _toggle_fps():
-    """Callback for FPS toggle."""
-    status_display = _renderer.get_status_display()
-    status_display.toggle_fps()
-    print(f"FPS display: {'ON' if status_display.show_fps else 'OFF'}")
-
-def _toggle_chunk_debug():
-    """Callback for chunk debug toggle."""
-    status_display = _renderer.get_status_display()
-    status_display.toggle_chunk_debug()
-    print(f"Chunk debug: {'ON' if status_display.show_chunk_debug else 'OFF'}")
-
-_input_handler.set_regenerate_callback(_regenerate_world)
-_input_handler.set_debug_callbacks(
-    toggle_debug=_toggle_debug,
-    toggle_coordinates=_toggle_coordinates,
-    toggle_fps=_toggle_fps,
-    toggle_chunk_debug=_toggle_chunk_debug
-)
-
-
-@profile_function("game.render_frame")
-def render_frame(console):
-    """Render a single frame of the game."""
-    global _world_manager, _camera, _renderer
-
-    # Process completed chunks from worker for non-blocking tile access
-    start_profiling("world.process_messages")
-    _world_manager.process_worker_messages()
-    end_profiling("world.process_messages")
-
-    # Get current console dimensions (these change with window resize)
-    screen_width = console.width
-    screen_height = console.height
-
-    # Update world chunks based on camera position and screen viewport
-    start_profiling("world.update_chunks")
-    _world_manager.update_chunks(_camera, screen_width, screen_height)
-    end_profiling("world.update_chunks")
-
-    # Get camera position for rendering
-    start_profiling("camera.get_position")
-    view_center_x, view_center_y = _camera.get_cursor_position()
-    end_profiling("camera.get_position")
-
-    # Get tile under cursor for status display
-    start_profiling("world.get_tile")
-    cursor_tile = _world_manager.get_tile(view_center_x, view_center_y)
-    end_profiling("world.get_tile")
-
-    start_profiling("world.get_chunk_info")
-    chunk_info = _world_manager.get_chunk_info(view_center_x, view_center_y)
-    end_profiling("world.get_chunk_info")
-
-    start_profiling("world.get_statistics")
-    world_stats = _world_manager.get_statistics()
-    end_profiling("world.get_statistics")
-
-    # Prepare render options with cursor information
-    render_options = {
-        'cursor_tile': cursor_tile,
-        'cursor_position': (view_center_x, view_center_y),
-        'chunk_info': chunk_info,
-        'world_stats': world_stats,
-        # 'highlight_positions': [(view_center_x, view_center_y)]  # Removed - cursor is rendered in world tiles
-    }
-
-    # Use the renderer to draw everything
-    start_profiling("renderer.render_frame")
-    _renderer.render_frame(console, _world_manager, view_center_x, view_center_y, **render_options)
-    end_profiling("renderer.render_frame")
-
-
-def handle_input(event):
-    """Handle input events. Returns True if the game should exit."""
-    global _input_handler
-
-    # Use the input handler to process all events
-    return _input_handler.handle_event(event)
-
-
-def run_game():
-    """Main game loop. This is the entry point for the game logic."""
-    global _config
-    print(f"Starting {_config.application.title}...")
-
-    # Initialize the console with configured size
-    console = tcod.console.Console(_config.window.initial_width, _config.window.initial_height, order="F")
+# main.py enables profiling before importing the game, so the setting is read
+# once here; when it is off the per-frame section timers are bare no-ops
+# instead of flag checks inside the profiler
+_PROFILING = is_profiling_enabled()
+if not _PROFILING:
+    def start_profiling(name): pass
+    def end_profiling(name): pass
 
-    # Use default font for now - custom fonts can cause spacing issues
-    # The seamless rendering system handles gaps using background colors
-    with tcod.context.new_terminal(
-        columns=console.width,
-        rows=console.height,
-        title=_config.application.title,
-        vsync=_config.window.vsync,
-    ) as context:
-        main_loop(context, console)
 
+class Game:
+    """
+    Game state and main loop.
+
+    Owns the renderer, camera, world manager and input handler, and wires the
+    input callbacks to them.
+    """
+
+    def __init__(self):
+        """Create the game state from the application configuration."""
+        self.config = get_config()
+        self.renderer = GameRenderer()
+
+        # Initialize camera and world manager
+        self.camera = Camera(self.config.camera)
+        self.world_manager = WorldManager(self.config.world)
+        self.input_handler = InputHandler(self.camera)
+
+        # (console, cursor position, chunks received, debug panel sample) when the
+        # console was last drawn
+        self._last_frame_key = None
+
+        # Set up input handler callbacks
+        self.input_handler.set_regenerate_callback(self._regenerate_world)
+        self.input_handler.set_debug_callbacks(
+            toggle_debug=self._toggle_debug,
+            toggle_coordinates=self._toggle_coordinates,
+            toggle_fps=self._toggle_fps,
+            toggle_chunk_debug=self._toggle_chunk_debug
+        )
+
+    def _regenerate_world(self):
+        """Callback for world regeneration."""
+        # TODO: Implement world regeneration
+        self.renderer.add_effect('sparkle', *self.camera.get_cursor_position(), 30, color=(255, 255, 0))
+
+    def _toggle_debug(self):
+        """Callback for debug toggle."""
+        self.renderer.get_status_display().toggle_debug()
+
+    def _toggle_coordinates(self):
+        """Callback for coordinates toggle."""
+        status_display = self.renderer.get_status_display()
+        status_display.toggle_coordinates()
+        print(f"Coordinate display: {'ON' if status_display.show_coordinates else 'OFF'}")
+
+    def _toggle_fps(self):
+        """Callback for FPS toggle."""
+        status_display = self.renderer.get_status_display()
+        status_display.toggle_fps()
+        print(f"FPS display: {'ON' if status_display.show_fps else 'OFF'}")
+
+    def _toggle_chunk_debug(self):
+        """Callback for chunk debug toggle."""
+        status_display = self.renderer.get_status_display()
+        status_display.toggle_chunk_debug()
+        print(f"Chunk debug: {'ON' if status_display.show_chunk_debug else 'OFF'}")
+
+    @profile_function("game.render_frame")
+    def render_frame(self, console, force_redraw: bool = False) -> bool:
+        """
+        Render a single frame of the game.
+
+        Chunk loading is advanced every call, but the console is only redrawn
+        when the cursor moved, new chunks arrived, the console was replaced,
+        effects are playing, the debug panel has a new FPS sample, or a redraw
+        is forced (e.g. after input events).
+
+        Returns:
+            True if the console was redrawn, False if it still shows the last frame
+        """
+        world_manager = self.world_manager
+
+        # Process completed chunks from worker for non-blocking tile access
+        start_profiling("world.process_messages")
+        world_manager.process_worker_messages()
+        end_profiling("world.process_messages")
+
+        # Get current console dimensions (these change with window resize)
+        screen_width = console.width
+        screen_height = console.height
+
+        # Update world chunks based on camera position and screen viewport
+        start_profiling("world.update_chunks")
+        world_manager.update_chunks(self.camera, screen_width, screen_height)
+        end_profiling("world.update_chunks")
+
+        # Get camera position for the redraw check and status display
+        cursor_position = self.camera.get_cursor_position()
+        view_center_x, view_center_y = cursor_position
+
+        # Skip drawing when nothing visible can have changed since the last frame.
+        # The debug panel's FPS and world stats change without input, so while it
+        # is shown each new FPS sample (every FPS_SAMPLE_FRAMES loops) redraws it
+        status_display = self.renderer.get_status_display()
+        panel_sample = status_display.fps if status_display.show_debug else None
+        frame_key = (console, cursor_position, world_manager.chunks_received, panel_sample)
+        if not force_redraw and frame_key == self._last_frame_key and not self.renderer.has_active_effects():
+            return False
+        self._last_frame_key = frame_key
+
+        # Get tile under cursor for status display
+        cursor_tile = world_manager.get_tile(view_center_x, view_center_y)
+        chunk_info = world_manager.get_chunk_info(view_center_x, view_center_y)
+        world_stats = world_manager.get_statistics()
+
+        # Prepare render options with cursor information
+        render_options = {
+            'cursor_tile': cursor_tile,
+            'cursor_position': cursor_position,
+            'chunk_info': chunk_info,
+            'world_stats': world_stats,
+        }
+
+        # Use the renderer to draw everything
+        start_profiling("renderer.render_frame")
+        view = self.camera.make_view(screen_width, screen_height)
+        self.renderer.render_frame(console, world_manager, view, **render_options)
+        end_profiling("renderer.render_frame")
+        return True
+
+    def handle_input(self, event) -> bool:
+        """Handle input events. Returns True if the game should exit."""
+        return self.input_handler.handle_event(event)
+
+    def main_loop(self, context, console):
+        """Main game loop extracted for reuse with different contexts."""
+        try:
+            last_profile_print = time.monotonic()
+            target_fps = 60
+            frame_time = 1.0 / target_fps
+            next_frame_deadline = time.monotonic() + frame_time
+            events_handled = True  # Draw the first frame
+            status_display = self.renderer.get_status_display()
+
+            while True:
+                start_profiling("game.main_loop")
+
+                # Check if we need to resize the console based on context size
+                start_profiling("console.resize_check")
+                context_width, context_height = context.recommended_console_size()
+                if console.width != context_width or console.height != context_height:
+                    # Resize the console to match the window
+                    console = tcod.console.Console(context_width, context_height, order="F")
+                    print(f"Console resized to {context_width}x{context_height}")
+                end_profiling("console.resize_check")
+
+                # Render the frame with current console size
+                self.render_frame(console, force_redraw=events_handled)
+
+                # Present the console to the screen
+                start_profiling("tcod.present")
+                context.present(console)
+                end_profiling("tcod.present")
+                # FPS counts loop iterations, including frames that were not redrawn
+                status_display.tick_fps()
+
+                # Handle events (non-blocking for smooth 60 FPS)
+                start_profiling("event.handling")
+                events_handled = False
+                for event in tcod.event.get():  # Non-blocking event handling
+                    events_handled = True  # Toggles may change what is drawn
+                    if self.handle_input(event):
+                        return
+                self.input_handler.apply_pending_movement()
+                end_profiling("event.handling")
+
+                end_profiling("game.main_loop")
+
+                # Frame rate limiting against a fixed deadline, so sleep overshoot
+                # is absorbed by the next frame instead of accumulating
+                current_time = time.monotonic()
+                if current_time < next_frame_deadline:
+                    time.sleep(next_frame_deadline - current_time)
+                    next_frame_deadline += frame_time
+                else:
+                    # Running behind: pace from now rather than rushing to catch up
+                    next_frame_deadline = current_time + frame_time
+
+                # Print profiling stats every 10 seconds (only when profiling is enabled)
+                if _PROFILING and current_time - last_profile_print > 10.0:
+                    print_profiling_stats(10)
+                    last_profile_print = current_time
+        finally:
+            # Cleanup async world manager
+            self.world_manager.shutdown()
+
+    def run(self):
+        """Open the game window and run the main loop until exit."""
+        print(f"Starting {self.config.application.title}...")
+
+        # Initialize the console with configured size
+        console = tcod.console.Console(self.config.window.initial_width, self.config.window.initial_height,
+                                       order="F")
+
+        # Use default font for now - custom fonts can cause spacing issues
+        # The seamless rendering system handles gaps using background colors
+        with tcod.context.new_terminal(
+            columns=console.width,
+            rows=console.height,
+            title=self.config.application.title,
+            vsync=self.config.window.vsync,
+        ) as context:
+            self.main_loop(context, console)
 
-def main_loop(context, console):
-    """Main game loop extracted for reuse with different contexts."""
 
-    try:
-        frame_count = 0
-        last_profile_print = time.time()
-        target_fps = 60
-        frame_time = 1.0 / target_fps
-        last_frame_time = time.time()
-
-        while True:
-            start_profiling("game.main_loop")
-            frame_count += 1
-
-            # Check if we need to resize the console based on context size
-            start_profiling("console.resize_check")
-            context_width, context_height = context.recommended_console_size()
-            if console.width != context_width or console.height != context_height:
-                # Resize the console to match the window
-                console = tcod.console.Console(context_width, context_height, order="F")
-                print(f"Console resized to {context_width}x{context_height}")
-            end_profiling("console.resize_check")
-
-            # Render the frame with current console size
-            render_frame(console)
-
-            # Present the console to the screen
-            start_profiling("tcod.present")
-            context.present(console)
-            end_profiling("tcod.present")
-
-            # Handle events (non-blocking for smooth 60 FPS)
-            start_profiling("event.handling")
-            for event in tcod.event.get():  # Non-blocking event handling
-                if handle_input(event):
-                    return
-            end_profiling("event.handling")
-
-            end_profiling("game.main_loop")
-
-            # Frame rate limiting
-            current_time = time.time()
-            elapsed = current_time - last_frame_time
-            if elapsed < frame_time:
-                sleep_time = frame_time - elapsed
-                time.sleep(sleep_time)
-            last_frame_time = time.time()
-
-            # Print profiling stats every 10 seconds (only when profiling is enabled)
-            if current_time - last_profile_print > 10.0:
-                try:
-                    from ..profiler import is_profiling_enabled
-                    if is_profiling_enabled():
-                        print_profiling_stats(10)
-                except ImportError:
-                    # Profiler not available, skip stats
-                    pass
-                last_profile_print = current_time
-    finally:
-        # Cleanup async world manager
-        _world_manager.shutdown()
+def run_game():
+    """Create the game and run it. This is the entry point for the game logic."""
+    Game().run()
 
 
 if __name__ == "__main__":
@@ -6,15 +6,43 @@ Handles keyboard input for camera movement, game controls, and debug features.
 Uses TOML configuration for customizable key bindings.
 """
 
+import functools
 import tcod
 import os
+import tomllib
+from collections import OrderedDict
 from typing import Optional, Callable, Dict, Set
-from .camera import Camera
-
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Fallback for older Python versions
+from .camera import Camera, MOVE_DIRECTIONS
+from ..config import PARSED_CONFIG_CACHE_SIZE
+
+
+# Names used for keys in the input configuration, by tcod key symbol
+KEY_NAMES = {
+    tcod.event.KeySym.UP: "UP",
+    tcod.event.KeySym.DOWN: "DOWN",
+    tcod.event.KeySym.LEFT: "LEFT",
+    tcod.event.KeySym.RIGHT: "RIGHT",
+    tcod.event.KeySym.W: "W",
+    tcod.event.KeySym.A: "A",
+    tcod.event.KeySym.S: "S",
+    tcod.event.KeySym.D: "D",
+    tcod.event.KeySym.R: "R",
+    tcod.event.KeySym.Q: "Q",
+    tcod.event.KeySym.ESCAPE: "ESCAPE",
+    tcod.event.KeySym.F1: "F1",
+    tcod.event.KeySym.F2: "F2",
+    tcod.event.KeySym.F3: "F3",
+    tcod.event.KeySym.F4: "F4",
+}
+
+# InputHandler callback attribute run by each game and debug action
+ACTION_CALLBACKS = {
+    "regenerate_world": "on_regenerate_world",
+    "toggle_debug": "on_toggle_debug",
+    "toggle_coordinates": "on_toggle_coordinates",
+    "toggle_chunk_debug": "on_toggle_chunk_debug",
+    "toggle_fps": "on_toggle_fps",
+}
 
 
 class InputHandler:
@@ -25,6 +53,10 @@ class InputHandler:
     keyboard interactions. Key bindings are loaded from input.toml.
     """
 
+    # Parsed input configs keyed by (absolute path, mtime_ns, size), most
+    # recently used last; shared read-only by every handler loading that file
+    _parsed_configs: OrderedDict = OrderedDict()
+
     def __init__(self, camera: Camera, config_file: str = "input.toml"):
         """
         Initialize the input handler.
@@ -42,6 +74,10 @@ class InputHandler:
         # Build key mapping from config
         self.key_actions = self._build_key_mapping()
 
+        # Key press handlers by key symbol, built once so a key press is a
+        # single lookup and call
+        self._key_handlers = self._build_key_handlers()
+
         # Callback functions for various actions
         self.on_regenerate_world: Optional[Callable] = None
         self.on_toggle_debug: Optional[Callable] = None
@@ -49,26 +85,43 @@ class InputHandler:
         self.on_toggle_fps: Optional[Callable] = None
         self.on_toggle_chunk_debug: Optional[Callable] = None
 
-        # Performance optimization - movement throttling
-        import time
-        self._last_movement_time = 0
-        self._movement_throttle = self.config.get('settings', {}).get('movement_throttle', 0.016)
+        # Movement from this frame's key events, applied once by apply_pending_movement
+        self._pending_dx = 0
+        self._pending_dy = 0
 
     def _load_input_config(self) -> Dict:
-        """Load input configuration from TOML file."""
-        if not os.path.exists(self.config_file):
+        """
+        Load input configuration from TOML file.
+
+        A file whose modification time and size are unchanged since it was last
+        parsed is not read again; the previously parsed config is returned.
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
             print(f"Warning: Input config file '{self.config_file}' not found. Using defaults.")
             return self._get_default_config()
 
+        cache_key = (os.path.abspath(self.config_file), stat.st_mtime_ns, stat.st_size)
+        parsed_configs = InputHandler._parsed_configs
+        config = parsed_configs.get(cache_key)
+        if config is not None:
+            parsed_configs.move_to_end(cache_key)
+            return config
+
         try:
             with open(self.config_file, 'rb') as f:
                 config = tomllib.load(f)
             print(f"Loaded input configuration from {self.config_file}")
-            return config
         except Exception as e:
             print(f"Error loading input config: {e}. Using defaults.")
             return self._get_default_config()
 
+        parsed_configs[cache_key] = config
+        if len(parsed_configs) > PARSED_CONFIG_CACHE_SIZE:
+            parsed_configs.popitem(last=False)
+        return config
+
     def _get_default_config(self) -> Dict:
         """Get default input configuration if TOML file is missing."""
         return {
@@ -91,9 +144,6 @@ class InputHandler:
             'modifiers': {
                 'fast_movement': 'SHIFT',
                 'exit_modifier': 'CTRL'
-            },
-            'settings': {
-                'movement_throttle': 0.016
             }
         }
 
@@ -103,6 +153,8 @@ class InputHandler:
 
         # Movement keys
         for action, keys in self.config.get('movement', {}).items():
+            if action not in MOVE_DIRECTIONS:
+                raise ValueError(f"❌ Unknown movement direction '{action}' in {self.config_file}")
             primary = keys.get('primary')
             alternate = keys.get('alternate')
             if primary:
@@ -130,6 +182,33 @@ class InputHandler:
 
         return key_actions
 
+    def _build_key_handlers(self) -> Dict[int, Callable[[int], bool]]:
+        """
+        Build a handler for each bound key, with its action and modifier settings resolved.
+
+        Returns:
+            Mapping from tcod key symbol to a handler taking the event's modifier
+            mask and returning True if the game should exit
+        """
+        modifiers = self.config.get('modifiers', {})
+        fast_with_shift = modifiers.get('fast_movement', 'SHIFT') == 'SHIFT'
+        exit_modifier = modifiers.get('exit_modifier', 'CTRL')
+
+        key_handlers = {}
+        for key_sym, key_name in KEY_NAMES.items():
+            action = self.key_actions.get(key_name)
+            if not action:
+                continue
+            if action.startswith("move_"):
+                direction = action[5:]  # Remove "move_" prefix
+                key_handlers[key_sym] = functools.partial(self._move, direction, fast_with_shift)
+            elif action == "exit":
+                key_handlers[key_sym] = functools.partial(self._exit, key_name, exit_modifier)
+            elif action in ACTION_CALLBACKS:
+                key_handlers[key_sym] = functools.partial(self._run_callback, ACTION_CALLBACKS[action])
+
+        return key_handlers
+
     def set_regenerate_callback(self, callback: Callable):
         """Set callback for world regeneration (R key)."""
         self.on_regenerate_world = callback
@@ -178,108 +257,45 @@ class InputHandler:
         Returns:
             True if the game should exit, False otherwise
         """
-        # Check for modifier keys
-        shift_held = bool(event.mod & tcod.event.Modifier.SHIFT)
-        ctrl_held = bool(event.mod & tcod.event.Modifier.CTRL)
-
-        # Convert tcod key symbol to string
-        key_name = self._get_key_name(event.sym)
-        if not key_name:
-            return False
-
-        # Get action for this key
-        action = self.key_actions.get(key_name)
-        if not action:
-            return False
-
-        # Handle exit commands (check for required modifiers)
-        if action == "exit":
-            exit_modifier = self.config.get('modifiers', {}).get('exit_modifier', 'CTRL')
-            if key_name == "Q" and exit_modifier == "CTRL" and not ctrl_held:
-                return False  # Q without Ctrl doesn't exit
-            if key_name == "ESCAPE" or (key_name == "Q" and ctrl_held):
-                print("Exit command received. Exiting gracefully...")
-                return True
-
-        # Handle movement actions
-        if action.startswith("move_"):
-            direction = action[5:]  # Remove "move_" prefix
-            if self._can_move():
-                fast_modifier = self.config.get('modifiers', {}).get('fast_movement', 'SHIFT')
-                fast_mode = shift_held if fast_modifier == 'SHIFT' else False
-
-                if direction == "up":
-                    self.camera.move_up(fast_mode=fast_mode)
-                elif direction == "down":
-                    self.camera.move_down(fast_mode=fast_mode)
-                elif direction == "left":
-                    self.camera.move_left(fast_mode=fast_mode)
-                elif direction == "right":
-                    self.camera.move_right(fast_mode=fast_mode)
-            return False
-
-        # Handle game actions
-        elif action == "regenerate_world":
-            if self.on_regenerate_world:
-                self.on_regenerate_world()
-            return False
-
-        # Handle debug actions
-        elif action == "toggle_debug":
-            if self.on_toggle_debug:
-                self.on_toggle_debug()
-            return False
-        elif action == "toggle_coordinates":
-            if self.on_toggle_coordinates:
-                self.on_toggle_coordinates()
-            return False
-        elif action == "toggle_chunk_debug":
-            if self.on_toggle_chunk_debug:
-                self.on_toggle_chunk_debug()
-            return False
-        elif action == "toggle_fps":
-            if self.on_toggle_fps:
-                self.on_toggle_fps()
-            return False
-
-        # Unknown action - no action
+        handler = self._key_handlers.get(event.sym)
+        return handler(event.mod) if handler else False
+
+    def _move(self, direction: str, fast_with_shift: bool, mod: int) -> bool:
+        """Add one step in a direction to the pending movement."""
+        fast_mode = fast_with_shift and bool(mod & tcod.event.Modifier.SHIFT)
+        dx, dy = self.camera.get_move_delta(direction, fast_mode)
+        self._pending_dx += dx
+        self._pending_dy += dy
         return False
 
-    def _get_key_name(self, key_sym) -> Optional[str]:
-        """Convert tcod key symbol to string name."""
-        # Map tcod key symbols to string names
-        key_map = {
-            tcod.event.KeySym.UP: "UP",
-            tcod.event.KeySym.DOWN: "DOWN",
-            tcod.event.KeySym.LEFT: "LEFT",
-            tcod.event.KeySym.RIGHT: "RIGHT",
-            tcod.event.KeySym.W: "W",
-            tcod.event.KeySym.A: "A",
-            tcod.event.KeySym.S: "S",
-            tcod.event.KeySym.D: "D",
-            tcod.event.KeySym.R: "R",
-            tcod.event.KeySym.Q: "Q",
-            tcod.event.KeySym.ESCAPE: "ESCAPE",
-            tcod.event.KeySym.F1: "F1",
-            tcod.event.KeySym.F2: "F2",
-            tcod.event.KeySym.F3: "F3",
-            tcod.event.KeySym.F4: "F4",
-        }
-        return key_map.get(key_sym)
+    def _exit(self, key_name: str, exit_modifier: str, mod: int) -> bool:
+        """Handle an exit key, checking for its required modifier."""
+        ctrl_held = bool(mod & tcod.event.Modifier.CTRL)
+        if key_name == "Q" and exit_modifier == "CTRL" and not ctrl_held:
+            return False  # Q without Ctrl doesn't exit
+        if key_name == "ESCAPE" or (key_name == "Q" and ctrl_held):
+            print("Exit command received. Exiting gracefully...")
+            return True
+        return False
+
+    def _run_callback(self, callback_name: str, mod: int) -> bool:
+        """Run a game or debug action callback if one is set."""
+        callback = getattr(self, callback_name)
+        if callback:
+            callback()
+        return False
 
-    def _can_move(self) -> bool:
+    def apply_pending_movement(self):
         """
-        Check if movement is allowed based on throttling.
+        Move the camera by all movement keys handled since the last call.
 
-        Returns:
-            True if movement is allowed, False if throttled
+        Call once per frame after handling events, so key repeats between
+        frames coalesce into a single cursor update.
         """
-        import time
-        current_time = time.time()
-        if current_time - self._last_movement_time >= self._movement_throttle:
-            self._last_movement_time = current_time
-            return True
-        return False
+        if self._pending_dx or self._pending_dy:
+            self.camera.move_by(self._pending_dx, self._pending_dy)
+            self._pending_dx = 0
+            self._pending_dy = 0
     
     def get_movement_help_text(self) -> str:
         """
@@ -391,15 +407,18 @@ if __name__ == "__main__":
     # Test movement
     w_event = MockEvent("KEYDOWN", tcod.event.KeySym.W)
     input_handler.handle_event(w_event)
+    input_handler.apply_pending_movement()
     print(f"After W key: {input_handler.get_camera_position()}")
     
     d_event = MockEvent("KEYDOWN", tcod.event.KeySym.D)
     input_handler.handle_event(d_event)
+    input_handler.apply_pending_movement()
     print(f"After D key: {input_handler.get_camera_position()}")
     
     # Test fast movement
     shift_s_event = MockEvent("KEYDOWN", tcod.event.KeySym.S, tcod.event.Modifier.SHIFT)
     input_handler.handle_event(shift_s_event)
+    input_handler.apply_pending_movement()
     print(f"After Shift+S: {input_handler.get_camera_position()}")
     
     print("Input handler test completed!")
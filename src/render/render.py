@@ -6,13 +6,16 @@ Handles all rendering operations including world tiles, UI overlays, and effects
 Separated from game logic for better organization and modularity.
 """
 
+import numpy as np
 import tcod
 from typing import Dict, Tuple, Optional, List
 from ..world import Tile
+from ..world.world_manager import GRID_TILE_TYPE_NAMES
+from ..engine.camera import ViewTransform
 from ..ui.status_display import StatusDisplay
 from ..tiles import get_tile_registry
 try:
-    from ..profiler import profile_function, start_profiling, end_profiling
+    from ..profiler import profile_function, start_profiling, end_profiling, is_profiling_enabled
 except ImportError:
     # Fallback for when profiler is not available
     def profile_function(name=None):
@@ -21,6 +24,13 @@ except ImportError:
         return decorator
     def start_profiling(name): pass
     def end_profiling(name): pass
+    def is_profiling_enabled(): return False
+
+# Read once at import, like profile_function; when off the per-frame section
+# timers are bare no-ops
+if not is_profiling_enabled():
+    def start_profiling(name): pass
+    def end_profiling(name): pass
 
 
 class WorldRenderer:
@@ -43,90 +53,45 @@ class WorldRenderer:
                     fg=tile_config.font_color, bg=tile_config.background_color)
     
     @profile_function("renderer.render_world")
-    def render_world(self, console: tcod.console.Console, world_source,
-                    view_center_x: int, view_center_y: int):
+    def render_world(self, console: tcod.console.Console, world_source, view: ViewTransform):
         """
         Render the world tiles to the console (optimized version).
 
         Args:
             console: The tcod console to render to
-            world_source: The world manager or generator containing tile data
-            view_center_x: X coordinate of the view center
-            view_center_y: Y coordinate of the view center
+            world_source: The world manager providing tile id grids
+            view: Camera view for this frame's console size
         """
-        screen_width = console.width
-        screen_height = console.height
-
-        # Calculate world bounds for the current view
-        half_width = screen_width // 2
-        half_height = screen_height // 2
-
-        # Calculate world coordinate bounds
-        min_world_x = view_center_x - half_width
-        max_world_x = view_center_x + half_width
-        min_world_y = view_center_y - half_height
-        max_world_y = view_center_y + half_height
-
-        # Batch fetch all tiles for the visible area (major optimization!)
+        # Batch fetch the tile ids of the visible area as a [screen_y, screen_x]
+        # grid, copied chunk by chunk instead of looked up tile by tile
         start_profiling("renderer.batch_fetch_tiles")
-        tile_cache = {}
-        for world_y in range(min_world_y, max_world_y + 1):
-            for world_x in range(min_world_x, max_world_x + 1):
-                tile = world_source.get_tile(world_x, world_y)
-                tile_cache[(world_x, world_y)] = tile
+        tile_ids = world_source.get_tile_ids(view.min_x, view.min_y, console.width, console.height)
         end_profiling("renderer.batch_fetch_tiles")
 
-        # Pre-fetch tile configurations to avoid repeated lookups
+        # Style lookup tables indexed by tile id, so the whole grid is styled
+        # with one fancy-indexing pass per console array
         start_profiling("renderer.prefetch_configs")
-        tile_types = set(tile.tile_type for tile in tile_cache.values())
-        config_cache = {}
-        for tile_type in tile_types:
-            config_cache[tile_type] = self.tile_registry.get_tile_config(tile_type)
-
-        # Add cursor config
-        cursor_config = self.tile_registry.get_tile_config('cursor')
+        get_tile_config = self.tile_registry.get_tile_config
+        tile_configs = [get_tile_config(tile_type) for tile_type in GRID_TILE_TYPE_NAMES]
+        chars = np.array([ord(config.character) for config in tile_configs], dtype=np.int32)
+        fg_colors = np.array([config.font_color for config in tile_configs], dtype=np.uint8)
+        bg_colors = np.array([config.background_color for config in tile_configs], dtype=np.uint8)
+        cursor_config = get_tile_config('cursor')
         end_profiling("renderer.prefetch_configs")
 
-        # Ultra-optimized rendering using numpy arrays (batch rendering)
         start_profiling("renderer.render_loop")
 
-        # Prepare arrays for batch rendering
-        import numpy as np
+        # Console arrays are indexed [x, y]
+        screen_tile_ids = tile_ids.T
+        console.ch[:] = chars[screen_tile_ids]
+        console.fg[:] = fg_colors[screen_tile_ids]
+        console.bg[:] = bg_colors[screen_tile_ids]
 
-        # Create arrays for characters, foreground colors, and background colors
-        # Note: tcod console expects (width, height) order
-        chars = np.full((screen_width, screen_height), ord(' '), dtype=np.int32)
-        fg_colors = np.zeros((screen_width, screen_height, 3), dtype=np.uint8)
-        bg_colors = np.zeros((screen_width, screen_height, 3), dtype=np.uint8)
-
-        # Fill arrays in one pass
-        for screen_y in range(screen_height):
-            for screen_x in range(screen_width):
-                # Convert screen coordinates to world coordinates
-                world_x = view_center_x + (screen_x - half_width)
-                world_y = view_center_y + (screen_y - half_height)
-
-                # Check if this is the cursor position (center of screen)
-                if screen_x == half_width and screen_y == half_height:
-                    # Use cursor config
-                    config = cursor_config
-                else:
-                    # Get tile from cache
-                    tile = tile_cache.get((world_x, world_y))
-                    if tile:
-                        config = config_cache.get(tile.tile_type)
-                    else:
-                        continue  # Skip if no tile
-
-                if config:
-                    chars[screen_x, screen_y] = ord(config.character)
-                    fg_colors[screen_x, screen_y] = config.font_color
-                    bg_colors[screen_x, screen_y] = config.background_color
-
-        # Batch render all tiles at once (much faster than individual console.print calls)
-        console.ch[:] = chars
-        console.fg[:] = fg_colors
-        console.bg[:] = bg_colors
+        # The cursor always sits at the center of the screen
+        cursor_cell = view.half_width, view.half_height
+        console.ch[cursor_cell] = ord(cursor_config.character)
+        console.fg[cursor_cell] = cursor_config.font_color
+        console.bg[cursor_cell] = cursor_config.background_color
 
         end_profiling("renderer.render_loop")
     
@@ -204,18 +169,22 @@ class EffectRenderer:
         self.effects = [effect for effect in self.effects
                        if effect['remaining'] > 0]
     
-    def render_effects(self, console: tcod.console.Console, view_center_x: int, view_center_y: int):
+    def render_effects(self, console: tcod.console.Console, view: ViewTransform):
         """Render all active effects."""
-        half_width = console.width // 2
-        half_height = console.height // 2
+        # Screen size and the view's top-left world position are fixed for the
+        # frame, so each effect needs only a subtraction per axis
+        screen_width = console.width
+        screen_height = console.height
+        min_world_x = view.min_x
+        min_world_y = view.min_y
         
         for effect in self.effects:
             # Convert world coordinates to screen coordinates
-            screen_x = (effect['x'] - view_center_x) + half_width
-            screen_y = (effect['y'] - view_center_y) + half_height
+            screen_x = effect['x'] - min_world_x
+            screen_y = effect['y'] - min_world_y
             
-            # Render if on screen
-            if 0 <= screen_x < console.width and 0 <= screen_y < console.height:
+            # Render if on screen; the OR is negative exactly when either offset is
+            if (screen_x | screen_y) >= 0 and screen_x < screen_width and screen_y < screen_height:
                 if effect['type'] == 'sparkle':
                     char = '*' if effect['remaining'] % 2 == 0 else '+'
                     color = effect.get('color', (255, 255, 255))
@@ -231,16 +200,16 @@ class GameRenderer:
         self.status_display = StatusDisplay()
         self.clear_color = (0, 0, 0)  # Black background
     
-    def render_frame(self, console: tcod.console.Console, world_source,
-                    view_center_x: int, view_center_y: int, **render_options):
+    def render_frame(self, console: tcod.console.Console, world_source, view: ViewTransform,
+                    **render_options):
         """
         Render a complete frame.
 
         Args:
             console: The tcod console to render to
-            world_source: The world manager or generator containing tile data
-            view_center_x: X coordinate of the view center
-            view_center_y: Y coordinate of the view center
+            world_source: The world manager providing tile data
+            view: Camera view for this frame, from Camera.make_view at the
+                console size
             **render_options: Additional rendering options including:
                 - cursor_tile: Tile under cursor
                 - cursor_position: (x, y) cursor position
@@ -249,16 +218,18 @@ class GameRenderer:
         """
         # Update frame counter
         self.status_display.update_frame_count()
+        view_center_x = view.cursor_x
+        view_center_y = view.cursor_y
 
         # Clear the console
         console.clear(fg=(255, 255, 255), bg=self.clear_color)
 
         # Render world tiles
-        self.world_renderer.render_world(console, world_source, view_center_x, view_center_y)
+        self.world_renderer.render_world(console, world_source, view)
 
         # Update and render effects
         self.effect_renderer.update_effects()
-        self.effect_renderer.render_effects(console, view_center_x, view_center_y)
+        self.effect_renderer.render_effects(console, view)
 
         # Render highlights if specified
         if 'highlight_positions' in render_options:
@@ -292,6 +263,10 @@ class GameRenderer:
         """Add a visual effect at a world position."""
         self.effect_renderer.add_effect(effect_type, world_x, world_y, duration, **kwargs)
     
+    def has_active_effects(self) -> bool:
+        """Check if any effect is still playing and needs redrawing each frame."""
+        return bool(self.effect_renderer.effects)
+    
     def set_clear_color(self, color: Tuple[int, int, int]):
         """Set the background clear color."""
         self.clear_color = color
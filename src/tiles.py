@@ -7,14 +7,10 @@ tile rendering information to the rendering system.
 """
 
 import os
+import tomllib
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Fallback for older Python versions
-
 
 @dataclass
 class TileConfig:
@@ -5,11 +5,16 @@ Status display UI component for the 2D Minecraft-like game
 Handles rendering of status information, debug info, and other UI elements.
 """
 
+import time
 import tcod
 from typing import Tuple, Optional
 from ..config import get_config
 
 
+# Loop iterations between FPS samples; a power of two so the check is a single mask
+FPS_SAMPLE_FRAMES = 64
+
+
 class StatusDisplay:
     """Handles rendering of status information and UI overlays."""
     
@@ -17,6 +22,13 @@ class StatusDisplay:
         self.frame_count = 0
         self.config = get_config()
 
+        # Frames presented per second: the main loop presents the console once
+        # per iteration, redrawn or not, so this is the loop rate, measured over
+        # every FPS_SAMPLE_FRAMES iterations. frame_count counts only redraws
+        self.fps = 0.0
+        self._loop_count = 0
+        self._fps_sample_start = time.perf_counter()
+
         # Initialize display settings from config
         self.show_debug = self.config.debug.show_debug_on_startup
         self.show_coordinates = self.config.debug.show_coordinates_on_startup
@@ -34,9 +46,17 @@ class StatusDisplay:
         self._cached_status_lines = []
     
     def update_frame_count(self):
-        """Increment the frame counter."""
+        """Increment the frame counter (called for each drawn frame)"""
         self.frame_count += 1
     
+    def tick_fps(self):
+        """Count one presented frame (main loop iteration), refreshing the FPS once per sample window."""
+        self._loop_count += 1
+        if not self._loop_count & (FPS_SAMPLE_FRAMES - 1):
+            now = time.perf_counter()
+            self.fps = FPS_SAMPLE_FRAMES / (now - self._fps_sample_start)
+            self._fps_sample_start = now
+    
     def render_floating_container(self, console, content_lines: list, position: str = "top",
                                  max_lines: int = None, bg_color: tuple = None):
         """
@@ -77,26 +97,21 @@ class StatusDisplay:
         # Use provided background color or config default
         container_bg = bg_color if bg_color else self.config.ui.panel_background
 
-        # Draw container background
+        # Draw container background one row string at a time
+        background_row = " " * container_width
         for y in range(container_height):
-            for x in range(container_width):
-                console.print(start_x + x, start_y + y, " ", fg=self.info_color, bg=container_bg)
+            console.print(start_x, start_y + y, background_row, fg=self.info_color, bg=container_bg)
 
-        # Draw borders using box drawing characters
+        # Draw borders using box drawing characters, building each edge as a single string
         border_color = self.config.ui.border_color
+        horizontal = "─" * (container_width - 2)
 
         # Top border
-        console.print(start_x, start_y, "┌", fg=border_color, bg=container_bg)
-        for x in range(1, container_width - 1):
-            console.print(start_x + x, start_y, "─", fg=border_color, bg=container_bg)
-        console.print(start_x + container_width - 1, start_y, "┐", fg=border_color, bg=container_bg)
+        console.print(start_x, start_y, "┌" + horizontal + "┐", fg=border_color, bg=container_bg)
 
         # Bottom border
         bottom_y = start_y + container_height - 1
-        console.print(start_x, bottom_y, "└", fg=border_color, bg=container_bg)
-        for x in range(1, container_width - 1):
-            console.print(start_x + x, bottom_y, "─", fg=border_color, bg=container_bg)
-        console.print(start_x + container_width - 1, bottom_y, "┘", fg=border_color, bg=container_bg)
+        console.print(start_x, bottom_y, "└" + horizontal + "┘", fg=border_color, bg=container_bg)
 
         # Side borders
         for y in range(1, container_height - 1):
@@ -9,9 +9,15 @@ Separates generation chunks (optimized for pipeline processing) from render chun
 """
 
 import math
-from typing import Dict, List, Tuple, Set, Any, Optional
+from typing import Dict, Iterable, List, Tuple, Set, Any, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+# Tile types produced by the generation pipeline, indexed by their compact id
+TILE_TYPE_NAMES: Tuple[str, ...] = ("water", "land")
+TILE_TYPE_IDS: Dict[str, int] = {name: tile_id for tile_id, name in enumerate(TILE_TYPE_NAMES)}
+
 
 @dataclass
 class GenerationChunk:
@@ -27,7 +33,7 @@ class GenerationChunk:
     chunk_x: int
     chunk_y: int
     chunk_size: int  # Dynamic size based on pipeline stage
-    tiles: Dict[Tuple[int, int], str]  # (world_x, world_y) -> tile_type
+    tiles: np.ndarray  # (chunk_size, chunk_size) uint8 tile ids indexed [local_y, local_x]
     metadata: Dict[str, Any]
     
     def get_world_bounds(self) -> Tuple[int, int, int, int]:
@@ -39,18 +45,18 @@ class GenerationChunk:
         return min_x, min_y, max_x, max_y
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderChunk:
     """
     Large chunks optimized for rendering and memory management.
 
     Fixed size of 64x64 tiles regardless of generation pipeline.
-    Each render chunk aggregates multiple generation chunks.
+    Each render chunk aggregates multiple generation chunks; only their tile ids
+    are kept, so cached and sent chunks carry a single compact grid.
     """
     chunk_x: int
     chunk_y: int
-    generation_chunks: List[GenerationChunk]
-    aggregated_tiles: Dict[Tuple[int, int], str]  # Cached tile lookup
+    aggregated_tiles: np.ndarray  # (chunk_size, chunk_size) uint8 tile ids indexed [local_y, local_x]
     metadata: Dict[str, Any]
     chunk_size: int = 64  # Fixed size for rendering efficiency
     
@@ -64,7 +70,11 @@ class RenderChunk:
     
     def get_tile(self, world_x: int, world_y: int) -> Optional[str]:
         """Get tile type at world coordinates."""
-        return self.aggregated_tiles.get((world_x, world_y))
+        local_x = world_x - self.chunk_x * self.chunk_size
+        local_y = world_y - self.chunk_y * self.chunk_size
+        if not (0 <= local_x < self.chunk_size and 0 <= local_y < self.chunk_size):
+            return None
+        return TILE_TYPE_NAMES[self.aggregated_tiles[local_y, local_x]]
 
 
 class DualChunkManager:
@@ -142,13 +152,16 @@ class DualChunkManager:
         
         return gen_chunks
     
-    def aggregate_generation_chunks(self, generation_chunks: List[GenerationChunk],
+    def aggregate_generation_chunks(self, generation_chunks: Iterable[GenerationChunk],
                                   render_chunk_x: int, render_chunk_y: int) -> RenderChunk:
         """
         Aggregate multiple generation chunks into a single render chunk.
         
+        Each chunk's tiles are copied before the next chunk is taken, so a lazy
+        producer may reuse one tile buffer for all of them.
+        
         Args:
-            generation_chunks: List of generation chunks to aggregate
+            generation_chunks: Generation chunks to aggregate
             render_chunk_x: Target render chunk X coordinate
             render_chunk_y: Target render chunk Y coordinate
             
@@ -161,38 +174,42 @@ class DualChunkManager:
         render_max_x = render_min_x + self.render_chunk_size - 1
         render_max_y = render_min_y + self.render_chunk_size - 1
         
-        # Aggregate all tiles from generation chunks
-        aggregated_tiles = {}
+        # Aggregate all tiles from generation chunks into a compact tile id grid
+        aggregated_tiles = np.zeros((self.render_chunk_size, self.render_chunk_size), dtype=np.uint8)
+        generation_chunk_sizes = []
+        generation_chunk_metadata = []
         
         for gen_chunk in generation_chunks:
-            for (world_x, world_y), tile_data in gen_chunk.tiles.items():
-                # Only include tiles that fall within the render chunk bounds
-                if (render_min_x <= world_x <= render_max_x and
-                    render_min_y <= world_y <= render_max_y):
-                    # Extract tile_type from tile_data dictionary
-                    if isinstance(tile_data, dict):
-                        tile_type = tile_data.get('tile_type', 'land')
-                    else:
-                        tile_type = tile_data  # Fallback if it's already a string
-                    aggregated_tiles[(world_x, world_y)] = tile_type
+            generation_chunk_sizes.append(gen_chunk.chunk_size)
+            generation_chunk_metadata.append(gen_chunk.metadata)
+            gen_min_x, gen_min_y, gen_max_x, gen_max_y = gen_chunk.get_world_bounds()
+
+            # Copy only the part of the generation chunk inside the render chunk bounds
+            min_x, max_x = max(gen_min_x, render_min_x), min(gen_max_x, render_max_x)
+            min_y, max_y = max(gen_min_y, render_min_y), min(gen_max_y, render_max_y)
+            if min_x > max_x or min_y > max_y:
+                continue
+            aggregated_tiles[min_y - render_min_y:max_y - render_min_y + 1,
+                             min_x - render_min_x:max_x - render_min_x + 1] = \
+                gen_chunk.tiles[min_y - gen_min_y:max_y - gen_min_y + 1,
+                                min_x - gen_min_x:max_x - gen_min_x + 1]
         
         # Aggregate metadata
         aggregated_metadata = {
-            'generation_chunk_count': len(generation_chunks),
-            'generation_chunk_sizes': [chunk.chunk_size for chunk in generation_chunks],
-            'tile_count': len(aggregated_tiles),
+            'generation_chunk_count': len(generation_chunk_sizes),
+            'generation_chunk_sizes': generation_chunk_sizes,
+            'tile_count': aggregated_tiles.size,
             'render_chunk_bounds': (render_min_x, render_min_y, render_max_x, render_max_y)
         }
         
         # Add metadata from generation chunks
-        for i, gen_chunk in enumerate(generation_chunks):
-            aggregated_metadata[f'gen_chunk_{i}_metadata'] = gen_chunk.metadata
+        for i, metadata in enumerate(generation_chunk_metadata):
+            aggregated_metadata[f'gen_chunk_{i}_metadata'] = metadata
         
         return RenderChunk(
             chunk_x=render_chunk_x,
             chunk_y=render_chunk_y,
             chunk_size=self.render_chunk_size,
-            generation_chunks=generation_chunks,
             aggregated_tiles=aggregated_tiles,
             metadata=aggregated_metadata
         )
@@ -10,11 +10,6 @@ natural-looking terrain.
 import os
 from typing import Dict, Any, Tuple, Set
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
-
 from ...pipeline import GenerationLayer, GenerationData
 
 
@@ -11,11 +11,6 @@ import random
 import math
 from typing import Dict, Any, Tuple
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
-
 from ...pipeline import GenerationLayer, GenerationData
 
 
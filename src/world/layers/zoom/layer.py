@@ -11,12 +11,12 @@ import random
 from typing import Dict, Any, Tuple, List, Set
 from collections import defaultdict
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
+import numpy as np
 
-from ...pipeline import GenerationLayer, GenerationData
+from ...pipeline import GenerationLayer, GenerationData, build_land_grid, count_neighbors
+
+MOORE_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+VON_NEUMANN_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
 
 class ZoomLayer(GenerationLayer):
@@ -104,12 +104,7 @@ class ZoomLayer(GenerationLayer):
         # Apply cellular automata to refine boundaries
         # Calculate bounds for the subdivided chunks
         if new_chunks:
-            chunk_coords = list(new_chunks.keys())
-            min_sub_x = min(x for x, y in chunk_coords)
-            max_sub_x = max(x for x, y in chunk_coords)
-            min_sub_y = min(y for x, y in chunk_coords)
-            max_sub_y = max(y for x, y in chunk_coords)
-            sub_bounds = (min_sub_x, min_sub_y, max_sub_x, max_sub_y)
+            sub_bounds = self._coordinate_bounds(new_chunks)
         else:
             sub_bounds = bounds
 
@@ -124,6 +119,22 @@ class ZoomLayer(GenerationLayer):
         
         return data
     
+    @staticmethod
+    def _coordinate_bounds(chunks: Dict[Tuple[int, int], Dict[str, Any]]) -> Tuple[int, int, int, int]:
+        """Get (min_x, min_y, max_x, max_y) of the chunk coordinates in a single pass."""
+        coords = iter(chunks)
+        min_x, min_y = max_x, max_y = next(coords)
+        for x, y in coords:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        return min_x, min_y, max_x, max_y
+
     def _subdivide_chunk(self, seed: int, parent_chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Subdivide a parent chunk into smaller sub-chunks with dynamic sizing.
@@ -247,28 +258,41 @@ class ZoomLayer(GenerationLayer):
 
         new_chunks = chunks.copy()
 
+        # Neighbour counts for the whole grid are computed up front on dense
+        # numpy masks; only the rule application (which consumes the RNG in
+        # chunk order) stays in the per-chunk loop.
+        land, present = build_land_grid(chunks, (min_x, min_y, max_x, max_y))
+        offsets = MOORE_OFFSETS if self.use_moore_neighborhood else VON_NEUMANN_OFFSETS
+        land_counts = count_neighbors(land, offsets).tolist()
+        total_counts = count_neighbors(np.ones_like(land), offsets).tolist()
+
+        at_boundary = None
+        if self.edge_noise_boost:
+            # A chunk is at a boundary when a neighbour of the other land type exists
+            land_near = count_neighbors(land, MOORE_OFFSETS) > 0
+            water_near = count_neighbors(present & ~land, MOORE_OFFSETS) > 0
+            at_boundary = np.where(land, water_near, land_near).tolist()
+
         for chunk_x in range(min_x, max_x + 1):
+            i = chunk_x - min_x
             for chunk_y in range(min_y, max_y + 1):
                 chunk_key = (chunk_x, chunk_y)
                 if chunk_key not in chunks:
                     continue
 
+                j = chunk_y - min_y
                 current_chunk = chunks[chunk_key]
                 current_land_type = current_chunk.get('land_type', 'water')
 
-                # Count land neighbors
-                land_neighbors = self._count_land_neighbors(chunks, chunk_x, chunk_y, min_x, min_y, max_x, max_y)
-                total_neighbors = self._count_total_neighbors(chunk_x, chunk_y, min_x, min_y, max_x, max_y)
-
                 # Apply cellular automata rules
-                new_land_type = self._apply_ca_rules(current_land_type, land_neighbors, total_neighbors,
+                new_land_type = self._apply_ca_rules(current_land_type, land_counts[i][j], total_counts[i][j],
                                                    exp_threshold, ero_probability)
 
                 # Add enhanced noise if enabled
                 noise_prob = self.noise_probability
 
                 # Boost noise at land/water boundaries for more fractal variation
-                if self.edge_noise_boost and self._is_at_boundary(chunks, chunk_x, chunk_y, min_x, min_y, max_x, max_y):
+                if at_boundary is not None and at_boundary[i][j]:
                     noise_prob = self.edge_noise_probability
 
                 if self.add_noise and self.rng.random() < noise_prob:
@@ -281,53 +305,6 @@ class ZoomLayer(GenerationLayer):
 
         return new_chunks
 
-    def _count_land_neighbors(self, chunks: Dict[Tuple[int, int], Dict[str, Any]],
-                            chunk_x: int, chunk_y: int, min_x: int, min_y: int, max_x: int, max_y: int) -> int:
-        """Count the number of land neighbors around a chunk."""
-        land_count = 0
-
-        # Define neighborhood (Moore or Von Neumann)
-        if self.use_moore_neighborhood:
-            # 8-neighbor Moore neighborhood
-            offsets = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        else:
-            # 4-neighbor Von Neumann neighborhood
-            offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        for dx, dy in offsets:
-            neighbor_x = chunk_x + dx
-            neighbor_y = chunk_y + dy
-
-            # Handle boundaries - treat out-of-bounds as water
-            if neighbor_x < min_x or neighbor_x > max_x or neighbor_y < min_y or neighbor_y > max_y:
-                continue
-
-            neighbor_key = (neighbor_x, neighbor_y)
-            if neighbor_key in chunks:
-                neighbor_land_type = chunks[neighbor_key].get('land_type', 'water')
-                if neighbor_land_type == 'land':
-                    land_count += 1
-
-        return land_count
-
-    def _count_total_neighbors(self, chunk_x: int, chunk_y: int, min_x: int, min_y: int, max_x: int, max_y: int) -> int:
-        """Count the total number of valid neighbors (within bounds)."""
-        total_count = 0
-
-        if self.use_moore_neighborhood:
-            offsets = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        else:
-            offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        for dx, dy in offsets:
-            neighbor_x = chunk_x + dx
-            neighbor_y = chunk_y + dy
-
-            if min_x <= neighbor_x <= max_x and min_y <= neighbor_y <= max_y:
-                total_count += 1
-
-        return total_count
-
     def _apply_ca_rules(self, current_land_type: str, land_neighbors: int, total_neighbors: int,
                        expansion_threshold: int, erosion_probability: float) -> str:
         """
@@ -454,36 +431,6 @@ class ZoomLayer(GenerationLayer):
 
         return region
 
-    def _is_at_boundary(self, chunks: Dict[Tuple[int, int], Dict[str, Any]],
-                       chunk_x: int, chunk_y: int, min_x: int, min_y: int, max_x: int, max_y: int) -> bool:
-        """
-        Check if a chunk is at a land/water boundary.
-
-        Returns:
-            True if the chunk has both land and water neighbors
-        """
-        current_chunk = chunks.get((chunk_x, chunk_y))
-        if not current_chunk:
-            return False
-
-        current_land_type = current_chunk.get('land_type', 'water')
-
-        # Check neighbors for different land type
-        offsets = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-
-        for dx, dy in offsets:
-            neighbor_x = chunk_x + dx
-            neighbor_y = chunk_y + dy
-
-            if min_x <= neighbor_x <= max_x and min_y <= neighbor_y <= max_y:
-                neighbor_key = (neighbor_x, neighbor_y)
-                if neighbor_key in chunks:
-                    neighbor_land_type = chunks[neighbor_key].get('land_type', 'water')
-                    if neighbor_land_type != current_land_type:
-                        return True
-
-        return False
-
     def _apply_fractal_perturbation(self, chunks: Dict[Tuple[int, int], Dict[str, Any]],
                                    min_x: int, min_y: int, max_x: int, max_y: int) -> Dict[Tuple[int, int], Dict[str, Any]]:
         """
@@ -6,14 +6,19 @@ Defines message types for communication between the main thread (rendering)
 and the world generation worker thread via thread-safe queues.
 """
 
+import heapq
+import itertools
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 
 
 class MessageType(Enum):
     """Types of messages that can be sent between threads."""
     CHUNK_REQUEST = "chunk_request"
+    CHUNK_REQUEST_BATCH = "chunk_request_batch"
     CHUNK_RESPONSE = "chunk_response"
     CHUNK_CANCEL = "chunk_cancel"
     STATUS_UPDATE = "status_update"
@@ -21,14 +26,25 @@ class MessageType(Enum):
 
 
 class Priority(Enum):
-    """Priority levels for chunk generation requests."""
-    LOW = 1
-    NORMAL = 2
+    """
+    Priority levels for chunk generation requests.
+
+    Values are the worker queue's sort keys (lower = served first), leaving
+    0 and 1 for shutdown and cancel messages.
+    """
+    URGENT = 2
     HIGH = 3
-    URGENT = 4
+    NORMAL = 4
+    LOW = 5
+
 
+# Worker queue sort keys for messages that are not chunk requests
+SHUTDOWN_QUEUE_PRIORITY = 0
+CANCEL_QUEUE_PRIORITY = 1
+DEFAULT_QUEUE_PRIORITY = 6
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ChunkRequest:
     """Request to generate a specific chunk."""
     chunk_x: int
@@ -38,22 +54,29 @@ class ChunkRequest:
     
     def __post_init__(self):
         if self.request_id is None:
-            self.request_id = f"chunk_{self.chunk_x}_{self.chunk_y}"
+            # Frozen dataclass: assign through object to fill in the default id
+            object.__setattr__(self, 'request_id', f"chunk_{self.chunk_x}_{self.chunk_y}")
+
 
+@dataclass(frozen=True, slots=True)
+class ChunkRequestBatch:
+    """Several chunk requests of the same priority sent as one message."""
+    requests: Tuple[ChunkRequest, ...]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ChunkResponse:
     """Response containing generated chunk data."""
     chunk_x: int
     chunk_y: int
-    chunk_data: Dict[str, Any]
+    chunk_data: Any  # The generated RenderChunk, or None on failure
     request_id: str
     generation_time: float
     success: bool = True
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChunkCancel:
     """Request to cancel chunk generation."""
     chunk_x: int
@@ -61,7 +84,7 @@ class ChunkCancel:
     request_id: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatusUpdate:
     """Status update from worker thread."""
     message: str
@@ -71,56 +94,71 @@ class StatusUpdate:
     cache_size: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShutdownMessage:
     """Signal to shutdown worker thread."""
     reason: str = "Normal shutdown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Message:
-    """Wrapper for all message types with metadata."""
+    """
+    Wrapper for all message types with metadata.
+
+    Messages compare and hash by identity; each one is a distinct event.
+    """
     message_type: MessageType
     payload: Any
     timestamp: float
     sender: str
+    queue_priority: int = DEFAULT_QUEUE_PRIORITY  # Worker queue sort key (lower = higher priority)
 
     def __lt__(self, other):
         """Enable comparison for priority queue."""
         if not isinstance(other, Message):
             return NotImplemented
         return self.timestamp < other.timestamp
-
-    def __eq__(self, other):
-        """Enable equality comparison."""
-        if not isinstance(other, Message):
-            return NotImplemented
-        return (self.message_type == other.message_type and
-                self.timestamp == other.timestamp and
-                self.sender == other.sender)
-
-    def __hash__(self):
-        """Enable hashing for use in sets."""
-        return hash((self.message_type, self.timestamp, self.sender))
     
     @classmethod
     def chunk_request(cls, chunk_x: int, chunk_y: int, priority: Priority = Priority.NORMAL, 
-                     sender: str = "main") -> 'Message':
-        """Create a chunk request message."""
-        import time
+                     sender: str = "main", now: Optional[float] = None) -> 'Message':
+        """
+        Create a chunk request message.
+
+        Args:
+            now: Timestamp to use, so a batch of requests can share one clock read
+        """
         return cls(
             message_type=MessageType.CHUNK_REQUEST,
             payload=ChunkRequest(chunk_x, chunk_y, priority),
-            timestamp=time.time(),
-            sender=sender
+            timestamp=time.time() if now is None else now,
+            sender=sender,
+            queue_priority=priority.value
+        )
+    
+    @classmethod
+    def chunk_request_batch(cls, chunks: Sequence[Tuple[int, int]], priority: Priority = Priority.NORMAL,
+                            sender: str = "main", now: Optional[float] = None) -> 'Message':
+        """
+        Create one message requesting several chunks at the same priority.
+
+        Args:
+            chunks: Chunk coordinates, in the order they should be generated
+            now: Timestamp to use, so a batch of requests can share one clock read
+        """
+        return cls(
+            message_type=MessageType.CHUNK_REQUEST_BATCH,
+            payload=ChunkRequestBatch(tuple(ChunkRequest(chunk_x, chunk_y, priority) for chunk_x, chunk_y in chunks)),
+            timestamp=time.time() if now is None else now,
+            sender=sender,
+            queue_priority=priority.value
         )
     
     @classmethod
-    def chunk_response(cls, chunk_x: int, chunk_y: int, chunk_data: Dict[str, Any],
+    def chunk_response(cls, chunk_x: int, chunk_y: int, chunk_data: Any,
                       request_id: str, generation_time: float, success: bool = True,
                       error_message: Optional[str] = None, sender: str = "worker") -> 'Message':
         """Create a chunk response message."""
-        import time
         return cls(
             message_type=MessageType.CHUNK_RESPONSE,
             payload=ChunkResponse(chunk_x, chunk_y, chunk_data, request_id, 
@@ -133,19 +171,18 @@ class Message:
     def chunk_cancel(cls, chunk_x: int, chunk_y: int, request_id: str, 
                     sender: str = "main") -> 'Message':
         """Create a chunk cancel message."""
-        import time
         return cls(
             message_type=MessageType.CHUNK_CANCEL,
             payload=ChunkCancel(chunk_x, chunk_y, request_id),
             timestamp=time.time(),
-            sender=sender
+            sender=sender,
+            queue_priority=CANCEL_QUEUE_PRIORITY
         )
     
     @classmethod
     def status_update(cls, message: str, worker_id: str, chunks_in_queue: int,
                      chunks_generated: int, cache_size: int, sender: str = "worker") -> 'Message':
         """Create a status update message."""
-        import time
         return cls(
             message_type=MessageType.STATUS_UPDATE,
             payload=StatusUpdate(message, worker_id, chunks_in_queue, chunks_generated, cache_size),
@@ -156,12 +193,12 @@ class Message:
     @classmethod
     def shutdown(cls, reason: str = "Normal shutdown", sender: str = "main") -> 'Message':
         """Create a shutdown message."""
-        import time
         return cls(
             message_type=MessageType.SHUTDOWN,
             payload=ShutdownMessage(reason),
             timestamp=time.time(),
-            sender=sender
+            sender=sender,
+            queue_priority=SHUTDOWN_QUEUE_PRIORITY
         )
 
 
@@ -169,7 +206,9 @@ class MessageBus:
     """
     Thread-safe message bus for communication between main and worker threads.
     
-    Uses Python's queue.Queue for thread-safe message passing.
+    Worker-bound messages go through a heap guarded by a single lock, with an
+    event to wake the worker when it is empty; messages to the main thread use
+    a queue.Queue.
     """
     
     def __init__(self, max_queue_size: int = 1000):
@@ -181,8 +220,15 @@ class MessageBus:
         """
         import queue
         
-        # Queue for messages from main thread to worker thread
-        self.to_worker = queue.PriorityQueue(maxsize=max_queue_size)
+        # Heap of (priority, sequence, message) from main thread to worker thread.
+        # Main is the only producer and the worker the only consumer, so one plain
+        # lock plus a "not empty" event replaces PriorityQueue's condition variables
+        self._to_worker_heap = []
+        self._to_worker_lock = threading.Lock()
+        self._to_worker_ready = threading.Event()
+        self._to_worker_max_size = max_queue_size
+        # Send order, breaking ties between equal priorities (timestamps may be shared)
+        self._send_sequence = itertools.count()
         
         # Queue for messages from worker thread to main thread
         self.to_main = queue.Queue(maxsize=max_queue_size)
@@ -191,22 +237,27 @@ class MessageBus:
         self.messages_sent = 0
         self.messages_received = 0
     
-    def send_to_worker(self, message: Message, block: bool = True, timeout: Optional[float] = None):
+    def send_to_worker(self, message: Message) -> bool:
         """
-        Send a message to the worker thread.
-        
+        Send a message to the worker thread without blocking.
+
+        The message is dropped (and reported) if the worker queue is full.
+
         Args:
             message: Message to send
-            block: Whether to block if queue is full
-            timeout: Timeout for blocking operations
+
+        Returns:
+            True if the message was queued, False if it was dropped
         """
-        try:
-            # Use priority based on message type and payload priority
-            priority = self._get_message_priority(message)
-            self.to_worker.put((priority, message), block=block, timeout=timeout)
-            self.messages_sent += 1
-        except Exception as e:
-            print(f"Failed to send message to worker: {e}")
+        with self._to_worker_lock:
+            if len(self._to_worker_heap) >= self._to_worker_max_size:
+                print(f"Failed to send message to worker: queue full ({self._to_worker_max_size} messages)")
+                return False
+            heapq.heappush(self._to_worker_heap,
+                           (message.queue_priority, next(self._send_sequence), message))
+            self._to_worker_ready.set()
+        self.messages_sent += 1
+        return True
     
     def send_to_main(self, message: Message, block: bool = True, timeout: Optional[float] = None):
         """
@@ -223,31 +274,38 @@ class MessageBus:
         except Exception as e:
             print(f"Failed to send message to main: {e}")
     
-    def receive_from_worker(self, block: bool = False, timeout: Optional[float] = None) -> Optional[Message]:
+    def drain_to_main(self, max_messages: int = 64) -> List[Message]:
         """
-        Receive a message from the worker thread.
+        Receive up to max_messages queued messages from the worker thread at once.
+
+        Takes the queue lock a single time for the whole batch instead of once
+        per message, so the main thread does not contend with the worker on
+        every item during bursts of completed chunks.
 
         Args:
-            block: Whether to block waiting for message
-            timeout: Timeout for blocking operations
+            max_messages: Maximum number of messages to take
 
         Returns:
-            Message if available, None otherwise
+            List of messages in arrival order (empty if none are queued)
         """
-        import queue
-        try:
-            message = self.to_main.get(block=block, timeout=timeout)
-            self.messages_received += 1
-            return message
-        except queue.Empty:
-            return None
-        except Exception as e:
-            print(f"Failed to receive message from worker: {e}")
-            return None
-    
+        to_main = self.to_main
+        if not to_main.queue:
+            # Steady state once chunks are loaded: skip the lock when nothing is queued
+            return []
+        with to_main.mutex:
+            count = min(max_messages, len(to_main.queue))
+            messages = [to_main.queue.popleft() for _ in range(count)]
+            if count:
+                # Wake producers blocked on a full queue, as Queue.get would
+                to_main.not_full.notify(count)
+        self.messages_received += count
+        return messages
+
     def receive_from_main(self, block: bool = True, timeout: Optional[float] = None) -> Optional[Message]:
         """
-        Receive a message from the main thread.
+        Receive the highest priority message from the main thread.
+
+        Must only be called from the single worker thread.
 
         Args:
             block: Whether to block waiting for message
@@ -256,42 +314,29 @@ class MessageBus:
         Returns:
             Message if available, None otherwise
         """
-        import queue
-        try:
-            _priority, message = self.to_worker.get(block=block, timeout=timeout)
+        message = self._pop_to_worker()
+        if message is None and block and self._to_worker_ready.wait(timeout):
+            message = self._pop_to_worker()
+        if message is not None:
             self.messages_received += 1
+        return message
+
+    def _pop_to_worker(self) -> Optional[Message]:
+        """Pop the next worker-bound message, or None if there is none."""
+        with self._to_worker_lock:
+            heap = self._to_worker_heap
+            if not heap:
+                return None
+            _priority, _sequence, message = heapq.heappop(heap)
+            if not heap:
+                self._to_worker_ready.clear()
             return message
-        except queue.Empty:
-            return None
-        except Exception as e:
-            print(f"Failed to receive message from main: {e}")
-            return None
-    
-    def _get_message_priority(self, message: Message) -> int:
-        """Get numeric priority for message (lower number = higher priority)."""
-        if message.message_type == MessageType.SHUTDOWN:
-            return 0  # Highest priority
-        elif message.message_type == MessageType.CHUNK_CANCEL:
-            return 1  # High priority
-        elif message.message_type == MessageType.CHUNK_REQUEST:
-            # Use request priority
-            if hasattr(message.payload, 'priority'):
-                priority_map = {
-                    Priority.URGENT: 2,
-                    Priority.HIGH: 3,
-                    Priority.NORMAL: 4,
-                    Priority.LOW: 5
-                }
-                return priority_map.get(message.payload.priority, 4)
-            return 4  # Normal priority
-        else:
-            return 6  # Low priority
     
     def get_stats(self) -> Dict[str, int]:
         """Get message bus statistics."""
         return {
             'messages_sent': self.messages_sent,
             'messages_received': self.messages_received,
-            'to_worker_size': self.to_worker.qsize(),
+            'to_worker_size': len(self._to_worker_heap),
             'to_main_size': self.to_main.qsize()
         }
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
 import random
 
+import numpy as np
+
 
 @dataclass
 class GenerationData:
@@ -59,6 +61,54 @@ class GenerationData:
         return chunk[property_name]
 
 
+def build_land_grid(chunks: Dict[Tuple[int, int], Dict[str, Any]],
+                    bounds: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build dense structure-of-arrays masks for the chunks inside bounds.
+
+    Layers that need neighbourhood information can work on these masks with
+    vectorized numpy operations instead of per-chunk dictionary lookups.
+
+    Args:
+        chunks: Mapping of (chunk_x, chunk_y) to chunk data
+        bounds: (min_chunk_x, min_chunk_y, max_chunk_x, max_chunk_y)
+
+    Returns:
+        Tuple of (land, present) boolean arrays indexed [x - min_x, y - min_y]
+    """
+    min_x, min_y, max_x, max_y = bounds
+    shape = (max_x - min_x + 1, max_y - min_y + 1)
+    land = np.zeros(shape, dtype=bool)
+    present = np.zeros(shape, dtype=bool)
+
+    for (chunk_x, chunk_y), chunk in chunks.items():
+        if min_x <= chunk_x <= max_x and min_y <= chunk_y <= max_y:
+            present[chunk_x - min_x, chunk_y - min_y] = True
+            if chunk.get('land_type', 'water') == 'land':
+                land[chunk_x - min_x, chunk_y - min_y] = True
+
+    return land, present
+
+
+def count_neighbors(mask: np.ndarray, offsets: List[Tuple[int, int]]) -> np.ndarray:
+    """
+    Count set cells around every cell of a mask, treating out-of-bounds as unset.
+
+    Args:
+        mask: Boolean array indexed [x, y]
+        offsets: Neighbourhood offsets as (dx, dy) pairs
+
+    Returns:
+        Integer array with the number of set neighbours per cell
+    """
+    width, height = mask.shape
+    padded = np.pad(mask, 1).astype(np.uint8)
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dx, dy in offsets:
+        counts += padded[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+    return counts
+
+
 class GenerationLayer(ABC):
     """
     Base class for all generation layers.
@@ -6,9 +6,15 @@ Generates chunks in a spiral pattern outward from the cursor position,
 similar to Minecraft's chunk loading system.
 """
 
-from typing import List, Tuple, Set, Iterator
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Set, Iterator
 import math
 
+import numpy as np
+
+# Number of recent (center, radius) spirals kept, enough for back-and-forth movement
+SPIRAL_RESULT_CACHE_SIZE = 8
+
 
 class SpiralChunkGenerator:
     """
@@ -27,84 +33,88 @@ class SpiralChunkGenerator:
             max_radius: Maximum radius in chunks to generate
         """
         self.max_radius = max_radius
-        self._spiral_cache = {}  # Cache spiral patterns for different radii
+        self._spiral_cache = {}  # radius -> (dx, dy) offset arrays in spiral order
+        self._distance_order_cache = {}  # radius -> (dx, dy) offset arrays by squared distance
+        # (center_x, center_y, radius) -> spiral tuple, least recently used first
+        self._spiral_result_cache: OrderedDict[Tuple[int, int, int], Tuple[Tuple[int, int], ...]] = OrderedDict()
     
     def generate_spiral(self, center_chunk_x: int, center_chunk_y: int, 
-                       radius: int) -> List[Tuple[int, int]]:
+                       radius: int) -> Tuple[Tuple[int, int], ...]:
         """
         Generate chunk coordinates in a spiral pattern around the center.
         
+        Recent results are kept, so returning to a recent center reuses its
+        spiral; the tuple is shared between callers.
+        
         Args:
             center_chunk_x: Center chunk X coordinate
             center_chunk_y: Center chunk Y coordinate
             radius: Maximum radius in chunks
             
         Returns:
-            List of chunk coordinates in spiral order (closest first)
+            Tuple of chunk coordinates in spiral order (closest first)
         """
-        if radius in self._spiral_cache:
-            # Use cached spiral pattern and offset it
-            cached_spiral = self._spiral_cache[radius]
-            return [(center_chunk_x + dx, center_chunk_y + dy) for dx, dy in cached_spiral]
-        
-        # Generate new spiral pattern
-        spiral_offsets = self._generate_spiral_offsets(radius)
-        self._spiral_cache[radius] = spiral_offsets
-        
-        # Apply offsets to center position
-        return [(center_chunk_x + dx, center_chunk_y + dy) for dx, dy in spiral_offsets]
+        key = (center_chunk_x, center_chunk_y, radius)
+        spiral = self._spiral_result_cache.get(key)
+        if spiral is not None:
+            self._spiral_result_cache.move_to_end(key)
+            return spiral
+        
+        xs, ys = self.generate_spiral_arrays(center_chunk_x, center_chunk_y, radius)
+        spiral = tuple(zip(xs.tolist(), ys.tolist()))
+        self._spiral_result_cache[key] = spiral
+        if len(self._spiral_result_cache) > SPIRAL_RESULT_CACHE_SIZE:
+            self._spiral_result_cache.popitem(last=False)
+        return spiral
     
-    def _generate_spiral_offsets(self, radius: int) -> List[Tuple[int, int]]:
-        """
-        Generate spiral offset pattern from (0,0).
-        
-        Uses a square spiral algorithm that prioritizes chunks by distance.
+    def generate_spiral_arrays(self, center_chunk_x: int, center_chunk_y: int,
+                               radius: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        if radius <= 0:
-            return [(0, 0)]
+        Generate spiral chunk coordinates as parallel x/y arrays.
         
-        offsets = [(0, 0)]  # Start with center
-        
-        # Generate spiral layer by layer
-        for layer in range(1, radius + 1):
-            layer_offsets = self._generate_layer_offsets(layer)
+        Args:
+            center_chunk_x: Center chunk X coordinate
+            center_chunk_y: Center chunk Y coordinate
+            radius: Maximum radius in chunks
             
-            # Sort by distance from center for this layer
-            layer_offsets.sort(key=lambda pos: self._distance_squared(pos[0], pos[1]))
-            offsets.extend(layer_offsets)
-        
-        return offsets
+        Returns:
+            Tuple of (xs, ys) arrays in spiral order (closest first)
+        """
+        # Apply offsets to center position with two vectorized adds
+        dx, dy = self._get_spiral_offsets(radius)
+        return dx + center_chunk_x, dy + center_chunk_y
     
-    def _generate_layer_offsets(self, layer: int) -> List[Tuple[int, int]]:
-        """Generate all offsets for a specific layer of the spiral."""
-        offsets = []
-        
-        # Top edge (left to right)
-        for x in range(-layer, layer + 1):
-            offsets.append((x, -layer))
-        
-        # Right edge (top to bottom, excluding corners)
-        for y in range(-layer + 1, layer):
-            offsets.append((layer, y))
-        
-        # Bottom edge (right to left, excluding right corner)
-        if layer > 0:
-            for x in range(layer, -layer - 1, -1):
-                offsets.append((x, layer))
-        
-        # Left edge (bottom to top, excluding corners)
-        for y in range(layer - 1, -layer, -1):
-            offsets.append((-layer, y))
-        
+    def _get_spiral_offsets(self, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the cached spiral offsets of a radius, generating them on first use."""
+        offsets = self._spiral_cache.get(radius)
+        if offsets is None:
+            offsets = self._generate_spiral_offsets(radius)
+            self._spiral_cache[radius] = offsets
         return offsets
     
-    def _distance_squared(self, x: int, y: int) -> float:
-        """Calculate squared distance from origin (for sorting)."""
-        return x * x + y * y
+    def _generate_spiral_offsets(self, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate spiral offset pattern from (0,0) as parallel dx/dy arrays.
+        
+        Orders the (2r+1)x(2r+1) square layer by layer (Chebyshev ring), and
+        by squared distance from the center within each layer, using a single
+        NumPy sort over the whole square.
+        """
+        radius = max(radius, 0)
+        axis = np.arange(-radius, radius + 1, dtype=np.int64)
+        dx, dy = np.meshgrid(axis, axis, indexing='xy')
+        dx = dx.ravel()
+        dy = dy.ravel()
+        layer = np.maximum(np.abs(dx), np.abs(dy))
+        distance_squared = dx * dx + dy * dy
+        
+        # lexsort sorts by the last key first: layer, then distance within a layer
+        order = np.lexsort((distance_squared, layer))
+        return dx[order], dy[order]
     
     def get_new_chunks_for_movement(self, old_center: Tuple[int, int], 
                                    new_center: Tuple[int, int], 
-                                   radius: int) -> List[Tuple[int, int]]:
+                                   radius: int, limit: Optional[int] = None) -> List[Tuple[int, int]]:
         """
         Get only the new chunks needed when moving from old_center to new_center.
         
@@ -115,6 +125,7 @@ class SpiralChunkGenerator:
             old_center: Previous center chunk coordinates
             new_center: New center chunk coordinates  
             radius: Chunk loading radius
+            limit: Return only this many of the closest new chunks
             
         Returns:
             List of new chunk coordinates needed, in spiral order
@@ -122,24 +133,26 @@ class SpiralChunkGenerator:
         if old_center == new_center:
             return []  # No movement, no new chunks needed
         
-        # Get all chunks for old and new positions
-        old_chunks = set(self.generate_spiral(old_center[0], old_center[1], radius))
-        new_chunks = set(self.generate_spiral(new_center[0], new_center[1], radius))
+        dx, dy = self._get_distance_ordered_offsets(radius)
         
-        # Find chunks that are new (in new set but not in old set)
-        new_chunk_coords = new_chunks - old_chunks
+        # Only offsets landing outside the old square are new; the offsets are
+        # already ordered by distance, so masking keeps them closest first
+        is_new = ((np.abs(dx + (new_center[0] - old_center[0])) > radius) |
+                  (np.abs(dy + (new_center[1] - old_center[1])) > radius))
+        new_dx = dx[is_new][:limit]
+        new_dy = dy[is_new][:limit]
         
-        if not new_chunk_coords:
-            return []
-        
-        # Sort new chunks by distance from new center (spiral order)
-        new_chunks_list = list(new_chunk_coords)
-        new_chunks_list.sort(key=lambda chunk: self._distance_squared(
-            chunk[0] - new_center[0], 
-            chunk[1] - new_center[1]
-        ))
-        
-        return new_chunks_list
+        return list(zip((new_dx + new_center[0]).tolist(), (new_dy + new_center[1]).tolist()))
+    
+    def _get_distance_ordered_offsets(self, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the spiral offsets of a radius reordered by squared distance alone."""
+        offsets = self._distance_order_cache.get(radius)
+        if offsets is None:
+            dx, dy = self._get_spiral_offsets(radius)
+            order = np.argsort(dx * dx + dy * dy, kind='stable')
+            offsets = (dx[order], dy[order])
+            self._distance_order_cache[radius] = offsets
+        return offsets
     
     def get_chunks_to_unload(self, old_center: Tuple[int, int], 
                             new_center: Tuple[int, int], 
@@ -159,16 +172,66 @@ class SpiralChunkGenerator:
         if old_center == new_center:
             return []
         
-        # Get chunks that were loaded at old position
-        old_chunks = set(self.generate_spiral(old_center[0], old_center[1], radius))
+        # Chunks to unload are those loaded at the old position that fall outside
+        # the square kept around the new position (with unload buffer)
+        return self._square_difference(old_center, radius, new_center, unload_radius)
+    
+    def get_deltas(self, new_center: Tuple[int, int], radius: int, unload_radius: int,
+                   currently_loaded: Set[Tuple[int, int]]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Get the chunks to load and unload for a new center from the loaded set.
+        
+        Unlike comparing the old and new squares, this also unloads chunks that
+        drifted out of range over several small moves.
+        
+        Args:
+            new_center: New center chunk coordinates
+            radius: Chunk loading radius
+            unload_radius: Distance at which to unload chunks
+            currently_loaded: Chunks loaded before the move
+            
+        Returns:
+            Tuple of (chunks_to_load closest first, chunks_to_unload)
+        """
+        center_x, center_y = new_center
+        dx, dy = self._get_distance_ordered_offsets(radius)
+        to_load = [chunk for chunk in zip((dx + center_x).tolist(), (dy + center_y).tolist())
+                   if chunk not in currently_loaded]
         
-        # Get chunks that should stay loaded at new position (with unload buffer)
-        keep_chunks = set(self.generate_spiral(new_center[0], new_center[1], unload_radius))
+        to_unload = [chunk for chunk in currently_loaded
+                     if abs(chunk[0] - center_x) > unload_radius or abs(chunk[1] - center_y) > unload_radius]
         
-        # Chunks to unload are those that were loaded but are now too far
-        unload_chunks = old_chunks - keep_chunks
+        return to_load, to_unload
+    
+    def _square_difference(self, center: Tuple[int, int], radius: int,
+                           other_center: Tuple[int, int], other_radius: int) -> List[Tuple[int, int]]:
+        """
+        Get the chunks of the square around center that lie outside the square around other_center.
         
-        return list(unload_chunks)
+        Walks only the rows and columns outside the overlap of the two squares
+        instead of building and differencing two full sets, so a one-chunk move
+        touches a single strip of chunks.
+        """
+        min_x, max_x = center[0] - radius, center[0] + radius
+        min_y, max_y = center[1] - radius, center[1] + radius
+        
+        # Overlap of the two squares (empty if either range is inverted)
+        overlap_min_x = max(min_x, other_center[0] - other_radius)
+        overlap_max_x = min(max_x, other_center[0] + other_radius)
+        overlap_min_y = max(min_y, other_center[1] - other_radius)
+        overlap_max_y = min(max_y, other_center[1] + other_radius)
+        if overlap_min_x > overlap_max_x or overlap_min_y > overlap_max_y:
+            return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+        
+        chunks = []
+        for x in range(min_x, max_x + 1):
+            if overlap_min_x <= x <= overlap_max_x:
+                # Column crosses the overlap: only the rows above and below it
+                chunks.extend((x, y) for y in range(min_y, overlap_min_y))
+                chunks.extend((x, y) for y in range(overlap_max_y + 1, max_y + 1))
+            else:
+                chunks.extend((x, y) for y in range(min_y, max_y + 1))
+        return chunks
 
 
 class ChunkLoadingManager:
@@ -206,16 +269,9 @@ class ChunkLoadingManager:
         Returns:
             Tuple of (chunks_to_generate, chunks_to_unload)
         """
-        old_center = self.current_center_chunk
-        
-        # Get new chunks needed (spiral order, closest first)
-        new_chunks = self.spiral_generator.get_new_chunks_for_movement(
-            old_center, new_center_chunk, self.load_radius
-        )
-        
-        # Get chunks to unload (too far away)
-        unload_chunks = self.spiral_generator.get_chunks_to_unload(
-            old_center, new_center_chunk, self.load_radius, self.unload_radius
+        # Compare against the loaded set: new chunks closest first, and chunks too far away
+        new_chunks, unload_chunks = self.spiral_generator.get_deltas(
+            new_center_chunk, self.load_radius, self.unload_radius, self.loaded_chunks
         )
         
         # Update state
@@ -247,9 +303,9 @@ class ChunkLoadingManager:
         )
         
         self.loaded_chunks = set(chunks)
-        return chunks
+        return list(chunks)
     
-    def get_generation_priority(self, chunk: Tuple[int, int]) -> float:
+    def get_generation_priority(self, chunk: Tuple[int, int]) -> int:
         """
         Get generation priority for a chunk (lower = higher priority).
         
@@ -257,11 +313,24 @@ class ChunkLoadingManager:
             chunk: Chunk coordinates
             
         Returns:
-            Priority value (distance from current center)
+            Priority value (squared distance from current center, which
+            orders chunks the same as the distance itself)
         """
         dx = chunk[0] - self.current_center_chunk[0]
         dy = chunk[1] - self.current_center_chunk[1]
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
+
+    def get_generation_distance(self, chunk: Tuple[int, int]) -> float:
+        """
+        Get the distance of a chunk from the current center.
+        
+        Args:
+            chunk: Chunk coordinates
+            
+        Returns:
+            Euclidean distance in chunks
+        """
+        return math.sqrt(self.get_generation_priority(chunk))
 
 
 # Example usage and testing
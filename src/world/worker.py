@@ -6,13 +6,17 @@ Runs world generation in a separate thread to avoid blocking the main rendering
 Communicates via message bus for smooth, responsive gameplay.
 """
 
+import heapq
+import itertools
 import threading
 import time
-from typing import Dict, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Sequence, Tuple
 from collections import OrderedDict
 
-from .messages import MessageBus, Message, MessageType, Priority
-from .dual_chunk_system import DualChunkManager, GenerationChunk, RenderChunk
+import numpy as np
+
+from .messages import MessageBus, Message, MessageType, Priority, ChunkRequest
+from .dual_chunk_system import DualChunkManager, GenerationChunk, RenderChunk, TILE_TYPE_NAMES, TILE_TYPE_IDS
 from .tier_manager import TierManager
 from .pipeline import GenerationData
 from ..config import WorldConfig
@@ -24,6 +28,9 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Chunks generated between status updates; a power of two so the check is a single mask
+STATUS_UPDATE_INTERVAL = 16
+
 # Define Tile class locally to avoid circular imports
 class Tile:
     """Represents a single tile in the world."""
@@ -80,18 +87,30 @@ class WorldGenerationWorker:
         self.final_generation_chunk_size = self.dual_chunk_manager.calculate_final_generation_chunk_size(
             world_config.chunk_size, world_config.pipeline_layers
         )
+        # Shared by the metadata of every generation chunk
+        self._pipeline_layers = tuple(world_config.pipeline_layers)
+        # Tile buffer reused by the generation chunks of each render chunk
+        self._tile_scratch = np.empty((self.final_generation_chunk_size, self.final_generation_chunk_size),
+                                      dtype=np.uint8)
 
         # Chunk management - now caches render chunks
         self.render_chunk_cache: OrderedDict[Tuple[int, int], RenderChunk] = OrderedDict()
         self.cache_limit = world_config.chunk_cache_limit
         
         # Request tracking
+        # Heap of (priority, sequence, ChunkRequest) received but not yet generated;
+        # batches are unpacked here so other messages can still overtake them
+        self._pending_requests: List[Tuple[int, int, ChunkRequest]] = []
+        self._pending_sequence = itertools.count()
+        # Pending copies of each request id; the default id names the chunk, so
+        # the same id can be queued more than once
+        self._pending_request_ids: Dict[str, int] = {}
         self.active_requests: Set[str] = set()
         self.cancelled_requests: Set[str] = set()
         
         # Statistics
         self.chunks_generated = 0
-        self.total_generation_time = 0.0
+        self.total_generation_time_ns = 0  # Integer accumulator, converted in get_statistics
         self.requests_processed = 0
         self.requests_cancelled = 0
     
@@ -118,7 +137,7 @@ class WorldGenerationWorker:
         
         # Send shutdown message
         shutdown_msg = Message.shutdown(f"Stop requested for {self.worker_id}")
-        self.message_bus.send_to_worker(shutdown_msg, block=False)
+        self.message_bus.send_to_worker(shutdown_msg)
         
         # Wait for thread to finish
         if self.thread and self.thread.is_alive():
@@ -134,18 +153,17 @@ class WorldGenerationWorker:
         
         while self.running:
             try:
-                # Receive message from main thread
-                message = self.message_bus.receive_from_main(block=True, timeout=1.0)
-                
-                if message is None:
+                # Take every queued message before generating the next chunk, and
+                # only wait for one when no requests are pending
+                message = self.message_bus.receive_from_main(block=not self._pending_requests, timeout=1.0)
+                if message is not None:
+                    self._process_message(message)
+                    continue
+
+                if not self._pending_requests:
                     continue  # Timeout, check if still running
-                
-                # Process message
-                self._process_message(message)
-                
-                # Send periodic status updates
-                if self.requests_processed % 10 == 0:
-                    self._send_status_update()
+
+                self._handle_next_pending_request()
                 
             except Exception as e:
                 # Log the error and terminate worker - no silent failures
@@ -161,7 +179,10 @@ class WorldGenerationWorker:
             self.running = False
             
         elif message.message_type == MessageType.CHUNK_REQUEST:
-            self._handle_chunk_request(message)
+            self._queue_chunk_requests((message.payload,))
+
+        elif message.message_type == MessageType.CHUNK_REQUEST_BATCH:
+            self._queue_chunk_requests(message.payload.requests)
             
         elif message.message_type == MessageType.CHUNK_CANCEL:
             self._handle_chunk_cancel(message)
@@ -169,25 +190,51 @@ class WorldGenerationWorker:
         else:
             print(f"Worker {self.worker_id} received unknown message type: {message.message_type}")
     
-    def _handle_chunk_request(self, message: Message):
+    def _queue_chunk_requests(self, requests: Sequence[ChunkRequest]):
+        """Add chunk requests to the pending heap, keeping their order within a priority."""
+        for request in requests:
+            # A new request for the chunk supersedes an earlier cancel
+            self.cancelled_requests.discard(request.request_id)
+            pending_ids = self._pending_request_ids
+            pending_ids[request.request_id] = pending_ids.get(request.request_id, 0) + 1
+            heapq.heappush(self._pending_requests,
+                           (request.priority.value, next(self._pending_sequence), request))
+
+    def _handle_next_pending_request(self):
+        """Generate the most urgent pending chunk request."""
+        _priority, _sequence, request = heapq.heappop(self._pending_requests)
+        pending_ids = self._pending_request_ids
+        remaining = pending_ids[request.request_id] - 1
+        if remaining:
+            pending_ids[request.request_id] = remaining
+        else:
+            del pending_ids[request.request_id]
+        self._handle_chunk_request(request)
+
+    def _handle_chunk_request(self, request: ChunkRequest):
         """Handle chunk generation with proper response"""
-        request = message.payload
         chunk_x, chunk_y = request.chunk_x, request.chunk_y
         request_id = request.request_id
 
-        # Check if request was cancelled
+        # Check if request was cancelled; the cancel covers every queued copy of
+        # the id, so it is only cleared once the last one is dropped
         if request_id in self.cancelled_requests:
-            self.cancelled_requests.discard(request_id)
+            if request_id not in self._pending_request_ids:
+                self.cancelled_requests.discard(request_id)
             self.requests_cancelled += 1
             return
 
         # Check if render chunk is already cached
         render_chunk_key = (chunk_x, chunk_y)
-        if render_chunk_key in self.render_chunk_cache:
+        render_chunk = self.render_chunk_cache.get(render_chunk_key)
+        if render_chunk is not None:
+            # Mark as most recently used so chunks revisited by the player stay cached
+            self.render_chunk_cache.move_to_end(render_chunk_key)
+
             # Send cached render chunk response immediately
             response = Message.chunk_response(
                 chunk_x, chunk_y,
-                {"status": "ready"},  # Minimal response data
+                render_chunk,
                 request_id,
                 0.0,
                 True, None, self.worker_id
@@ -197,21 +244,22 @@ class WorldGenerationWorker:
 
         # Generate render chunk by aggregating generation chunks
         self.active_requests.add(request_id)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Generate render chunk using dual chunk system
             render_chunk = self._generate_render_chunk(chunk_x, chunk_y)
-            generation_time = time.time() - start_time
+            generation_time_ns = time.perf_counter_ns() - start_ns
+            generation_time = generation_time_ns / 1e9
 
             # Cache the render chunk
             self.render_chunk_cache[render_chunk_key] = render_chunk
             self._enforce_cache_limit()
 
-            # Send success response immediately
+            # Send success response immediately, handing over the finished chunk
             response = Message.chunk_response(
                 chunk_x, chunk_y,
-                {"status": "ready"},  # Minimal response data
+                render_chunk,
                 request_id,
                 generation_time,
                 True, None, self.worker_id
@@ -220,31 +268,35 @@ class WorldGenerationWorker:
 
             # Update statistics
             self.chunks_generated += 1
-            self.total_generation_time += generation_time
+            self.total_generation_time_ns += generation_time_ns
 
         except Exception as e:
-            generation_time = time.time() - start_time
+            generation_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             # Send error response
             response = Message.chunk_response(
-                chunk_x, chunk_y, {}, request_id, generation_time, False, str(e), self.worker_id
+                chunk_x, chunk_y, None, request_id, generation_time, False, str(e), self.worker_id
             )
             self.message_bus.send_to_main(response, block=False)
 
         finally:
             self.active_requests.discard(request_id)
             self.requests_processed += 1
+            # Send periodic status updates; checked only here, where the count
+            # advances, so cache hits and cancels can't repeat an update
+            if not self.requests_processed & (STATUS_UPDATE_INTERVAL - 1):
+                self._send_status_update()
     
     def _handle_chunk_cancel(self, message: Message):
         """Handle a chunk cancellation request."""
         cancel = message.payload
         request_id = cancel.request_id
         
-        if request_id in self.active_requests:
-            # Mark as cancelled (can't stop generation in progress, but won't send response)
+        if request_id in self._pending_request_ids or request_id in self.active_requests:
+            # Mark as cancelled so the request is dropped when it leaves the pending
+            # heap instead of being generated (generation in progress can't be stopped);
+            # requests_cancelled is counted there, once per dropped request
             self.cancelled_requests.add(request_id)
-        
-        self.requests_cancelled += 1
     
     def _generate_render_chunk(self, render_chunk_x: int, render_chunk_y: int) -> RenderChunk:
         """
@@ -262,12 +314,12 @@ class WorldGenerationWorker:
             render_chunk_x, render_chunk_y, self.final_generation_chunk_size
         )
 
-        # Generate all required generation chunks
-        generation_chunks = []
-
-        for gen_chunk_x, gen_chunk_y in generation_chunk_coords:
-            gen_chunk = self._generate_generation_chunk(gen_chunk_x, gen_chunk_y)
-            generation_chunks.append(gen_chunk)
+        # Generate the generation chunks one at a time as they are aggregated;
+        # each is copied into the render chunk before the next reuses the buffer
+        generation_chunks = (
+            self._generate_generation_chunk(gen_chunk_x, gen_chunk_y, self._tile_scratch)
+            for gen_chunk_x, gen_chunk_y in generation_chunk_coords
+        )
 
         # Aggregate generation chunks into render chunk
         render_chunk = self.dual_chunk_manager.aggregate_generation_chunks(
@@ -276,22 +328,22 @@ class WorldGenerationWorker:
 
         return render_chunk
 
-    def _generate_generation_chunk(self, chunk_x: int, chunk_y: int) -> GenerationChunk:
+    def _generate_generation_chunk(self, chunk_x: int, chunk_y: int,
+                                   out: Optional[np.ndarray] = None) -> GenerationChunk:
         """
         Generate a single chunk using the TierManager pipeline system.
 
         Args:
             chunk_x: Chunk X coordinate
             chunk_y: Chunk Y coordinate
+            out: Tile buffer to fill and use as the chunk's tiles; a new array
+                is allocated when not given
 
         Returns:
             GenerationChunk containing chunk data and tile information
         """
-        # Calculate effective chunk size after zoom layers
-        effective_chunk_size = self.chunk_size
-        zoom_count = sum(1 for layer_name in self.world_config.pipeline_layers if layer_name == "zoom")
-        for _ in range(zoom_count):
-            effective_chunk_size //= 2
+        # Effective chunk size after zoom layers, fixed for the worker's pipeline
+        effective_chunk_size = self.final_generation_chunk_size
 
         # Calculate world bounds for this chunk
         min_world_x = chunk_x * effective_chunk_size
@@ -314,9 +366,6 @@ class WorldGenerationWorker:
         # Process through TierManager pipeline
         processed_data = self.tier_manager.process_tiers(generation_data, bounds)
 
-        # Extract tiles from processed data
-        chunk_tiles = {}
-
         # Get chunk data from the processed pipeline
         chunk_data = processed_data.get_chunk(chunk_x, chunk_y)
 
@@ -326,33 +375,26 @@ class WorldGenerationWorker:
                              f"Available data: {list(chunk_data.keys())}. "
                              f"TierManager configured: {self.tier_manager.is_configured()}")
 
-        # Use the land_type from the pipeline to generate tiles
+        # Use the chunk's land_type from the pipeline as the base tile type
         chunk_land_type = chunk_data['land_type']
-
-        for world_y in range(min_world_y, max_world_y + 1):
-            for world_x in range(min_world_x, max_world_x + 1):
-                # Use the chunk's land_type as the base tile type
-                tile_type = chunk_land_type
-
-                chunk_tiles[(world_x, world_y)] = {
-                    'tile_type': tile_type,
-                    'x': world_x,
-                    'y': world_y
-                }
+        if chunk_land_type not in TILE_TYPE_IDS:
+            raise KeyError(f"❌ Unknown tile type '{chunk_land_type}' for chunk ({chunk_x}, {chunk_y}). "
+                           f"Known types: {list(TILE_TYPE_NAMES)}")
+        chunk_tiles = out if out is not None else np.empty((effective_chunk_size, effective_chunk_size),
+                                                           dtype=np.uint8)
+        chunk_tiles.fill(TILE_TYPE_IDS[chunk_land_type])
 
         # Calculate chunk statistics for debugging
-        tile_types = [tile_data['tile_type'] for tile_data in chunk_tiles.values()]
-        tile_type_counts = {}
-        for tile_type in tile_types:
-            tile_type_counts[tile_type] = tile_type_counts.get(tile_type, 0) + 1
+        counts = np.bincount(chunk_tiles.ravel(), minlength=len(TILE_TYPE_NAMES)).tolist()
+        tile_type_counts = {name: count for name, count in zip(TILE_TYPE_NAMES, counts) if count}
 
         # Create GenerationChunk object
         metadata = {
             'world_bounds': (min_world_x, min_world_y, max_world_x, max_world_y),
             'tile_type_counts': tile_type_counts,
-            'total_tiles': len(chunk_tiles),
+            'total_tiles': chunk_tiles.size,
             'generated_at': time.time(),
-            'pipeline_layers': self.world_config.pipeline_layers.copy()
+            'pipeline_layers': self._pipeline_layers
         }
 
         return GenerationChunk(
@@ -366,7 +408,7 @@ class WorldGenerationWorker:
     def _enforce_cache_limit(self):
         """Enforce cache size limit using LRU eviction."""
         while len(self.render_chunk_cache) > self.cache_limit:
-            # Remove oldest render chunk (first in OrderedDict)
+            # Remove least recently used render chunk (first in OrderedDict)
             oldest_chunk = next(iter(self.render_chunk_cache))
             del self.render_chunk_cache[oldest_chunk]
     
@@ -394,15 +436,23 @@ class WorldGenerationWorker:
         chunk_key = (chunk_x, chunk_y)
         if chunk_key in self.render_chunk_cache:
             render_chunk = self.render_chunk_cache[chunk_key]
-            # Convert aggregated tiles to Tile objects
+            min_x, min_y, _, _ = render_chunk.get_world_bounds()
+            # Convert aggregated tile ids to Tile objects
             tiles = {}
-            for (world_x, world_y), tile_type in render_chunk.aggregated_tiles.items():
-                tiles[(world_x, world_y)] = Tile(world_x, world_y, tile_type)
+            for (local_y, local_x), tile_id in np.ndenumerate(render_chunk.aggregated_tiles):
+                world_x, world_y = min_x + local_x, min_y + local_y
+                tiles[(world_x, world_y)] = Tile(world_x, world_y, TILE_TYPE_NAMES[tile_id])
             return tiles
         return {}
 
-    def request_chunk(self, chunk_x: int, chunk_y: int, request_id: Optional[str] = None, priority=None):
-        """Request a chunk to be generated."""
+    def request_chunks(self, chunks: Sequence[Tuple[int, int]], priority: Priority,
+                       now: Optional[float] = None) -> bool:
+        """Request several chunks at the same priority with a single message. Returns False if it was dropped."""
+        request_msg = Message.chunk_request_batch(chunks, priority, "main", now=now)
+        return self.message_bus.send_to_worker(request_msg)
+
+    def request_chunk(self, chunk_x: int, chunk_y: int, request_id: Optional[str] = None, priority=None) -> bool:
+        """Request a chunk to be generated. Returns False if the request was dropped."""
         if request_id is None:
             import uuid
             request_id = str(uuid.uuid4())
@@ -414,12 +464,13 @@ class WorldGenerationWorker:
         # Create chunk request message
         from .messages import Message
         request_msg = Message.chunk_request(chunk_x, chunk_y, priority, "main")
-        self.message_bus.send_to_worker(request_msg, block=False)
+        return self.message_bus.send_to_worker(request_msg)
 
     def get_statistics(self) -> Dict:
         """Get worker statistics."""
+        total_generation_time = self.total_generation_time_ns / 1e9
         avg_generation_time = (
-            self.total_generation_time / max(1, self.chunks_generated)
+            total_generation_time / max(1, self.chunks_generated)
         )
 
         return {
@@ -431,5 +482,5 @@ class WorldGenerationWorker:
             'cache_size': len(self.render_chunk_cache),
             'active_requests': len(self.active_requests),
             'avg_generation_time': avg_generation_time,
-            'total_generation_time': self.total_generation_time
+            'total_generation_time': total_generation_time
         }
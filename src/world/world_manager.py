@@ -6,12 +6,38 @@ Provides world generation using the TierManager pipeline system.
 """
 
 import threading
+import time
+from enum import IntEnum
 from typing import Dict, Any, Tuple, Optional, Set
+
+import numpy as np
+
 from ..config import WorldConfig
 from .worker import WorldGenerationWorker, Tile
 from .tier_manager import TierManager
-from .dual_chunk_system import DualChunkManager
-from .messages import MessageBus
+from .dual_chunk_system import DualChunkManager, TILE_TYPE_NAMES
+from .messages import MessageBus, MessageType, Priority
+from .spiral_generator import SpiralChunkGenerator
+
+
+# Access counts are halved for every cached chunk once any count reaches this
+CHUNK_ACCESS_COUNT_MAX = 255
+# Starting count of a newly cached chunk. Visible chunks are touched every frame,
+# so starting at 1 would make a preloaded chunk that arrived off-screen the first
+# victim; it starts as warm as a hot chunk just after a decay and ages from there
+NEW_CHUNK_ACCESS_COUNT = CHUNK_ACCESS_COUNT_MAX >> 1
+
+# Tile id of tiles whose chunk is not loaded yet in grids from get_tile_ids,
+# one past the generated tile types
+LOADING_TILE_ID = len(TILE_TYPE_NAMES)
+# Tile type name of each tile id in grids from get_tile_ids
+GRID_TILE_TYPE_NAMES: Tuple[str, ...] = TILE_TYPE_NAMES + ("loading",)
+
+
+class ChunkState(IntEnum):
+    """Loading state of a render chunk tracked by the world manager."""
+    LOADING = 1  # Requested from the worker, not generated yet
+    READY = 2    # Generated; its tile id grid is in the world manager's tile cache
 
 
 class WorldManager:
@@ -19,11 +45,28 @@ class WorldManager:
     Advanced world manager that uses the TierManager pipeline system.
     """
 
+    # Fixed attribute layout: these are read on every get_tile/update_chunks call
+    __slots__ = (
+        'config', '_lock', '_chunk_shift', '_chunk_mask',
+        'dual_chunk_manager', 'message_bus', 'tier_manager', 'worker',
+        'tile_cache', '_chunk_access_counts', '_last_chunk_coords', '_last_chunk_tiles',
+        '_tile_protos', '_loading_tile', 'chunk_states', '_last_update_key', '_spiral',
+        'cache_hits', 'cache_misses', 'chunks_requested', 'chunks_received',
+        '_message_handlers',
+    )
+
     def __init__(self, world_config: WorldConfig):
         """Initialize the world manager with pipeline system."""
         self.config = world_config
         self._lock = threading.Lock()
 
+        # Chunk sizes are powers of two so tile lookups can shift and mask
+        chunk_size = world_config.chunk_size
+        if chunk_size <= 0 or chunk_size & (chunk_size - 1):
+            raise ValueError(f"❌ 'world.chunk_size' must be a power of two, got {chunk_size}")
+        self._chunk_shift = chunk_size.bit_length() - 1
+        self._chunk_mask = chunk_size - 1
+
         # Initialize dual chunk system
         self.dual_chunk_manager = DualChunkManager(
             render_chunk_size=world_config.chunk_size
@@ -44,9 +87,17 @@ class WorldManager:
         self.worker.start()
 
         # Non-blocking tile access system
-        self.tile_cache = {}  # (x, y) -> Tile
-        self.loading_chunks = set()  # Track requested chunks
-        self.ready_chunks = set()   # Track completed chunks
+        self.tile_cache = {}  # (chunk_x, chunk_y) -> uint8 tile id grid
+        self._chunk_access_counts = {}  # (chunk_x, chunk_y) -> decaying access count, for eviction
+        self._last_chunk_coords = None  # One-slot cache of the last chunk queried
+        self._last_chunk_tiles = None
+        # Shared read-only Tile per tile type (indexed by tile id), returned by get_tile
+        # instead of allocating a Tile for every lookup
+        self._tile_protos = tuple(Tile(0, 0, tile_type) for tile_type in TILE_TYPE_NAMES)
+        self._loading_tile = Tile(0, 0, "loading")
+        self.chunk_states: Dict[Tuple[int, int], ChunkState] = {}  # Requested and completed chunks
+        self._last_update_key = None  # (camera chunk, screen size) of the last update_chunks pass
+        self._spiral = SpiralChunkGenerator()  # Nearest-first chunk order around the camera
 
         # Basic statistics
         self.cache_hits = 0
@@ -54,6 +105,11 @@ class WorldManager:
         self.chunks_requested = 0
         self.chunks_received = 0
 
+        # Worker message handlers by message type; unlisted types are ignored
+        self._message_handlers = {
+            MessageType.CHUNK_RESPONSE: self._handle_chunk_response,
+        }
+
 
     
     def _setup_tier_manager(self):
@@ -85,86 +141,210 @@ class WorldManager:
         camera_chunk_x, camera_chunk_y = self.world_to_render_chunk(
             camera.cursor_x, camera.cursor_y)
 
+        # Nothing to request or unload until the camera enters another chunk or
+        # the screen is resized; chunks needed in between are requested by get_tile
+        update_key = (camera_chunk_x, camera_chunk_y, screen_width, screen_height)
+        if update_key == self._last_update_key:
+            return
+        self._last_update_key = update_key
+
         # Load immediate area (current screen)
         immediate_distance = max(screen_width // 64, screen_height // 64) + 1
 
         # Preload extended area (for smooth movement)
         preload_distance = immediate_distance + 2
 
-        # Request chunks in priority order
-        for distance in range(preload_distance + 1):
-            for dx in range(-distance, distance + 1):
-                for dy in range(-distance, distance + 1):
-                    if abs(dx) == distance or abs(dy) == distance:  # Only edge chunks
-                        chunk_x = camera_chunk_x + dx
-                        chunk_y = camera_chunk_y + dy
-
-                        if (chunk_x, chunk_y) not in self.loading_chunks and \
-                           (chunk_x, chunk_y) not in self.ready_chunks:
-                            from .messages import Priority
-                            priority = Priority.HIGH if distance <= immediate_distance else Priority.NORMAL
-                            self._request_chunk_async(chunk_x, chunk_y, priority)
-                            self.loading_chunks.add((chunk_x, chunk_y))
+        # Request chunks nearest first. The spiral is ordered ring by ring, so the
+        # immediate area is exactly its first (2 * immediate_distance + 1) ** 2 entries
+        high_priority_count = (2 * immediate_distance + 1) ** 2
+        # Consecutive chunks of the same priority are sent as one batch message
+        batch_size = self.config.chunk_request_batch_size
+        chunk_states = self.chunk_states
+        now = time.time()  # One timestamp for all requests of this update
+        batch = []
+        batch_priority = None
+        spiral = self._spiral.generate_spiral(camera_chunk_x, camera_chunk_y, preload_distance)
+        for index, chunk_coords in enumerate(spiral):
+            if chunk_coords in chunk_states:
+                continue
+            priority = Priority.HIGH if index < high_priority_count else Priority.NORMAL
+            if batch and (priority is not batch_priority or len(batch) == batch_size):
+                self._request_chunk_batch(batch, batch_priority, now)
+                batch = []
+            batch.append(chunk_coords)
+            batch_priority = priority
+            chunk_states[chunk_coords] = ChunkState.LOADING
+        if batch:
+            self._request_chunk_batch(batch, batch_priority, now)
 
         # Unload chunks that are too far away to prevent memory bloat
         self._unload_distant_chunks(camera_chunk_x, camera_chunk_y, preload_distance + 3)
 
     def get_tile(self, x: int, y: int) -> Tile:
-        """Non-blocking tile access - always returns immediately"""
-        # Check tile cache first
-        if (x, y) in self.tile_cache:
-            self.cache_hits += 1
-            return self.tile_cache[(x, y)]
-
-        # Check if chunk is ready
-        chunk_x, chunk_y = self.world_to_render_chunk(x, y)
-        if (chunk_x, chunk_y) in self.ready_chunks:
-            # Load chunk tiles into cache
-            self._cache_chunk_tiles(chunk_x, chunk_y)
+        """
+        Non-blocking tile access - always returns immediately.
+
+        The returned Tile is a shared instance per tile type; only its
+        tile_type is meaningful and it must not be modified.
+        """
+        shift = self._chunk_shift
+        chunk_coords = (x >> shift, y >> shift)
+
+        # Successive lookups almost always fall in the same chunk, so check the
+        # one-slot cache before probing the chunk dictionary
+        if chunk_coords == self._last_chunk_coords:
+            chunk_tiles = self._last_chunk_tiles
+        else:
+            chunk_tiles = self.tile_cache.get(chunk_coords)
+            if chunk_tiles is not None:
+                # Counted on slot changes only, not per tile
+                self._touch_chunk(chunk_coords)
+                self._last_chunk_coords = chunk_coords
+                self._last_chunk_tiles = chunk_tiles
+
+        if chunk_tiles is not None:
             self.cache_hits += 1
-            if (x, y) not in self.tile_cache:
-                raise RuntimeError(f"❌ Tile ({x}, {y}) not found in cache after loading chunk ({chunk_x}, {chunk_y})")
-            return self.tile_cache[(x, y)]
+            mask = self._chunk_mask
+            return self._tile_protos[chunk_tiles[y & mask, x & mask]]
 
         # Request chunk if not already loading
-        if (chunk_x, chunk_y) not in self.loading_chunks:
-            from .messages import Priority
-            self._request_chunk_async(chunk_x, chunk_y, Priority.NORMAL)
-            self.loading_chunks.add((chunk_x, chunk_y))
+        if chunk_coords not in self.chunk_states:
+            if self._request_chunk_async(chunk_coords[0], chunk_coords[1], Priority.NORMAL):
+                self.chunk_states[chunk_coords] = ChunkState.LOADING
 
         # Return placeholder immediately (legitimate for async loading)
         self.cache_misses += 1
-        return Tile(x, y, "loading")
-
-    def _cache_chunk_tiles(self, chunk_x: int, chunk_y: int):
-        """Load completed chunk tiles into cache"""
-        chunk_tiles = self.worker.get_chunk_tiles(chunk_x, chunk_y)
-        self.tile_cache.update(chunk_tiles)
-
-    def _request_chunk_async(self, chunk_x: int, chunk_y: int, priority):
-        """Request chunk generation asynchronously"""
-        self.worker.request_chunk(chunk_x, chunk_y, priority=priority)
+        return self._loading_tile
+
+    def get_tile_ids(self, min_x: int, min_y: int, width: int, height: int,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Non-blocking bulk tile access for a rectangle of the world.
+
+        Copies the overlapping part of each cached chunk with one slice
+        assignment, so the cost grows with the number of chunks covered
+        rather than the number of tiles. Missing chunks are requested like
+        in get_tile and their tiles are set to LOADING_TILE_ID.
+
+        Args:
+            min_x: World X coordinate of the left column
+            min_y: World Y coordinate of the top row
+            width: Number of columns
+            height: Number of rows
+            out: Optional uint8 array of shape (height, width) to fill, so a
+                caller fetching every frame can reuse its buffer
+
+        Returns:
+            uint8 tile id grid indexed [y - min_y, x - min_x]
+        """
+        if out is None:
+            out = np.empty((height, width), dtype=np.uint8)
+        shift = self._chunk_shift
+        mask = self._chunk_mask
+        tile_cache = self.tile_cache
+        max_x = min_x + width
+        max_y = min_y + height
+
+        for chunk_y in range(min_y >> shift, ((max_y - 1) >> shift) + 1):
+            top = max(chunk_y << shift, min_y)
+            bottom = min((chunk_y + 1) << shift, max_y)
+            rows = slice(top - min_y, bottom - min_y)
+            chunk_rows = slice(top & mask, ((bottom - 1) & mask) + 1)
+            for chunk_x in range(min_x >> shift, ((max_x - 1) >> shift) + 1):
+                left = max(chunk_x << shift, min_x)
+                right = min((chunk_x + 1) << shift, max_x)
+                columns = slice(left - min_x, right - min_x)
+                tile_count = (bottom - top) * (right - left)
+
+                chunk_coords = (chunk_x, chunk_y)
+                chunk_tiles = tile_cache.get(chunk_coords)
+                if chunk_tiles is not None:
+                    self._touch_chunk(chunk_coords)
+                    out[rows, columns] = chunk_tiles[chunk_rows, (left & mask):((right - 1) & mask) + 1]
+                    self.cache_hits += tile_count
+                    continue
+
+                if chunk_coords not in self.chunk_states:
+                    if self._request_chunk_async(chunk_x, chunk_y, Priority.NORMAL):
+                        self.chunk_states[chunk_coords] = ChunkState.LOADING
+                out[rows, columns] = LOADING_TILE_ID
+                self.cache_misses += tile_count
+
+        return out
+
+    def _store_chunk_tiles(self, chunk_coords: Tuple[int, int], chunk_tiles: np.ndarray):
+        """Add a chunk's tile id grid to the cache, evicting the least used chunks"""
+        tile_cache = self.tile_cache
+        access_counts = self._chunk_access_counts
+        if chunk_coords not in tile_cache:
+            # Only scan for a victim when over the limit; distant chunks are
+            # normally dropped earlier by _unload_distant_chunks
+            while tile_cache and len(tile_cache) >= self.config.chunk_cache_limit:
+                evicted_coords = min(access_counts, key=access_counts.get)
+                del tile_cache[evicted_coords]
+                del access_counts[evicted_coords]
+                # No longer ready here; requested again (and likely served from
+                # the worker's cache) the next time it is needed
+                self.chunk_states.pop(evicted_coords, None)
+                if evicted_coords == self._last_chunk_coords:
+                    self._last_chunk_coords = None
+                    self._last_chunk_tiles = None
+            access_counts[chunk_coords] = NEW_CHUNK_ACCESS_COUNT
+        tile_cache[chunk_coords] = chunk_tiles
+
+    def _drop_chunk_tiles(self, chunk_coords: Tuple[int, int]):
+        """Remove a chunk's tile id grid and access count from the cache"""
+        self.tile_cache.pop(chunk_coords, None)
+        self._chunk_access_counts.pop(chunk_coords, None)
+        if chunk_coords == self._last_chunk_coords:
+            self._last_chunk_coords = None
+            self._last_chunk_tiles = None
+
+    def _touch_chunk(self, chunk_coords: Tuple[int, int]):
+        """Count an access to a cached chunk, halving all counts when saturated"""
+        access_counts = self._chunk_access_counts
+        count = access_counts[chunk_coords] + 1
+        access_counts[chunk_coords] = count
+        if count >= CHUNK_ACCESS_COUNT_MAX:
+            for coords in access_counts:
+                access_counts[coords] >>= 1
+
+    def _request_chunk_async(self, chunk_x: int, chunk_y: int, priority) -> bool:
+        """Request chunk generation asynchronously. Returns False if the worker queue was full."""
+        if not self.worker.request_chunk(chunk_x, chunk_y, priority=priority):
+            return False
         self.chunks_requested += 1
+        return True
+
+    def _request_chunk_batch(self, chunks: list, priority, now: float) -> bool:
+        """Request generation of several chunks of one priority in a single message"""
+        if not self.worker.request_chunks(chunks, priority, now):
+            # Dropped with the worker queue full: forget the batch's LOADING states
+            # and rerun the next update so the chunks are requested again
+            for chunk_coords in chunks:
+                self.chunk_states.pop(chunk_coords, None)
+            self._last_update_key = None
+            return False
+        self.chunks_requested += len(chunks)
+        return True
 
     def _unload_distant_chunks(self, camera_chunk_x: int, camera_chunk_y: int, max_distance: int):
         """Unload chunks that are too far from camera to prevent memory bloat"""
         chunks_to_unload = []
 
         # Check ready chunks
-        for chunk_x, chunk_y in list(self.ready_chunks):
+        for (chunk_x, chunk_y), state in self.chunk_states.items():
+            if state is not ChunkState.READY:
+                continue
             distance = max(abs(chunk_x - camera_chunk_x), abs(chunk_y - camera_chunk_y))
             if distance > max_distance:
                 chunks_to_unload.append((chunk_x, chunk_y))
 
         # Unload distant chunks
-        for chunk_x, chunk_y in chunks_to_unload:
-            self.ready_chunks.discard((chunk_x, chunk_y))
+        for chunk_coords in chunks_to_unload:
+            del self.chunk_states[chunk_coords]
             # Remove tiles from tile cache for this chunk
-            chunk_bounds = self.get_render_chunk_bounds(chunk_x, chunk_y)
-            min_x, min_y, max_x, max_y = chunk_bounds
-            for y in range(min_y, max_y + 1):
-                for x in range(min_x, max_x + 1):
-                    self.tile_cache.pop((x, y), None)
+            self._drop_chunk_tiles(chunk_coords)
 
     def get_chunk_tiles(self, chunk_x: int, chunk_y: int) -> Dict[Tuple[int, int], Tile]:
         """Get all tiles in a chunk."""
@@ -182,6 +362,8 @@ class WorldManager:
         """Get information about the chunk containing the given world coordinates."""
         chunk_x, chunk_y = self.world_to_render_chunk(world_x, world_y)
         is_loaded = self.is_chunk_loaded(chunk_x, chunk_y)
+        if (chunk_x, chunk_y) in self.tile_cache:
+            self._touch_chunk((chunk_x, chunk_y))
 
         return {
             'chunk_x': chunk_x,
@@ -194,50 +376,46 @@ class WorldManager:
 
     def process_worker_messages(self):
         """Process completed chunks from worker - call this each frame"""
-        from .messages import MessageType
-
-        messages_processed = 0
-        while messages_processed < 10:  # Limit processing per frame to avoid blocking
-            message = self.message_bus.receive_from_worker(block=False)
-            if not message:
-                break
-
-            if message.message_type == MessageType.CHUNK_RESPONSE:
-                chunk_x, chunk_y = message.payload.chunk_x, message.payload.chunk_y
-                if message.payload.success:
-                    self.ready_chunks.add((chunk_x, chunk_y))
-                    self.chunks_received += 1
-                else:
-                    # Handle error case - chunk failed to generate
-                    pass
-                self.loading_chunks.discard((chunk_x, chunk_y))
-
-            elif message.message_type == MessageType.STATUS_UPDATE:
-                # Handle worker status updates if needed
-                pass
-
-            messages_processed += 1
+        handlers = self._message_handlers
+        # Limit processing per frame to avoid blocking
+        for message in self.message_bus.drain_to_main(10):
+            handler = handlers.get(message.message_type)
+            if handler is not None:
+                handler(message)
+
+    def _handle_chunk_response(self, message):
+        """Cache a generated chunk's tiles and mark it ready for tile access"""
+        response = message.payload
+        chunk_coords = (response.chunk_x, response.chunk_y)
+        if response.success:
+            self.chunk_states[chunk_coords] = ChunkState.READY
+            self._store_chunk_tiles(chunk_coords, response.chunk_data.aggregated_tiles)
+            self.chunks_received += 1
+        else:
+            # Forget failed chunks (and any stale grid) so they are requested again
+            self.chunk_states.pop(chunk_coords, None)
+            self._drop_chunk_tiles(chunk_coords)
 
     def request_chunks(self, chunk_coords: set, priority=None):
         """Request chunks to be loaded."""
         if priority is None:
-            from .messages import Priority
             priority = Priority.NORMAL
 
         for chunk_x, chunk_y in chunk_coords:
             if not self.is_chunk_loaded(chunk_x, chunk_y):
-                self._request_chunk_async(chunk_x, chunk_y, priority)
-                self.loading_chunks.add((chunk_x, chunk_y))
+                if self._request_chunk_async(chunk_x, chunk_y, priority):
+                    self.chunk_states[(chunk_x, chunk_y)] = ChunkState.LOADING
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get world manager statistics."""
         total_requests = self.cache_hits + self.cache_misses
         cache_hit_ratio = self.cache_hits / max(1, total_requests)
+        ready_count = sum(1 for state in self.chunk_states.values() if state is ChunkState.READY)
 
         return {
-            "available_chunks": len(self.ready_chunks),
+            "available_chunks": ready_count,
             "requested_chunks": self.chunks_requested,
-            "loading_chunks": len(self.loading_chunks),
+            "loading_chunks": len(self.chunk_states) - ready_count,
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "chunks_requested": self.chunks_requested,
@@ -245,7 +423,7 @@ class WorldManager:
             "cache_hit_ratio": cache_hit_ratio,
             "render_chunk_size": self.config.chunk_size,
             "generation_chunk_size": self.config.chunk_size,
-            "tile_cache_size": len(self.tile_cache),
+            "tile_cache_size": sum(chunk_tiles.size for chunk_tiles in self.tile_cache.values()),
             "predictive_loading": True,
             "memory_management": True
         }
@@ -270,10 +448,7 @@ class WorldManager:
 
     def world_to_render_chunk(self, world_x: int, world_y: int) -> Tuple[int, int]:
         """Convert world coordinates to render chunk coordinates."""
-        chunk_size = self.get_render_chunk_size()
-        chunk_x = world_x // chunk_size
-        chunk_y = world_y // chunk_size
-        return (chunk_x, chunk_y)
+        return (world_x >> self._chunk_shift, world_y >> self._chunk_shift)
 
     def get_render_chunk_bounds(self, chunk_x: int, chunk_y: int) -> Tuple[int, int, int, int]:
         """Get the world coordinate bounds of a render chunk."""
@@ -290,9 +465,10 @@ class WorldManager:
 
     def get_chunk_status(self, chunk_x: int, chunk_y: int) -> str:
         """Get the current status of a chunk for debugging"""
-        if (chunk_x, chunk_y) in self.ready_chunks:
+        state = self.chunk_states.get((chunk_x, chunk_y))
+        if state is ChunkState.READY:
             return "ready"
-        elif (chunk_x, chunk_y) in self.loading_chunks:
+        elif state is ChunkState.LOADING:
             return "loading"
         else:
             return "not_requested"
@@ -3,80 +3,125 @@
 Test script for the async architecture fix
 """
 
+import dataclasses
+import sys
+import time
+
+
+class MockCamera:
+    """Minimal camera stand-in exposing the cursor position."""
+
+    def __init__(self, x, y):
+        self.cursor_x = x
+        self.cursor_y = y
+
+
+def _process_messages(world_manager, rounds, delay):
+    """Pump worker messages to simulate frame processing."""
+    for _ in range(rounds):
+        world_manager.process_worker_messages()
+        time.sleep(delay)  # Give worker time to process
+
+
+def _step_imports(ctx):
+    from src.config import get_config
+    from src.world import WorldManager
+    ctx['get_config'] = get_config
+    ctx['WorldManager'] = WorldManager
+    return "Imports successful"
+
+
+def _step_config(ctx):
+    # WorldConfig is frozen, so derive the test config from the loaded one,
+    # keeping only the first pipeline layer for fast generation
+    world_config = ctx['get_config']().world
+    ctx['config'] = dataclasses.replace(
+        world_config,
+        pipeline_layers=["lands_and_seas"],
+        layer_configs={"lands_and_seas": world_config.layer_configs["lands_and_seas"]},
+    )
+    return "Configuration created"
+
+
+def _step_world_manager(ctx):
+    ctx['world_manager'] = ctx['WorldManager'](ctx['config'])
+    return "WorldManager created"
+
+
+def _step_first_tile(ctx):
+    # Should return 'loading' immediately
+    tile = ctx['world_manager'].get_tile(0, 0)
+    return f"First tile access: {tile.tile_type} (should be 'loading')"
+
+
+def _step_initial_stats(ctx):
+    stats = ctx['world_manager'].get_statistics()
+    return f"Initial stats: cache_misses={stats['cache_misses']}, loading_chunks={stats['loading_chunks']}"
+
+
+def _step_process_messages(ctx):
+    world_manager = ctx['world_manager']
+    _process_messages(world_manager, 5, 0.1)
+    stats = world_manager.get_statistics()
+    return f"After processing: available_chunks={stats['available_chunks']}, chunks_received={stats['chunks_received']}"
+
+
+def _step_second_tile(ctx):
+    # Might be a real tile now
+    tile = ctx['world_manager'].get_tile(0, 0)
+    return f"Second tile access: {tile.tile_type}"
+
+
+def _step_predictive_loading(ctx):
+    world_manager = ctx['world_manager']
+    world_manager.update_chunks(MockCamera(100, 100), screen_width=80, screen_height=50)
+    stats = world_manager.get_statistics()
+    return (f"After predictive update: loading_chunks={stats['loading_chunks']}, "
+            f"predictive_loading={stats.get('predictive_loading', False)}, "
+            f"memory_management={stats.get('memory_management', False)}")
+
+
+def _step_shutdown(ctx):
+    ctx['world_manager'].shutdown()
+    return "WorldManager shutdown successful"
+
+
+def _step_message_handling(ctx):
+    world_manager = ctx['world_manager']
+    _process_messages(world_manager, 10, 0.05)
+    stats = world_manager.get_statistics()
+    return (f"Final stats: available_chunks={stats['available_chunks']}, "
+            f"cache_hit_ratio={stats['cache_hit_ratio']:.2f}, "
+            f"tile_cache_size={stats['tile_cache_size']}")
+
+
+STEPS = [
+    ("imports", _step_imports),
+    ("config", _step_config),
+    ("world manager", _step_world_manager),
+    ("first tile access", _step_first_tile),
+    ("initial statistics", _step_initial_stats),
+    ("worker messages", _step_process_messages),
+    ("second tile access", _step_second_tile),
+    ("predictive chunk loading", _step_predictive_loading),
+    ("shutdown", _step_shutdown),
+    ("message handling after shutdown", _step_message_handling),
+]
+
+
 def test_non_blocking_tile_access():
     """Test the non-blocking tile access implementation"""
+    ctx = {}
     try:
-        # Test imports
-        from src.config import WorldConfig
-        from src.world import WorldManager
-        print("✅ Imports successful")
-
-        # Create configuration
-        config = WorldConfig()
-        config.pipeline_layers = ["lands_and_seas"]
-        config.layer_configs = {"lands_and_seas": {"land_ratio": 5, "algorithm": "cellular_automata"}}
-        print("✅ Configuration created")
-
-        # Create world manager
-        world_manager = WorldManager(config)
-        print("✅ WorldManager created")
-
-        # Test non-blocking tile access - should return 'loading' immediately
-        tile = world_manager.get_tile(0, 0)
-        print(f"✅ First tile access: {tile.tile_type} (should be 'loading')")
-
-        # Verify it's non-blocking by checking statistics
-        stats = world_manager.get_statistics()
-        print(f"✅ Initial stats: cache_misses={stats['cache_misses']}, loading_chunks={stats['loading_chunks']}")
-
-        # Process messages multiple times to simulate frame processing
-        import time
-        for i in range(5):
-            world_manager.process_worker_messages()
-            time.sleep(0.1)  # Give worker time to process
-
-        # Check if chunk became ready
-        stats = world_manager.get_statistics()
-        print(f"✅ After processing: available_chunks={stats['available_chunks']}, chunks_received={stats['chunks_received']}")
-
-        # Try accessing the tile again - might be real tile now
-        tile2 = world_manager.get_tile(0, 0)
-        print(f"✅ Second tile access: {tile2.tile_type}")
-
-        # Test predictive chunk loading
-        print("\n🔮 Testing predictive chunk loading...")
-
-        # Create a mock camera object
-        class MockCamera:
-            def __init__(self, x, y):
-                self.cursor_x = x
-                self.cursor_y = y
-
-        camera = MockCamera(100, 100)
-
-        # Test predictive loading
-        world_manager.update_chunks(camera, screen_width=80, screen_height=50)
-        stats_after_update = world_manager.get_statistics()
-        print(f"✅ After predictive update: loading_chunks={stats_after_update['loading_chunks']}")
-        print(f"✅ Predictive loading enabled: {stats_after_update.get('predictive_loading', False)}")
-        print(f"✅ Memory management enabled: {stats_after_update.get('memory_management', False)}")
-
-        # Cleanup
-        world_manager.shutdown()
-        print("✅ WorldManager shutdown successful")
-
-        # Test message handling
-        print("\n📨 Testing worker message handling...")
-
-        # Process messages multiple times to ensure proper communication
-        for i in range(10):
-            world_manager.process_worker_messages()
-            time.sleep(0.05)  # Small delay to allow worker processing
-
-        final_stats = world_manager.get_statistics()
-        print(f"✅ Final stats: available_chunks={final_stats['available_chunks']}")
-        print(f"✅ Cache hit ratio: {final_stats['cache_hit_ratio']:.2f}")
-        print(f"✅ Tile cache size: {final_stats['tile_cache_size']}")
+        for label, step in STEPS:
+            try:
+                detail = step(ctx)
+            except Exception as e:
+                print(f"❌ Test failed at step '{label}': {e}")
+                import traceback
+                traceback.print_exc()
+                return False
+            print(f"✅ {detail}")
 
         print("\n🎉 All tests passed! Complete async architecture is working:")
         print("  ✅ Non-blocking tile access")
@@ -85,12 +130,9 @@ def test_non_blocking_tile_access():
         print("  ✅ Worker message handling")
         print("  ✅ Memory management")
         return True
+    finally:
+        sys.stdout.flush()
 
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
 if __name__ == "__main__":
     test_non_blocking_tile_access()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the camera
+
+Unit tests for converting between world and screen coordinates.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import CameraConfig
+from src.engine.camera import Camera
+
+
+class TestViewTransform(unittest.TestCase):
+    """Test the per-frame view transform against the per-call conversions."""
+
+    def setUp(self):
+        self.camera = Camera(CameraConfig(initial_x=-7, initial_y=12, move_speed=1, fast_move_speed=5))
+
+    def test_view_matches_camera_conversions(self):
+        """The precomputed view converts coordinates like the camera methods."""
+        view = self.camera.make_view(81, 50)
+
+        self.assertEqual((view.min_x, view.min_y, view.max_x, view.max_y),
+                         self.camera.get_view_bounds(81, 50))
+        for world_x, world_y in [(-7, 12), (-47, -13), (33, 36), (100, -100)]:
+            screen = view.world_to_screen(world_x, world_y)
+            self.assertEqual(screen, self.camera.world_to_screen(world_x, world_y, 81, 50))
+            self.assertEqual(view.screen_to_world(*screen), (world_x, world_y))
+
+
+class TestCursorPosition(unittest.TestCase):
+    """Test the cached cursor position tuple."""
+
+    def test_position_reused_until_cursor_moves(self):
+        """The position tuple is shared between calls and refreshed by every move."""
+        camera = Camera(CameraConfig(initial_x=2, initial_y=3, move_speed=1, fast_move_speed=5))
+        position = camera.get_cursor_position()
+
+        self.assertIs(camera.get_cursor_position(), position)
+        camera.move_by(*camera.get_move_delta("left", fast_mode=True))
+        self.assertEqual(camera.get_cursor_position(), (-3, 3))
+        camera.set_cursor_position(10, -10)
+        self.assertEqual(camera.get_cursor_position(), (10, -10))
+
+
+class TestVisibility(unittest.TestCase):
+    """Test the on-screen check for world positions."""
+
+    def test_visibility_matches_screen_bounds(self):
+        """A position is visible exactly when its screen coordinates are on screen."""
+        camera = Camera(CameraConfig(initial_x=3, initial_y=-4, move_speed=1, fast_move_speed=5))
+
+        for screen_width, screen_height in [(80, 50), (7, 5)]:
+            for world_x in range(-60, 60):
+                for world_y in range(-40, 40):
+                    screen_x, screen_y = camera.world_to_screen(world_x, world_y, screen_width, screen_height)
+                    expected = 0 <= screen_x < screen_width and 0 <= screen_y < screen_height
+                    self.assertEqual(camera.is_position_visible(world_x, world_y, screen_width, screen_height),
+                                     expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the configuration system
+
+Unit tests for validating and parsing raw configuration data.
+"""
+
+import copy
+import dataclasses
+import shutil
+import tempfile
+import tomllib
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import ConfigLoader, validate_config_data
+
+
+class TestConfigValidation(unittest.TestCase):
+    """Test the required section and key checks on raw configuration data."""
+
+    def setUp(self):
+        config_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.toml')
+        with open(config_file, "rb") as f:
+            self.config_data = tomllib.load(f)
+
+    def test_complete_config_passes(self):
+        """The shipped configuration has every required key."""
+        validate_config_data(self.config_data)
+
+    def test_missing_section_named(self):
+        """A missing section is reported by name."""
+        del self.config_data['camera']
+
+        with self.assertRaisesRegex(KeyError, "'camera' section"):
+            validate_config_data(self.config_data)
+
+    def test_all_missing_keys_of_section_named(self):
+        """Every missing key of an incomplete section is reported at once."""
+        del self.config_data['window']['vsync']
+        del self.config_data['window']['initial_width']
+
+        with self.assertRaisesRegex(KeyError, "'window.initial_width', 'window.vsync'"):
+            validate_config_data(self.config_data)
+
+    def test_parse_validates_before_building(self):
+        """Parsing incomplete data fails with the validation error."""
+        config_data = copy.deepcopy(self.config_data)
+        del config_data['world']['chunk_request_batch_size']
+
+        with self.assertRaisesRegex(KeyError, "'world.chunk_request_batch_size'"):
+            ConfigLoader()._parse_config(config_data)
+
+    def test_config_is_frozen(self):
+        """Parsed config sections cannot be modified in place."""
+        config = ConfigLoader().get_config()
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.camera.move_speed = 3
+
+    def test_parse_without_strict_validation(self):
+        """With strict validation off, a missing key still fails while parsing."""
+        config_data = copy.deepcopy(self.config_data)
+        del config_data['camera']['move_speed']
+
+        with mock.patch('src.config.CONFIG_STRICT', False):
+            with self.assertRaisesRegex(KeyError, "move_speed"):
+                ConfigLoader()._parse_config(config_data)
+
+
+class TestConfigReload(unittest.TestCase):
+    """Test that reloading skips parsing when the file is unchanged."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, 'config.toml')
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.toml'), self.config_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_file_returns_parsed_config(self):
+        """Reloading an unchanged file returns the same config object."""
+        loader = ConfigLoader(self.config_file)
+        first = loader.get_config()
+
+        loader.reload_config()
+
+        self.assertIs(loader.get_config(), first)
+        self.assertIs(ConfigLoader(self.config_file).get_config(), first)
+
+    def test_modified_file_is_parsed_again(self):
+        """A new modification time makes the next load parse the file."""
+        loader = ConfigLoader(self.config_file)
+        first = loader.get_config()
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        loader.reload_config()
+
+        self.assertIsNot(loader.get_config(), first)
+        self.assertEqual(loader.get_config(), first)
+        # Colors are interned, so the reparsed config shares the same tuples
+        self.assertIs(loader.get_config().ui.panel_background, first.ui.panel_background)
+
+
+if __name__ == "__main__":
+    unittest.main()
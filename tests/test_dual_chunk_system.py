@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the dual chunk system
+
+Unit tests for aggregating generation chunk tile grids into render chunks.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.world.dual_chunk_system import DualChunkManager, GenerationChunk, TILE_TYPE_IDS
+
+
+class TestAggregateGenerationChunks(unittest.TestCase):
+    """Test building a render chunk's tile grid from generation chunks."""
+
+    def setUp(self):
+        self.manager = DualChunkManager(render_chunk_size=8)
+
+    def _generation_chunk(self, chunk_x, chunk_y, size, tiles):
+        return GenerationChunk(chunk_x=chunk_x, chunk_y=chunk_y, chunk_size=size,
+                               tiles=np.asarray(tiles, dtype=np.uint8), metadata={})
+
+    def test_generation_chunks_placed_by_world_position(self):
+        """Each generation chunk lands at its offset inside the render chunk."""
+        coords = self.manager.get_generation_chunks_for_render_chunk(-1, 2, 4)
+        # Mark each generation chunk with its own value to see where it ends up
+        chunks = [self._generation_chunk(gen_x, gen_y, 4, np.full((4, 4), index))
+                  for index, (gen_x, gen_y) in enumerate(coords)]
+
+        render_chunk = self.manager.aggregate_generation_chunks(chunks, -1, 2)
+
+        tiles = render_chunk.aggregated_tiles
+        self.assertEqual(tiles.shape, (8, 8))
+        for index, (gen_x, gen_y) in enumerate(coords):
+            local_x, local_y = gen_x * 4 + 8, gen_y * 4 - 16
+            self.assertTrue((tiles[local_y:local_y + 4, local_x:local_x + 4] == index).all())
+
+    def test_get_tile_decodes_tile_ids(self):
+        """Render chunk lookups return tile type names by world position."""
+        tiles = np.full((8, 8), TILE_TYPE_IDS["water"])
+        tiles[3, 5] = TILE_TYPE_IDS["land"]
+        render_chunk = self.manager.aggregate_generation_chunks([self._generation_chunk(-1, 2, 8, tiles)], -1, 2)
+
+        self.assertEqual(render_chunk.get_tile(-3, 19), "land")
+        self.assertEqual(render_chunk.get_tile(-8, 16), "water")
+        self.assertIsNone(render_chunk.get_tile(0, 16))
+
+    def test_generation_chunk_clipped_to_render_bounds(self):
+        """Only the overlapping part of a larger generation chunk is copied."""
+        tiles = np.arange(16 * 16).reshape(16, 16) % 2
+        chunk = self._generation_chunk(0, 0, 16, tiles)
+
+        render_chunk = self.manager.aggregate_generation_chunks([chunk], 1, 0)
+
+        np.testing.assert_array_equal(render_chunk.aggregated_tiles, tiles[0:8, 8:16])
+
+    def test_lazy_chunks_may_share_a_buffer(self):
+        """Chunks produced one at a time into one reused buffer aggregate correctly."""
+        coords = self.manager.get_generation_chunks_for_render_chunk(0, 0, 4)
+        scratch = np.empty((4, 4), dtype=np.uint8)
+
+        def produce():
+            for index, (gen_x, gen_y) in enumerate(coords):
+                scratch.fill(index)
+                yield self._generation_chunk(gen_x, gen_y, 4, scratch)
+
+        render_chunk = self.manager.aggregate_generation_chunks(produce(), 0, 0)
+
+        for index, (gen_x, gen_y) in enumerate(coords):
+            block = render_chunk.aggregated_tiles[gen_y * 4:gen_y * 4 + 4, gen_x * 4:gen_x * 4 + 4]
+            self.assertTrue((block == index).all())
+        self.assertEqual(render_chunk.metadata['generation_chunk_count'], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
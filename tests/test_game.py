@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the game loop
+
+Unit tests for when Game.render_frame redraws the console, driven directly
+without opening a window.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import tcod
+
+from src.engine.game import Game
+
+
+class TestRedrawSkipping(unittest.TestCase):
+    """Test which changes make render_frame redraw an unchanged view."""
+
+    def setUp(self):
+        self.game = Game()
+        # Stop the worker so no chunk arrives and changes the frame key mid-test
+        self.game.world_manager.shutdown()
+        self.console = tcod.console.Console(40, 20, order="F")
+        self.status_display = self.game.renderer.get_status_display()
+
+    def test_idle_view_is_not_redrawn(self):
+        """A frame with no changes keeps the last drawing."""
+        self.status_display.show_debug = False
+        self.assertTrue(self.game.render_frame(self.console, force_redraw=True))
+
+        self.status_display.fps = 60.0
+        self.assertFalse(self.game.render_frame(self.console))
+
+    def test_new_fps_sample_redraws_debug_panel(self):
+        """While the debug panel is shown, a new FPS sample triggers a redraw."""
+        self.status_display.show_debug = True
+        self.assertTrue(self.game.render_frame(self.console, force_redraw=True))
+        self.assertFalse(self.game.render_frame(self.console))
+
+        self.status_display.fps = 60.0
+        self.assertTrue(self.game.render_frame(self.console))
+        self.assertFalse(self.game.render_frame(self.console))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the input handler
+
+Unit tests for turning key events into camera movement.
+"""
+
+import shutil
+import tempfile
+import types
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import tcod
+
+from src.config import CameraConfig
+from src.engine.camera import Camera
+from src.engine.input import InputHandler
+
+
+class TestMovementCoalescing(unittest.TestCase):
+    """Test that movement keys are applied once per frame."""
+
+    def setUp(self):
+        self.camera = Camera(CameraConfig(initial_x=0, initial_y=0, move_speed=1, fast_move_speed=5))
+        self.input_handler = InputHandler(self.camera, config_file="missing_input.toml")
+
+    def _key(self, sym, mod=tcod.event.Modifier.NONE):
+        return types.SimpleNamespace(type="KEYDOWN", sym=sym, mod=mod)
+
+    def test_key_repeats_coalesce_into_one_move(self):
+        """Moves between frames are summed and applied in one cursor update."""
+        for event in [self._key(tcod.event.KeySym.D), self._key(tcod.event.KeySym.D),
+                      self._key(tcod.event.KeySym.W, tcod.event.Modifier.SHIFT)]:
+            self.assertFalse(self.input_handler.handle_event(event))
+        self.assertEqual(self.camera.get_cursor_position(), (0, 0))
+
+        self.input_handler.apply_pending_movement()
+        self.assertEqual(self.camera.get_cursor_position(), (2, -5))
+
+        # Nothing pending: the cached position is left untouched
+        position = self.camera.get_cursor_position()
+        self.input_handler.apply_pending_movement()
+        self.assertIs(self.camera.get_cursor_position(), position)
+
+
+
+class TestActionKeys(unittest.TestCase):
+    """Test the non-movement key bindings."""
+
+    def setUp(self):
+        self.camera = Camera(CameraConfig(initial_x=0, initial_y=0, move_speed=1, fast_move_speed=5))
+        self.input_handler = InputHandler(self.camera, config_file="missing_input.toml")
+
+    def _key(self, sym, mod=tcod.event.Modifier.NONE):
+        return types.SimpleNamespace(type="KEYDOWN", sym=sym, mod=mod)
+
+    def test_action_keys_run_their_callbacks(self):
+        """Game and debug keys run the callback registered for their action."""
+        calls = []
+        self.input_handler.set_regenerate_callback(lambda: calls.append("regenerate"))
+        self.input_handler.set_debug_callbacks(toggle_fps=lambda: calls.append("fps"))
+
+        for sym in [tcod.event.KeySym.R, tcod.event.KeySym.F4, tcod.event.KeySym.F1]:
+            self.assertFalse(self.input_handler.handle_event(self._key(sym)))
+
+        self.assertEqual(calls, ["regenerate", "fps"])
+
+    def test_exit_keys(self):
+        """Escape exits; Q exits only with Ctrl held."""
+        self.assertFalse(self.input_handler.handle_event(self._key(tcod.event.KeySym.Q)))
+        self.assertTrue(self.input_handler.handle_event(self._key(tcod.event.KeySym.Q, tcod.event.Modifier.CTRL)))
+        self.assertTrue(self.input_handler.handle_event(self._key(tcod.event.KeySym.ESCAPE)))
+
+
+
+class TestInputConfigCache(unittest.TestCase):
+    """Test that input configs are only parsed again when the file changes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, 'input.toml')
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'config', 'input.toml'), self.config_file)
+        self.camera = Camera(CameraConfig(initial_x=0, initial_y=0, move_speed=1, fast_move_speed=5))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_file_shares_parsed_config(self):
+        """Handlers loading an unchanged file share one parsed config."""
+        first = InputHandler(self.camera, config_file=self.config_file)
+        second = InputHandler(self.camera, config_file=self.config_file)
+
+        self.assertIs(second.config, first.config)
+
+    def test_modified_file_is_parsed_again(self):
+        """A new modification time makes the next handler parse the file."""
+        first = InputHandler(self.camera, config_file=self.config_file)
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = InputHandler(self.camera, config_file=self.config_file)
+
+        self.assertIsNot(second.config, first.config)
+        self.assertEqual(second.config, first.config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the message system
+
+Unit tests for message ordering and batched receiving on the message bus.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.world.messages import Message, MessageBus, MessageType, Priority
+
+
+class TestWorkerQueueOrder(unittest.TestCase):
+    """Test that the worker queue serves messages by priority."""
+
+    def setUp(self):
+        self.message_bus = MessageBus()
+
+    def _drain(self):
+        """Receive every queued message in the order the worker would."""
+        messages = []
+        while True:
+            message = self.message_bus.receive_from_main(block=False)
+            if message is None:
+                return messages
+            messages.append(message)
+
+    def test_shutdown_and_cancel_before_requests(self):
+        """Shutdown and cancel messages overtake pending chunk requests."""
+        self.message_bus.send_to_worker(Message.chunk_request(0, 0, Priority.URGENT))
+        self.message_bus.send_to_worker(Message.chunk_cancel(1, 1, "chunk_1_1"))
+        self.message_bus.send_to_worker(Message.shutdown())
+
+        message_types = [message.message_type for message in self._drain()]
+
+        self.assertEqual(message_types, [MessageType.SHUTDOWN, MessageType.CHUNK_CANCEL,
+                                         MessageType.CHUNK_REQUEST])
+
+    def test_requests_ordered_by_priority(self):
+        """Chunk requests are served from URGENT down to LOW."""
+        for chunk_x, priority in enumerate([Priority.LOW, Priority.NORMAL, Priority.URGENT, Priority.HIGH]):
+            self.message_bus.send_to_worker(Message.chunk_request(chunk_x, 0, priority))
+
+        priorities = [message.payload.priority for message in self._drain()]
+
+        self.assertEqual(priorities, [Priority.URGENT, Priority.HIGH, Priority.NORMAL, Priority.LOW])
+
+    def test_shared_timestamp_keeps_send_order(self):
+        """Requests sharing a priority and timestamp are served in send order."""
+        for chunk_x in range(5):
+            self.message_bus.send_to_worker(Message.chunk_request(chunk_x, 0, Priority.HIGH, now=1.0))
+
+        chunk_xs = [message.payload.chunk_x for message in self._drain()]
+
+        self.assertEqual(chunk_xs, [0, 1, 2, 3, 4])
+
+    def test_batch_request_uses_its_priority(self):
+        """A batch of requests is queued at the priority of its requests."""
+        self.message_bus.send_to_worker(Message.chunk_request(9, 9, Priority.NORMAL))
+        self.message_bus.send_to_worker(Message.chunk_request_batch([(0, 0), (1, 0)], Priority.HIGH))
+
+        first = self._drain()[0]
+
+        self.assertIs(first.message_type, MessageType.CHUNK_REQUEST_BATCH)
+        self.assertEqual([(r.chunk_x, r.chunk_y, r.priority) for r in first.payload.requests],
+                         [(0, 0, Priority.HIGH), (1, 0, Priority.HIGH)])
+
+    def test_send_reports_full_queue(self):
+        """A message that does not fit in the worker queue is reported as not sent."""
+        message_bus = MessageBus(max_queue_size=1)
+
+        self.assertTrue(message_bus.send_to_worker(Message.chunk_request(0, 0)))
+        self.assertFalse(message_bus.send_to_worker(Message.chunk_request(1, 0)))
+        self.assertEqual(message_bus.messages_sent, 1)
+
+    def test_request_id_defaults_to_chunk_coords(self):
+        """Frozen chunk requests still fill in their default request id."""
+        message = Message.chunk_request(3, -4)
+
+        self.assertEqual(message.payload.request_id, "chunk_3_-4")
+        with self.assertRaises(AttributeError):
+            message.payload.chunk_x = 0
+
+
+class TestDrainToMain(unittest.TestCase):
+    """Test batched receiving of worker messages on the main thread."""
+
+    def test_drain_is_bounded_and_ordered(self):
+        """A drain returns at most max_messages, oldest first."""
+        message_bus = MessageBus()
+        for count in range(5):
+            message_bus.send_to_main(Message.status_update(f"update {count}", "worker_1", 0, count, 0))
+
+        first = message_bus.drain_to_main(3)
+        rest = message_bus.drain_to_main(3)
+
+        self.assertEqual([m.payload.chunks_generated for m in first], [0, 1, 2])
+        self.assertEqual([m.payload.chunks_generated for m in rest], [3, 4])
+        self.assertEqual(message_bus.drain_to_main(3), [])
+        self.assertEqual(message_bus.messages_received, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for generation pipeline helpers
+
+Unit tests for the dense land grid used by the generation layers.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.world.pipeline import build_land_grid, count_neighbors
+
+
+MOORE = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class TestLandGrid(unittest.TestCase):
+    """Test the structure-of-arrays land grid helpers."""
+
+    def setUp(self):
+        self.chunks = {
+            (0, 0): {'land_type': 'land'},
+            (1, 0): {'land_type': 'water'},
+            (0, 1): {'land_type': 'land'},
+            (5, 5): {'land_type': 'land'},  # Outside bounds
+        }
+
+    def test_build_land_grid(self):
+        """Land and presence masks are indexed relative to the bounds."""
+        land, present = build_land_grid(self.chunks, (0, 0, 1, 1))
+
+        self.assertEqual(land.shape, (2, 2))
+        self.assertEqual(land.tolist(), [[True, True], [False, False]])
+        self.assertEqual(present.tolist(), [[True, True], [True, False]])
+
+    def test_count_neighbors_treats_out_of_bounds_as_empty(self):
+        """Neighbour counts only include cells inside the grid."""
+        land, _ = build_land_grid(self.chunks, (0, 0, 1, 1))
+        counts = count_neighbors(land, MOORE)
+
+        self.assertEqual(counts.tolist(), [[1, 1], [2, 2]])
+
+    def test_count_total_neighbors(self):
+        """Counting over a full mask gives the in-bounds neighbour count."""
+        land, _ = build_land_grid({}, (0, 0, 2, 2))
+        land[:] = True
+        counts = count_neighbors(land, MOORE)
+
+        self.assertEqual(counts[1, 1], 8)
+        self.assertEqual(counts[0, 0], 3)
+        self.assertEqual(counts[0, 1], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for spiral chunk generation
+
+Unit tests for the nearest-first chunk ordering used to request chunks and
+for the chunks gained and lost on movement.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.world.spiral_generator import ChunkLoadingManager, SpiralChunkGenerator, SPIRAL_RESULT_CACHE_SIZE
+
+
+class TestSpiralOrder(unittest.TestCase):
+    """Test the order and coverage of generated spirals."""
+
+    def setUp(self):
+        self.spiral_generator = SpiralChunkGenerator()
+
+    def test_spiral_covers_square_once(self):
+        """Every chunk within the radius appears exactly once."""
+        spiral = self.spiral_generator.generate_spiral(10, -3, 3)
+
+        expected = {(x, y) for x in range(7, 14) for y in range(-6, 1)}
+        self.assertEqual(len(spiral), len(expected))
+        self.assertEqual(set(spiral), expected)
+        self.assertEqual(spiral[0], (10, -3))
+
+    def test_spiral_ordered_by_layer_then_distance(self):
+        """Chunks come ring by ring, nearest first within each ring."""
+        spiral = self.spiral_generator.generate_spiral(0, 0, 4)
+
+        keys = [(max(abs(x), abs(y)), x * x + y * y) for x, y in spiral]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_recent_spirals_reused(self):
+        """Returning to a recent center reuses its spiral; old ones are evicted."""
+        first = self.spiral_generator.generate_spiral(0, 0, 2)
+        self.assertIs(self.spiral_generator.generate_spiral(0, 0, 2), first)
+
+        for center_x in range(1, SPIRAL_RESULT_CACHE_SIZE + 1):
+            self.spiral_generator.generate_spiral(center_x, 0, 2)
+
+        again = self.spiral_generator.generate_spiral(0, 0, 2)
+        self.assertIsNot(again, first)
+        self.assertEqual(again, first)
+
+
+class TestMovementDelta(unittest.TestCase):
+    """Test the chunks gained and lost when the center moves."""
+
+    def setUp(self):
+        self.spiral_generator = SpiralChunkGenerator()
+
+    def _square(self, center, radius):
+        return {(x, y) for x in range(center[0] - radius, center[0] + radius + 1)
+                for y in range(center[1] - radius, center[1] + radius + 1)}
+
+    def test_new_chunks_match_set_difference(self):
+        """New chunks are exactly the new square minus the old one, nearest first."""
+        for new_center in [(1, 0), (-1, 2), (3, -3), (20, 5)]:
+            new_chunks = self.spiral_generator.get_new_chunks_for_movement((0, 0), new_center, 2)
+
+            self.assertEqual(len(new_chunks), len(set(new_chunks)))
+            self.assertEqual(set(new_chunks), self._square(new_center, 2) - self._square((0, 0), 2))
+            distances = [(x - new_center[0]) ** 2 + (y - new_center[1]) ** 2 for x, y in new_chunks]
+            self.assertEqual(distances, sorted(distances))
+
+    def test_new_chunks_limit_keeps_closest(self):
+        """A limit returns the closest new chunks in the same order as the full list."""
+        all_chunks = self.spiral_generator.get_new_chunks_for_movement((0, 0), (2, 1), 4)
+        limited = self.spiral_generator.get_new_chunks_for_movement((0, 0), (2, 1), 4, limit=8)
+
+        distance = lambda chunk: (chunk[0] - 2) ** 2 + (chunk[1] - 1) ** 2
+        self.assertEqual(len(limited), 8)
+        self.assertEqual([distance(chunk) for chunk in limited],
+                         [distance(chunk) for chunk in all_chunks[:8]])
+        self.assertLessEqual(set(limited), set(all_chunks))
+
+    def test_chunks_to_unload_match_set_difference(self):
+        """Unloaded chunks are the old square minus the kept square."""
+        unload = self.spiral_generator.get_chunks_to_unload((0, 0), (4, 1), 3, 5)
+
+        self.assertEqual(len(unload), len(set(unload)))
+        self.assertEqual(set(unload), self._square((0, 0), 3) - self._square((4, 1), 5))
+
+
+class TestChunkLoadingManager(unittest.TestCase):
+    """Test the loaded chunk set kept while the center moves."""
+
+    def test_small_moves_unload_chunks_out_of_range(self):
+        """Chunks leave the loaded set once outside the unload radius, however the center got there."""
+        loading_manager = ChunkLoadingManager(load_radius=2, unload_radius=3)
+        loading_manager.get_initial_chunks((0, 0))
+
+        unloaded = []
+        for step in range(1, 7):
+            new_chunks, unload_chunks = loading_manager.update_for_position((step, 0))
+            unloaded.extend(unload_chunks)
+
+        self.assertTrue(all(x < 3 for x, _ in unloaded))
+        self.assertEqual({x for x, _ in unloaded}, {-2, -1, 0, 1, 2})
+        self.assertTrue(all(abs(x - 6) <= 3 and abs(y) <= 3 for x, y in loading_manager.loaded_chunks))
+        # The latest move loads only the column entering the load radius, closest first
+        self.assertEqual(new_chunks, [(8, 0), (8, -1), (8, 1), (8, -2), (8, 2)])
+
+
+class TestGenerationPriority(unittest.TestCase):
+    """Test distance-based generation priorities."""
+
+    def test_priority_orders_like_distance(self):
+        """Squared-distance priorities sort chunks the same as real distances."""
+        loading_manager = ChunkLoadingManager()
+        loading_manager.get_initial_chunks((2, -1))
+        chunks = [(x, y) for x in range(-3, 8) for y in range(-6, 5)]
+
+        by_priority = sorted(chunks, key=loading_manager.get_generation_priority)
+        by_distance = sorted(chunks, key=loading_manager.get_generation_distance)
+
+        self.assertEqual(by_priority, by_distance)
+        self.assertEqual(loading_manager.get_generation_priority((5, 3)), 25)
+        self.assertEqual(loading_manager.get_generation_distance((5, 3)), 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
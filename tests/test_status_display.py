@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the status display's FPS sampling
+
+Imports through the src package so the module's relative imports resolve.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ui.status_display import StatusDisplay, FPS_SAMPLE_FRAMES
+
+
+class TestFpsSampling(unittest.TestCase):
+    """Test the windowed FPS measurement."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.status = StatusDisplay()
+
+    def test_fps_sampled_every_window(self):
+        """FPS is only measured once per sample window of loop iterations."""
+        for _ in range(FPS_SAMPLE_FRAMES - 1):
+            self.status.tick_fps()
+        self.assertEqual(self.status.fps, 0.0)
+
+        self.status.tick_fps()
+        self.assertGreater(self.status.fps, 0.0)
+
+    def test_skipped_redraws_still_count_toward_fps(self):
+        """Drawn frames and FPS are counted separately, so idle loops keep FPS live."""
+        for _ in range(FPS_SAMPLE_FRAMES):
+            self.status.tick_fps()
+
+        self.assertGreater(self.status.fps, 0.0)
+        self.assertEqual(self.status.frame_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
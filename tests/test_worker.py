@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the world generation worker
+
+Unit tests for the worker's render chunk cache, driven directly without
+starting the worker thread.
+"""
+
+import dataclasses
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.config import get_config
+from src.world.dual_chunk_system import RenderChunk
+from src.world.messages import ChunkRequest, Message, MessageBus, MessageType, Priority
+from src.world.worker import STATUS_UPDATE_INTERVAL, WorldGenerationWorker
+
+
+class TestRenderChunkCache(unittest.TestCase):
+    """Test eviction from the worker's render chunk cache."""
+
+    def setUp(self):
+        config = dataclasses.replace(get_config().world, chunk_cache_limit=2)
+        self.worker = WorldGenerationWorker(config, MessageBus())
+
+    def _cache_chunk(self, chunk_x, chunk_y):
+        """Place a generated render chunk in the worker cache."""
+        self.worker.render_chunk_cache[(chunk_x, chunk_y)] = RenderChunk(
+            chunk_x=chunk_x, chunk_y=chunk_y, aggregated_tiles=np.zeros((4, 4), dtype=np.uint8),
+            metadata={}, chunk_size=4)
+        self.worker._enforce_cache_limit()
+
+    def test_cache_hit_protects_chunk_from_eviction(self):
+        """A chunk requested again is kept over one that was not revisited."""
+        self._cache_chunk(0, 0)
+        self._cache_chunk(1, 0)
+
+        self.worker._handle_chunk_request(ChunkRequest(0, 0))
+        self._cache_chunk(2, 0)
+
+        self.assertEqual(list(self.worker.render_chunk_cache), [(0, 0), (2, 0)])
+        self.assertEqual(self.worker.message_bus.drain_to_main()[0].payload.chunk_data.chunk_x, 0)
+
+
+class TestPendingRequests(unittest.TestCase):
+    """Test queuing and cancelling chunk requests before they are generated."""
+
+    def setUp(self):
+        self.worker = WorldGenerationWorker(get_config().world, MessageBus())
+        # Cached chunks answer requests without running the generation pipeline
+        for chunk_x in range(3):
+            self.worker.render_chunk_cache[(chunk_x, 0)] = RenderChunk(
+                chunk_x=chunk_x, chunk_y=0, aggregated_tiles=np.zeros((4, 4), dtype=np.uint8),
+                metadata={}, chunk_size=4)
+
+    def _run_pending(self):
+        """Handle every pending request and return the chunks answered."""
+        while self.worker._pending_requests:
+            self.worker._handle_next_pending_request()
+        return [message.payload.chunk_x for message in self.worker.message_bus.drain_to_main()]
+
+    def test_cancel_drops_pending_request(self):
+        """A cancelled request that has not been generated yet gets no response."""
+        self.worker._process_message(Message.chunk_request_batch([(0, 0), (1, 0), (2, 0)], Priority.HIGH))
+        self.worker._process_message(Message.chunk_cancel(1, 0, "chunk_1_0"))
+
+        self.assertEqual(self._run_pending(), [0, 2])
+        self.assertEqual(self.worker.cancelled_requests, set())
+        self.assertEqual(self.worker.requests_cancelled, 1)
+
+    def test_cancel_drops_every_queued_copy(self):
+        """A chunk requested twice is dropped entirely by one cancel."""
+        self.worker._process_message(Message.chunk_request(1, 0, Priority.HIGH))
+        self.worker._process_message(Message.chunk_request_batch([(0, 0), (1, 0)], Priority.HIGH))
+        self.worker._process_message(Message.chunk_cancel(1, 0, "chunk_1_0"))
+
+        self.assertEqual(self._run_pending(), [0])
+        self.assertEqual(self.worker.requests_cancelled, 2)
+        self.assertEqual(self.worker.cancelled_requests, set())
+        self.assertEqual(self.worker._pending_request_ids, {})
+
+    def test_cancel_after_one_copy_is_served(self):
+        """Serving one copy of a duplicated request keeps the other cancellable."""
+        self.worker._process_message(Message.chunk_request(1, 0, Priority.HIGH))
+        self.worker._process_message(Message.chunk_request(1, 0, Priority.HIGH))
+        self.worker._handle_next_pending_request()
+        self.worker._process_message(Message.chunk_cancel(1, 0, "chunk_1_0"))
+
+        self.assertEqual(self._run_pending(), [1])
+        self.assertEqual(self.worker.requests_cancelled, 1)
+
+    def test_request_after_cancel_is_served(self):
+        """Requesting a chunk again after cancelling it generates it."""
+        self.worker._process_message(Message.chunk_request(1, 0, Priority.HIGH))
+        self.worker._process_message(Message.chunk_cancel(1, 0, "chunk_1_0"))
+        self.worker._process_message(Message.chunk_request(1, 0, Priority.HIGH))
+
+        # The earlier queued entry is served as well, so only check the chunk is answered
+        self.assertEqual(set(self._run_pending()), {1})
+
+    def test_cancel_without_pending_request_is_not_kept(self):
+        """Cancels for chunks that are not pending leave nothing behind."""
+        self.worker._process_message(Message.chunk_cancel(5, 5, "chunk_5_5"))
+
+        self.assertEqual(self.worker.cancelled_requests, set())
+        self.assertEqual(self.worker.requests_cancelled, 0)
+
+
+
+class TestStatusUpdates(unittest.TestCase):
+    """Test how often the worker reports its status."""
+
+    def test_status_sent_once_per_interval_of_generated_chunks(self):
+        """Cache hits don't advance the count, so they never repeat an update."""
+        worker = WorldGenerationWorker(get_config().world, MessageBus())
+        worker._generate_render_chunk = lambda chunk_x, chunk_y: RenderChunk(
+            chunk_x=chunk_x, chunk_y=chunk_y, aggregated_tiles=np.zeros((4, 4), dtype=np.uint8),
+            metadata={}, chunk_size=4)
+
+        for chunk_x in range(STATUS_UPDATE_INTERVAL):
+            worker._handle_chunk_request(ChunkRequest(chunk_x, 0))
+        for _ in range(5):
+            worker._handle_chunk_request(ChunkRequest(0, 0))  # Cache hits
+
+        message_types = [message.message_type for message in worker.message_bus.drain_to_main(100)]
+        self.assertEqual(message_types.count(MessageType.STATUS_UPDATE), 1)
+        self.assertEqual(message_types.count(MessageType.CHUNK_RESPONSE), STATUS_UPDATE_INTERVAL + 5)
+
+if __name__ == "__main__":
+    unittest.main()
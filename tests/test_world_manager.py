@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Tests for the world manager
+
+Unit tests for the main-thread side of chunk loading: the per-chunk tile
+cache, the last-chunk lookup slot, chunk unloading and predictive loading.
+"""
+
+import dataclasses
+import types
+import unittest
+import sys
+import os
+
+# Add the project root to the path so the src package can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.config import get_config
+from src.world import WorldManager
+from src.world.world_manager import ChunkState, CHUNK_ACCESS_COUNT_MAX, GRID_TILE_TYPE_NAMES, LOADING_TILE_ID
+from src.world.dual_chunk_system import TILE_TYPE_IDS, RenderChunk
+from src.world.messages import Message, Priority
+
+
+class TestWorldManagerTileCache(unittest.TestCase):
+    """Test the per-chunk tile cache of WorldManager."""
+
+    def setUp(self):
+        self.world_manager = WorldManager(get_config().world)
+        self.chunk_size = self.world_manager.get_render_chunk_size()
+
+    def tearDown(self):
+        self.world_manager.shutdown()
+
+    def _chunk_tiles(self, chunk_x, chunk_y, tile_type="land"):
+        """Build the tile id grid of a fully generated chunk."""
+        return np.full((self.chunk_size, self.chunk_size), TILE_TYPE_IDS[tile_type], dtype=np.uint8)
+
+    def _load_chunk(self, chunk_x, chunk_y, tile_type="land"):
+        """Place a fully generated chunk in the manager's cache."""
+        self.world_manager.chunk_states[(chunk_x, chunk_y)] = ChunkState.READY
+        self.world_manager._store_chunk_tiles((chunk_x, chunk_y), self._chunk_tiles(chunk_x, chunk_y, tile_type))
+
+    def test_get_tile_from_loaded_chunk(self):
+        """Tiles of a cached chunk are returned without a placeholder."""
+        self._load_chunk(3, -2, "water")
+
+        tile = self.world_manager.get_tile(3 * self.chunk_size + 5, -2 * self.chunk_size + 7)
+
+        self.assertEqual(tile.tile_type, "water")
+        self.assertEqual(self.world_manager._last_chunk_coords, (3, -2))
+
+    def test_get_tile_negative_coordinates(self):
+        """Negative coordinates map into the chunk to their lower left."""
+        self._load_chunk(-1, -1, "water")
+
+        tile = self.world_manager.get_tile(-1, -self.chunk_size)
+
+        self.assertEqual(tile.tile_type, "water")
+        self.assertEqual(self.world_manager._last_chunk_coords, (-1, -1))
+
+    def test_get_tile_ids_matches_get_tile(self):
+        """Bulk lookups across chunk edges agree with single-tile lookups."""
+        rng = np.random.default_rng(0)
+        for chunk_x in (-1, 0):
+            for chunk_y in (-1, 0):
+                self.world_manager.chunk_states[(chunk_x, chunk_y)] = ChunkState.READY
+                self.world_manager._store_chunk_tiles(
+                    (chunk_x, chunk_y), rng.integers(0, 2, (self.chunk_size, self.chunk_size), dtype=np.uint8))
+
+        min_x, min_y, width, height = -self.chunk_size + 3, -5, self.chunk_size + 2, 9
+        tile_ids = self.world_manager.get_tile_ids(min_x, min_y, width, height)
+
+        self.assertEqual(tile_ids.shape, (height, width))
+        for row in range(height):
+            for column in range(width):
+                tile = self.world_manager.get_tile(min_x + column, min_y + row)
+                self.assertEqual(GRID_TILE_TYPE_NAMES[tile_ids[row, column]], tile.tile_type)
+
+    def test_get_tile_ids_requests_missing_chunks(self):
+        """Tiles of unloaded chunks are marked loading and their chunks requested."""
+        self._load_chunk(0, 0, "water")
+        requested = []
+        self.world_manager.worker.request_chunk = lambda chunk_x, chunk_y, priority: requested.append((chunk_x, chunk_y)) or True
+
+        tile_ids = self.world_manager.get_tile_ids(self.chunk_size - 2, 0, 4, 1)
+
+        water = TILE_TYPE_IDS["water"]
+        self.assertEqual(tile_ids.tolist(), [[water, water, LOADING_TILE_ID, LOADING_TILE_ID]])
+        self.assertEqual(requested, [(1, 0)])
+        self.assertIs(self.world_manager.chunk_states[(1, 0)], ChunkState.LOADING)
+
+    def test_chunk_size_must_be_power_of_two(self):
+        """A chunk size that cannot be shifted is rejected up front."""
+        config = dataclasses.replace(get_config().world, chunk_size=48)
+
+        with self.assertRaises(ValueError):
+            WorldManager(config)
+
+    def test_get_tile_shares_instances_per_type(self):
+        """Lookups of the same tile type return one shared Tile."""
+        self._load_chunk(0, 0, "land")
+
+        first = self.world_manager.get_tile(1, 1)
+        second = self.world_manager.get_tile(2, 3)
+
+        self.assertIs(first, second)
+        self.assertIs(self.world_manager.get_tile(-1, -1), self.world_manager.get_tile(-2, -2))
+        self.assertEqual(self.world_manager.get_tile(-1, -1).tile_type, "loading")
+
+    def test_chunk_response_caches_tiles(self):
+        """A successful response makes the chunk's tiles available immediately."""
+        render_chunk = RenderChunk(chunk_x=1, chunk_y=2, aggregated_tiles=self._chunk_tiles(1, 2, "water"),
+                                   metadata={}, chunk_size=self.chunk_size)
+        self.world_manager._handle_chunk_response(
+            Message.chunk_response(1, 2, render_chunk, "chunk_1_2", 0.0))
+
+        tile = self.world_manager.get_tile(self.chunk_size, 2 * self.chunk_size)
+
+        self.assertEqual(tile.tile_type, "water")
+        self.assertIs(self.world_manager.chunk_states[(1, 2)], ChunkState.READY)
+
+    def test_unload_drops_whole_chunk(self):
+        """Unloading removes the chunk's tiles and clears the lookup slot."""
+        self._load_chunk(10, 10)
+        self._load_chunk(0, 0)
+        self.world_manager.get_tile(10 * self.chunk_size, 10 * self.chunk_size)
+
+        self.world_manager._unload_distant_chunks(0, 0, max_distance=2)
+
+        self.assertNotIn((10, 10), self.world_manager.tile_cache)
+        self.assertNotIn((10, 10), self.world_manager.chunk_states)
+        self.assertIn((0, 0), self.world_manager.tile_cache)
+        self.assertIsNone(self.world_manager._last_chunk_coords)
+        self.assertEqual(self.world_manager.get_statistics()["tile_cache_size"],
+                         self.chunk_size * self.chunk_size)
+
+    def test_cache_limit_evicts_least_used(self):
+        """Chunks read more often survive eviction; the coldest chunk goes first."""
+        world_manager = self.world_manager
+        world_manager.config = dataclasses.replace(world_manager.config, chunk_cache_limit=2)
+        self._load_chunk(0, 0)
+        self._load_chunk(1, 0)
+
+        world_manager.get_tile(0, 0)
+        world_manager.get_tile(self.chunk_size, 0)
+        world_manager.get_tile(0, 0)  # Touch (0, 0) again so (1, 0) is least used
+        self._load_chunk(2, 0)
+
+        self.assertEqual(sorted(world_manager.tile_cache), [(0, 0), (2, 0)])
+        # The evicted chunk is forgotten so it is requested again when needed
+        self.assertNotIn((1, 0), world_manager.chunk_states)
+
+    def test_new_chunk_outlasts_decayed_chunk(self):
+        """A chunk that just arrived off-screen is not evicted ahead of a chunk gone cold."""
+        world_manager = self.world_manager
+        world_manager.config = dataclasses.replace(world_manager.config, chunk_cache_limit=2)
+        self._load_chunk(0, 0)
+        world_manager._chunk_access_counts[(0, 0)] = 40  # Left the view and decayed since
+        self._load_chunk(5, 5)  # Preloaded, never read yet
+
+        self._load_chunk(1, 0)
+
+        self.assertEqual(sorted(world_manager.tile_cache), [(1, 0), (5, 5)])
+
+    def test_failed_response_drops_cached_tiles(self):
+        """A failed regeneration drops the stale grid so eviction never sees a stateless chunk."""
+        world_manager = self.world_manager
+        world_manager.config = dataclasses.replace(world_manager.config, chunk_cache_limit=2)
+        self._load_chunk(0, 0)
+        self._load_chunk(1, 0)
+        world_manager.get_tile(0, 0)
+
+        world_manager._handle_chunk_response(
+            Message.chunk_response(0, 0, None, "chunk_0_0", 0.0, success=False))
+        self._load_chunk(2, 0)
+        self._load_chunk(3, 0)
+
+        self.assertNotIn((0, 0), world_manager.tile_cache)
+        self.assertNotIn((0, 0), world_manager._chunk_access_counts)
+        self.assertIsNone(world_manager._last_chunk_coords)
+        self.assertEqual(len(world_manager.tile_cache), 2)
+
+    def test_access_counts_decay_when_saturated(self):
+        """Counts are halved once one reaches the maximum so old hot chunks can age out."""
+        world_manager = self.world_manager
+        self._load_chunk(0, 0)
+        self._load_chunk(1, 0)
+        world_manager._chunk_access_counts[(0, 0)] = CHUNK_ACCESS_COUNT_MAX - 1
+        world_manager._chunk_access_counts[(1, 0)] = 40
+
+        world_manager._touch_chunk((0, 0))
+
+        self.assertEqual(world_manager._chunk_access_counts,
+                         {(0, 0): CHUNK_ACCESS_COUNT_MAX // 2, (1, 0): 20})
+
+
+class TestWorldManagerUpdateChunks(unittest.TestCase):
+    """Test predictive chunk loading around the camera."""
+
+    def setUp(self):
+        self.world_manager = WorldManager(get_config().world)
+        self.chunk_size = self.world_manager.get_render_chunk_size()
+
+    def tearDown(self):
+        self.world_manager.shutdown()
+
+    def test_stationary_camera_skips_update(self):
+        """Repeated updates within one chunk do not request chunks again."""
+        camera = types.SimpleNamespace(cursor_x=5, cursor_y=5)
+        self.world_manager.update_chunks(camera)
+        requested = self.world_manager.chunks_requested
+        self.world_manager.chunk_states.clear()  # Would otherwise be re-requested
+
+        camera.cursor_x = self.chunk_size - 1
+        self.world_manager.update_chunks(camera)
+        self.assertEqual(self.world_manager.chunks_requested, requested)
+
+        camera.cursor_x = self.chunk_size
+        self.world_manager.update_chunks(camera)
+        self.assertGreater(self.world_manager.chunks_requested, requested)
+
+    def test_immediate_area_requested_first_with_high_priority(self):
+        """Chunks inside the immediate ring are requested first at HIGH priority."""
+        batches = []
+        self.world_manager.worker.request_chunks = lambda chunks, priority, now=None: batches.append((list(chunks), priority)) or True
+
+        self.world_manager.update_chunks(types.SimpleNamespace(cursor_x=0, cursor_y=0),
+                                         screen_width=80, screen_height=50)
+
+        requests = [(coords, priority) for chunks, priority in batches for coords in chunks]
+        # 80x50 screen: immediate distance 2 (5x5 chunks), preload distance 4 (9x9 chunks)
+        self.assertEqual(len(requests), 81)
+        self.assertEqual(requests[0], ((0, 0), Priority.HIGH))
+        high = [coords for coords, priority in requests if priority is Priority.HIGH]
+        self.assertEqual(high, [coords for coords, _ in requests[:25]])
+        self.assertTrue(all(max(abs(x), abs(y)) <= 2 for x, y in high))
+        self.assertEqual(self.world_manager.chunks_requested, 81)
+
+    def test_dropped_batch_is_requested_again(self):
+        """Chunks whose batch did not fit in the worker queue are not left LOADING."""
+        sent = []
+        self.world_manager.worker.request_chunks = lambda chunks, priority, now=None: False
+        camera = types.SimpleNamespace(cursor_x=0, cursor_y=0)
+
+        self.world_manager.update_chunks(camera, screen_width=80, screen_height=50)
+
+        self.assertEqual(self.world_manager.chunk_states, {})
+        self.assertEqual(self.world_manager.chunks_requested, 0)
+
+        self.world_manager.worker.request_chunks = lambda chunks, priority, now=None: sent.extend(chunks) or True
+        self.world_manager.update_chunks(camera, screen_width=80, screen_height=50)
+
+        self.assertEqual(len(sent), 81)
+        self.assertEqual(len(self.world_manager.chunk_states), 81)
+
+    def test_dropped_single_request_is_not_marked_loading(self):
+        """A tile lookup whose request was dropped asks for the chunk again next time."""
+        self.world_manager.worker.request_chunk = lambda chunk_x, chunk_y, priority: False
+
+        self.world_manager.get_tile_ids(0, 0, 4, 4)
+
+        self.assertNotIn((0, 0), self.world_manager.chunk_states)
+
+    def test_requests_sent_in_bounded_same_priority_batches(self):
+        """Each batch holds one priority and at most the configured number of chunks."""
+        batches = []
+        self.world_manager.worker.request_chunks = lambda chunks, priority, now=None: batches.append((list(chunks), priority)) or True
+        batch_size = self.world_manager.config.chunk_request_batch_size
+
+        self.world_manager.update_chunks(types.SimpleNamespace(cursor_x=0, cursor_y=0),
+                                         screen_width=80, screen_height=50)
+
+        # 25 HIGH chunks then 56 NORMAL chunks, split at the batch size
+        expected_sizes = ([batch_size] * (25 // batch_size) + [25 % batch_size] +
+                          [batch_size] * (56 // batch_size) + [56 % batch_size])
+        self.assertEqual([len(chunks) for chunks, _ in batches], [n for n in expected_sizes if n])
+
+if __name__ == "__main__":
+    unittest.main()